@@ -0,0 +1,275 @@
+"""
+Benchmarks of generators, management commands and factories discovery
+against models of test application.
+
+Usage:
+    python bench/run.py [--quantity 100 --quantity 1000] [--output results.json]
+                        [--compare previous.json --max-regression 0.2]
+
+Results are written as json, so they can be compared between releases.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings')
+os.environ['FACTORY_GENERATOR_BENCH_MEDIA_ROOT'] = tempfile.mkdtemp(prefix='factory_generator_bench_')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.apps import apps as installed_apps  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import transaction  # noqa: E402
+import factory  # noqa: E402
+import factory.random  # noqa: E402
+
+from factory_generator import generators, utils  # noqa: E402
+from factory_generator.__version__ import __version__  # noqa: E402
+from factory_generator.encoders import DjangoFileJsonEncoder  # noqa: E402
+from factory_generator.writers import JsonArrayWriter  # noqa: E402
+from factory_generator.tests.testapp.factories import (  # noqa: E402
+    CityFactory, CompanyFactory, PersonFactory,
+)
+
+
+DEFAULT_QUANTITIES = [100, 1000]
+
+# Factories by depth of SubFactories.
+FACTORIES = [
+    (0, CityFactory),
+    (1, CompanyFactory),
+    (2, PersonFactory),
+]
+
+
+class Rollback(Exception):
+    pass
+
+
+def measure(func, quantity):
+    """
+    Return result of benchmark: time of func(), rows per second and peak memory.
+    Time and memory are measured by separate calls, because tracing of memory slows code down.
+    """
+    gc.collect()
+    start_time = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start_time
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'quantity': quantity,
+        'seconds': round(seconds, 6),
+        'rows_per_sec': round(quantity / seconds, 1) if seconds else None,
+        'peak_memory_kb': round(peak_memory / 1024, 1),
+    }
+
+
+def in_rollback(func):
+    """
+    Run func in transaction which is rolled back, so database doesn't grow between runs.
+    """
+    def wrapper():
+        try:
+            with transaction.atomic():
+                func()
+                raise Rollback()
+        except Rollback:
+            pass
+    return wrapper
+
+
+def write_to_devnull(factory_class, quantity):
+    with open(os.devnull, 'w') as stream:
+        with JsonArrayWriter(stream, cls=DjangoFileJsonEncoder) as writer:
+            for record in generators.iter_generate_to_json(factory_class, quantity=quantity):
+                writer.write(record)
+
+
+def call_command_quietly(*args, **kwargs):
+    with open(os.devnull, 'w') as stdout:
+        call_command(*args, stdout=stdout, **kwargs)
+
+
+def clear_discovery_cache():
+    utils.get_factories_index.cache_clear()
+
+
+def bench_generators(quantities):
+    cases = {
+        'generate_to_dict': lambda f, q: lambda: [generators.generate_to_dict(f) for i in range(q)],
+        'generate_to_json': lambda f, q: lambda: generators.generate_to_json(f, quantity=q),
+        'generate_to_json_stream': lambda f, q: lambda: write_to_devnull(f, q),
+        'generate_to_json_batched': lambda f, q: lambda: generators.generate_to_json(
+            f, quantity=q, batched=True
+        ),
+        'generate_to_db': lambda f, q: in_rollback(lambda: generators.generate_to_db(f, quantity=q)),
+        'generate_to_db_bulk': lambda f, q: in_rollback(
+            lambda: generators.generate_to_db(f, quantity=q, bulk=True)
+        ),
+        'generate_to_db_copy': lambda f, q: in_rollback(
+            lambda: generators.generate_to_db(f, quantity=q, loader=generators.COPY)
+        ),
+    }
+    for name, case in cases.items():
+        for depth, factory_class in FACTORIES:
+            for quantity in quantities:
+                result = measure(case(factory_class, quantity), quantity)
+                result.update({'benchmark': name, 'factory': factory_class.__name__, 'depth': depth})
+                yield result
+
+
+def bench_commands(quantities):
+    label = 'testapp.PersonFactory'
+    cases = {
+        'command_generate_to_json': lambda q: lambda: call_command(
+            'generate_to_json', label, quantity=q, output=os.devnull,
+        ),
+        'command_generate_to_db': lambda q: in_rollback(lambda: call_command_quietly(
+            'generate_to_db', label, quantity=q,
+        )),
+    }
+    for name, case in cases.items():
+        for quantity in quantities:
+            result = measure(case(quantity), quantity)
+            result.update({'benchmark': name, 'factory': 'PersonFactory', 'depth': 2})
+            yield result
+
+
+STARTUP_SCRIPT = '''
+import django
+django.setup()
+from factory_generator import utils
+utils.get_all_factories()
+'''
+
+
+def start_process():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path[:2]))
+    subprocess.run([sys.executable, '-c', STARTUP_SCRIPT], env=env, check=True)
+
+
+def bench_discovery():
+    app_count = len(installed_apps.get_app_configs())
+
+    start_time = time.perf_counter()
+    start_process()
+    seconds = time.perf_counter() - start_time
+    yield {
+        'quantity': app_count,
+        'seconds': round(seconds, 6),
+        'rows_per_sec': None,
+        'peak_memory_kb': None,
+        'benchmark': 'startup',
+        'factory': None,
+        'depth': None,
+    }
+
+    def cold():
+        clear_discovery_cache()
+        utils.get_all_factories()
+
+    for name, func in (('discovery_cold', cold), ('discovery_warm', utils.get_all_factories)):
+        result = measure(func, app_count)
+        result.update({'benchmark': name, 'factory': None, 'depth': None})
+        yield result
+
+
+def get_results(quantities):
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    factory.random.reseed_random(0)
+    results = []
+    for benchmarks in (bench_discovery(), bench_generators(quantities), bench_commands(quantities)):
+        for result in benchmarks:
+            print(
+                f"{result['benchmark']:<28} {str(result['factory']):<16} {result['quantity']:>8} "
+                f"{result['seconds']:>10.4f}s {str(result['rows_per_sec']):>12} rows/s "
+                f"{str(result['peak_memory_kb']):>10} KB",
+                file=sys.stderr,
+            )
+            results.append(result)
+    return results
+
+
+def get_key(result):
+    return result['benchmark'], result['factory'], result['quantity']
+
+
+def compare(results, previous, max_regression):
+    """
+    Print benchmarks which are slower than in previous results more than max_regression.
+    Return True if there are no regressions.
+    """
+    previous_results = {get_key(r): r for r in previous['results']}
+    success = True
+    for result in results:
+        previous_result = previous_results.get(get_key(result))
+        if not previous_result or not previous_result['seconds']:
+            continue
+        ratio = result['seconds'] / previous_result['seconds'] - 1
+        if ratio > max_regression:
+            success = False
+            print(f'Regression {get_key(result)}: {ratio:+.0%}', file=sys.stderr)
+    return success
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run benchmarks of django-factory-boy-generator.')
+    parser.add_argument('-q', '--quantity', type=int, action='append',
+                        help='Quantity of records, use multiple times to run benchmarks '
+                             'with several quantities.')
+    parser.add_argument('-o', '--output', help='Path to json file with results, stdout by default.')
+    parser.add_argument('--compare', help='Path to json file with previous results.')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='Allowed slowdown in comparison with previous results, 0.2 means 20%%.')
+    args = parser.parse_args()
+
+    try:
+        results = get_results(args.quantity or DEFAULT_QUANTITIES)
+    finally:
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+    report = {
+        'version': __version__,
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'factory_boy': factory.__version__,
+        'database': settings.DATABASES['default']['ENGINE'],
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fp:
+            previous = json.load(fp)
+        if not compare(results, previous, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
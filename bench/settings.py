@@ -0,0 +1,13 @@
+from factory_generator.tests.settings import *  # noqa
+
+import os
+
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+MEDIA_ROOT = os.environ['FACTORY_GENERATOR_BENCH_MEDIA_ROOT']
@@ -1,3 +1,10 @@
 FACTORIES_MODULE_NAME = 'factories'
 
-from factory_generator.generators import generate_to_dict, generate_to_json, generate_to_db
\ No newline at end of file
+from factory_generator.generators import (
+    generate_to_dict, generate_to_json, generate_to_db, agenerate_to_json, agenerate_to_db,
+)
+
+__all__ = [
+    'FACTORIES_MODULE_NAME',
+    'generate_to_dict', 'generate_to_json', 'generate_to_db', 'agenerate_to_json', 'agenerate_to_db',
+]
@@ -0,0 +1,66 @@
+import factory
+from factory.declarations import BaseDeclaration
+from typing import Dict, Iterable, List
+
+
+class Batched(BaseDeclaration):
+    """
+    Returns values generated in advance for a chunk of records, one value per record.
+    :param values: Values of records in order of building.
+    """
+    def __init__(self, values: List):
+        super().__init__()
+        self.values = iter(values)
+
+    def evaluate(self, instance, step, extra):
+        return next(self.values)
+
+
+def is_static(declaration: BaseDeclaration) -> bool:
+    """
+    Return True if arguments of declaration don't depend on other declarations of record.
+    """
+    return not any(isinstance(value, BaseDeclaration) for value in declaration._defaults.values())
+
+
+def get_faker_values(declaration: factory.Faker, size: int) -> List:
+    """
+    Return size values of Faker declaration, provider is looked up once.
+    """
+    kwargs = dict(declaration._defaults)
+    locale = kwargs.pop('locale', None)
+    provider = getattr(factory.Faker._get_faker(locale), declaration.provider)
+    return [provider(**kwargs) for i in range(size)]
+
+
+def peek_sequence(factory_class) -> int:
+    """
+    Return sequence number of the next record of factory without incrementing it.
+    """
+    factory_class._meta._initialize_counter()
+    return factory_class._meta._counter.seq
+
+
+def get_batched_overrides(factory_class, size: int, exclude: Iterable[str]=()) -> Dict[str, Batched]:
+    """
+    Return overrides of Faker and Sequence declarations of factory with values
+    generated for next size records at once.
+    Other declarations, e.g. LazyAttribute or SubFactory, are evaluated for every record as usual.
+    Overrides must be used to build exactly next size records of factory_class.
+    :param factory_class: Factory class which builds records.
+    :param size: Quantity of records.
+    :param exclude: Names of declarations which are overridden already.
+    """
+    overrides = {}
+    sequence = None
+    for name, declaration in factory_class._meta.declarations.items():
+        if name in exclude:
+            continue
+        if isinstance(declaration, factory.Faker) and is_static(declaration):
+            overrides[name] = Batched(get_faker_values(declaration, size))
+        elif type(declaration) is factory.Sequence:
+            # Subclasses, e.g. LazyAttributeSequence, depend on other declarations of record.
+            if sequence is None:
+                sequence = peek_sequence(factory_class)
+            overrides[name] = Batched([declaration.function(sequence + i) for i in range(size)])
+    return overrides
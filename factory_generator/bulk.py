@@ -0,0 +1,162 @@
+from django.db import connections, router
+from django.db.models import Model
+
+from typing import Dict, List
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Attribute of built instance with {many to many field name: primary keys of related objects}
+# which are attached after instance is saved.
+PENDING_M2M_ATTR = '_factory_generator_m2m'
+
+
+def can_return_pks(using: str) -> bool:
+    """
+    Return True if database backend sets primary keys of objects created by bulk_create.
+    """
+    features = connections[using].features
+    return any(
+        getattr(features, name, False)
+        for name in ('can_return_rows_from_bulk_insert', 'can_return_ids_from_bulk_insert')
+    )
+
+
+def get_parent_fields(model_class) -> List:
+    """
+    Return foreign key and one to one fields of model.
+    """
+    return [
+        field for field in model_class._meta.concrete_fields
+        if field.is_relation and (field.many_to_one or field.one_to_one)
+    ]
+
+
+def get_unsaved_parents(instances: List[Model], field) -> List[Model]:
+    """
+    Return unique unsaved objects referenced by field of instances.
+    :param instances: List of model instances.
+    :param field: Foreign key field of instances model.
+    """
+    parents = {}
+    for obj in instances:
+        parent = field.get_cached_value(obj, None)
+        if parent is not None and parent._state.adding:
+            parents[id(parent)] = parent
+    return list(parents.values())
+
+
+def reassign_parents(instances: List[Model], field, using: str):
+    """
+    Reassign saved parents referenced by field of instances to refresh values of foreign key columns.
+    Instances are bound to database of parents, so router allows relations.
+    """
+    for obj in instances:
+        parent = field.get_cached_value(obj, None)
+        if parent is not None:
+            obj._state.db = using
+            setattr(obj, field.name, parent)
+
+
+def has_pending_m2m(instances: List[Model]) -> bool:
+    """
+    Return True if related objects of many to many fields must be attached to instances after saving.
+    """
+    return any(PENDING_M2M_ATTR in obj.__dict__ for obj in instances)
+
+
+def pop_through_rows(instances: List[Model]) -> Dict:
+    """
+    Return dict of {through model: rows} which attach pending related objects to saved instances.
+    Pending related objects are removed from instances.
+    :param instances: List of saved instances of the same model.
+    """
+    rows = {}
+    for obj in instances:
+        for name, pks in obj.__dict__.pop(PENDING_M2M_ATTR, {}).items():
+            field = obj._meta.get_field(name)
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            rows.setdefault(through, []).extend(through(**{source: obj.pk, target: pk}) for pk in pks)
+    return rows
+
+
+def save_pending_m2m(instances: List[Model], batch_size: int=DEFAULT_BATCH_SIZE, using: str=None):
+    """
+    Attach pending related objects to saved instances with one bulk_create of every through model.
+    """
+    for through, rows in pop_through_rows(instances).items():
+        through._default_manager.using(using).bulk_create(rows, batch_size=batch_size)
+
+
+def bulk_save(instances: List[Model], batch_size: int=DEFAULT_BATCH_SIZE,
+              using: str=None, return_pks: bool=False) -> int:
+    """
+    Save built instances of one model using bulk_create.
+    Unsaved objects referenced by foreign keys are saved before, so parents of SubFactories
+    are created with one query per batch too.
+    Return quantity of created objects, including parents.
+    :param instances: List of unsaved instances of the same model.
+    :param batch_size: Quantity of objects created in one query.
+    :param using: Database alias.
+    :param return_pks: If True, instances must get primary keys after saving.
+    Related objects of many to many fields pending on instances are attached after saving.
+    """
+    if not instances:
+        return 0
+
+    model_class = type(instances[0])
+    using = using or router.db_for_write(model_class)
+    created = 0
+    pending_m2m = has_pending_m2m(instances)
+    return_pks = return_pks or pending_m2m
+
+    for field in get_parent_fields(model_class):
+        parents = get_unsaved_parents(instances, field)
+        if parents:
+            created += bulk_save(parents, batch_size=batch_size, using=using, return_pks=True)
+            reassign_parents(instances, field, using)
+
+    if model_class._meta.parents or (return_pks and not can_return_pks(using)):
+        # bulk_create doesn't support multi-table inheritance
+        # and some backends don't return primary keys.
+        for obj in instances:
+            obj.save(force_insert=True, using=using)
+    else:
+        model_class._default_manager.using(using).bulk_create(instances, batch_size=batch_size)
+    if pending_m2m:
+        save_pending_m2m(instances, batch_size=batch_size, using=using)
+    return created + len(instances)
+
+
+async def abulk_save(instances: List[Model], batch_size: int=DEFAULT_BATCH_SIZE,
+                     using: str=None, return_pks: bool=False) -> int:
+    """
+    The same as bulk_save, but objects are created with async ORM methods (abulk_create),
+    so event loop isnt blocked while they are written.
+    """
+    if not instances:
+        return 0
+
+    model_class = type(instances[0])
+    using = using or router.db_for_write(model_class)
+    created = 0
+    pending_m2m = has_pending_m2m(instances)
+    return_pks = return_pks or pending_m2m
+
+    for field in get_parent_fields(model_class):
+        parents = get_unsaved_parents(instances, field)
+        if parents:
+            created += await abulk_save(parents, batch_size=batch_size, using=using, return_pks=True)
+            reassign_parents(instances, field, using)
+
+    if model_class._meta.parents or (return_pks and not can_return_pks(using)):
+        for obj in instances:
+            await obj.asave(force_insert=True, using=using)
+    else:
+        await model_class._default_manager.using(using).abulk_create(instances, batch_size=batch_size)
+    if pending_m2m:
+        for through, rows in pop_through_rows(instances).items():
+            await through._default_manager.using(using).abulk_create(rows, batch_size=batch_size)
+    return created + len(instances)
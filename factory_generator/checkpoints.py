@@ -0,0 +1,52 @@
+import json
+import os
+from typing import Dict
+
+
+class Checkpoint:
+    """
+    Progress of generation stored in json file, so failed run can be continued where it stopped.
+    :param path: Path to checkpoint file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.data = self.load()
+
+    def load(self) -> Dict:
+        try:
+            with open(self.path, 'r') as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {'deleted': False, 'created': {}}
+
+    def save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as fp:
+            json.dump(self.data, fp)
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    @property
+    def deleted(self) -> bool:
+        """
+        True if records were already deleted by the run.
+        """
+        return self.data['deleted']
+
+    def set_deleted(self):
+        self.data['deleted'] = True
+        self.save()
+
+    def get_created(self, label: str) -> int:
+        """
+        Return quantity of records of factory created by the run.
+        :param label: Label of factory.
+        """
+        return self.data['created'].get(label, 0)
+
+    def set_created(self, label: str, quantity: int):
+        self.data['created'][label] = quantity
+        self.save()
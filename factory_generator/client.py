@@ -0,0 +1,124 @@
+import http.client
+import json
+import socket
+from typing import Dict, Iterator, List, Union
+from urllib.parse import urlencode
+
+from factory_generator import writers
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+
+class GenerateServerError(Exception):
+    """Error occurs when generate_server rejects request."""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over unix socket.
+    :param path: Path to unix socket.
+    """
+    def __init__(self, path: str, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class GenerateClient:
+    """
+    Client of generate_server command.
+    :param host: Host of server.
+    :param port: Port of server.
+    :param socket_path: Path to unix socket of server, host and port are ignored if it is specified.
+    :param timeout: Timeout of socket operations in seconds.
+    """
+    def __init__(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, socket_path: str=None,
+                 timeout: float=None):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def get_connection(self) -> http.client.HTTPConnection:
+        timeout = socket._GLOBAL_DEFAULT_TIMEOUT if self.timeout is None else self.timeout
+        if self.socket_path:
+            return UnixHTTPConnection(self.socket_path, timeout=timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def request(self, path: str) -> http.client.HTTPResponse:
+        """
+        Send GET request and return response.
+        Raise GenerateServerError if server rejects request.
+        """
+        connection = self.get_connection()
+        connection.request('GET', path)
+        response = connection.getresponse()
+        if response.status != 200:
+            body = response.read()
+            connection.close()
+            try:
+                message = json.loads(body)['error']
+            except (ValueError, KeyError):
+                message = body.decode(errors='replace')
+            raise GenerateServerError(message)
+        return response
+
+    def get_factories(self) -> List[str]:
+        """
+        Return labels of factories served by server.
+        """
+        with self.request('/factories') as response:
+            return json.loads(response.read())
+
+    def stream(self, labels: Union[str, List[str]], quantity: int=1, seed: int=None,
+               output_format: str=writers.JSONL, chunk_size: int=None) -> Iterator[bytes]:
+        """
+        Yield chunks of response body while server generates records.
+        :param labels: Label or list of labels in form "app_label.FactoryName" or "app_label".
+        :param quantity: Quantity of records of every factory.
+        :param seed: Seed of generation.
+        :param output_format: "json" or "jsonl".
+        :param chunk_size: Quantity of records seeded at once,
+            the same as --chunk-size of generate_to_json.
+        """
+        if isinstance(labels, str):
+            labels = [labels]
+        params = [('factory', label) for label in labels]
+        params += [('quantity', quantity), ('format', output_format)]
+        if seed is not None:
+            params.append(('seed', seed))
+        if chunk_size is not None:
+            params.append(('chunk_size', chunk_size))
+        with self.request(f'/generate?{urlencode(params)}') as response:
+            while True:
+                data = response.read1(65536)
+                if not data:
+                    break
+                yield data
+
+    def iter_generate(self, labels: Union[str, List[str]], quantity: int=1, seed: int=None,
+                      chunk_size: int=None) -> Iterator[Dict]:
+        """
+        Yield fixture records one by one while server generates them.
+        """
+        buffer = b''
+        for data in self.stream(labels, quantity=quantity, seed=seed, output_format=writers.JSONL,
+                                chunk_size=chunk_size):
+            buffer += data
+            *lines, buffer = buffer.split(b'\n')
+            for line in lines:
+                yield json.loads(line)
+
+    def generate(self, labels: Union[str, List[str]], quantity: int=1, seed: int=None,
+                 chunk_size: int=None) -> List[Dict]:
+        """
+        Return list of fixture records generated by server.
+        """
+        return list(self.iter_generate(labels, quantity=quantity, seed=seed, chunk_size=chunk_size))
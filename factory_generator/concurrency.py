@@ -0,0 +1,98 @@
+from django.db import connections
+
+from factory.django import DjangoModelFactory
+from contextlib import contextmanager
+from queue import Queue, Empty
+import threading
+import time
+from typing import Callable, Dict, List
+
+from factory_generator.databases import get_factories_tree
+
+
+def supports_concurrent_writes(using: str) -> bool:
+    """
+    Return True if records can be written into database by several connections at once.
+    SQLite locks whole database for writing.
+    """
+    return connections[using].vendor != 'sqlite'
+
+
+class LockedNext:
+    """
+    Replaces next method of factory_boy sequence counter,
+    so records built in different threads don't get the same sequence number.
+    """
+    def __init__(self, counter):
+        self.counter = counter
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            return type(self.counter).next(self.counter)
+
+
+@contextmanager
+def thread_safe_sequences(generate_factories: List[DjangoModelFactory]):
+    """
+    Make sequence counters of factories and their SubFactories thread safe while context is active.
+    :param generate_factories: List of factory classes.
+    """
+    counters = {}
+    for factory_class in get_factories_tree(generate_factories):
+        factory_class._meta._initialize_counter()
+        counter = factory_class._meta._counter
+        counters[id(counter)] = counter
+    try:
+        for counter in counters.values():
+            counter.next = LockedNext(counter)
+        yield
+    finally:
+        for counter in counters.values():
+            del counter.next
+
+
+def run_in_connections(tasks: List[Callable[[], int]], connections_count: int) -> List[Dict]:
+    """
+    Run tasks in connections_count threads, every thread uses its own database connections,
+    which are closed when thread finishes.
+    Task returns quantity of created rows.
+    If task fails, remaining tasks aren't started and error is raised.
+    Return stats of every connection: quantity of tasks and rows, seconds spent in tasks.
+    :param tasks: List of callables.
+    :param connections_count: Quantity of threads.
+    """
+    queue = Queue()
+    for task in tasks:
+        queue.put(task)
+    stats = [
+        {'connection': index + 1, 'tasks': 0, 'rows': 0, 'seconds': 0.0}
+        for index in range(connections_count)
+    ]
+    errors = []
+
+    def worker(connection_stats):
+        try:
+            while not errors:
+                try:
+                    task = queue.get_nowait()
+                except Empty:
+                    return
+                start_time = time.perf_counter()
+                rows = task()
+                connection_stats['seconds'] += time.perf_counter() - start_time
+                connection_stats['rows'] += rows
+                connection_stats['tasks'] += 1
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker, args=(connection_stats,)) for connection_stats in stats]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return stats
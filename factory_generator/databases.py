@@ -0,0 +1,70 @@
+from django.db import transaction
+
+from factory.declarations import RelatedFactory, SubFactory
+from factory.django import DjangoModelFactory
+from contextlib import contextmanager, ExitStack
+from typing import Iterable, List, Set
+
+
+def get_factories_tree(generate_factories: List[DjangoModelFactory]) -> Set[DjangoModelFactory]:
+    """
+    Return factories and all factories used by their SubFactory and RelatedFactory declarations.
+    :param generate_factories: List of factory classes.
+    """
+    factories = set()
+    pending = list(generate_factories)
+    while pending:
+        factory_class = pending.pop()
+        if factory_class in factories:
+            continue
+        factories.add(factory_class)
+        for declaration in factory_class._meta.declarations.values():
+            if isinstance(declaration, (SubFactory, RelatedFactory)):
+                pending.append(declaration.get_factory())
+    return factories
+
+
+def get_databases(generate_factories: List[DjangoModelFactory]) -> List[str]:
+    """
+    Return sorted aliases of databases where factories and factories of their SubFactories create records.
+    :param generate_factories: List of factory classes.
+    """
+    return sorted({
+        factory_class._meta.database for factory_class in get_factories_tree(generate_factories)
+        if issubclass(factory_class, DjangoModelFactory)
+    })
+
+
+@contextmanager
+def atomic(databases: Iterable[str]):
+    """
+    Run context in transaction of every database, so changes of all of them are rolled back on error.
+    :param databases: Database aliases.
+    """
+    with ExitStack() as stack:
+        for using in databases:
+            stack.enter_context(transaction.atomic(using=using))
+        yield
+
+
+@contextmanager
+def use_database(generate_factories: List[DjangoModelFactory], database: str=None):
+    """
+    Make factories and factories of their SubFactories create records in database while context is active.
+    Nothing is changed if database isnt specified.
+    :param generate_factories: List of factory classes.
+    :param database: Database alias.
+    """
+    if not database:
+        yield
+        return
+
+    factories = [f for f in get_factories_tree(generate_factories) if issubclass(f, DjangoModelFactory)]
+    databases = {factory_class: factory_class._meta.database for factory_class in factories}
+    try:
+        for factory_class in factories:
+            factory_class._meta.database = database
+        yield
+    finally:
+        for factory_class, factory_database in databases.items():
+            factory_class._meta.database = factory_database
@@ -0,0 +1,93 @@
+from django.core.files.base import ContentFile
+from django.db import models
+
+from factory import django as factory_django
+from factory.declarations import BaseDeclaration
+from factory.django import DjangoModelFactory
+import hashlib
+import os
+import posixpath
+from typing import Dict
+
+
+CACHE_DIR = 'factory_generator'
+
+
+class CachedFile(BaseDeclaration):
+    """
+    Wraps FileField or ImageField declaration of factory, so only size payloads are generated
+    and next records reuse them round robin.
+    Payloads are content-addressed: identical payloads are kept once.
+    If field is specified, every payload is saved into storage of field once
+    and records refer to saved file by name, so files aren't written for every record.
+    Otherwise records get File objects with cached payloads, e.g. to encode them to json.
+    :param declaration: FileField or ImageField declaration.
+    :param size: Quantity of generated payloads.
+    :param field: Model FileField which storage is used to save payloads.
+    """
+    def __init__(self, declaration: factory_django.FileField, size: int, field: models.FileField=None):
+        super().__init__()
+        self.declaration = declaration
+        self.size = size
+        self.field = field
+        self.files = []
+        self.stored = {}
+        self.index = 0
+
+    def evaluate_pre(self, instance, step, overrides):
+        if len(self.files) < self.size:
+            generated = self.declaration.evaluate_pre(instance, step, overrides)
+            self.files.append(self.cache(generated))
+        value = self.files[self.index % len(self.files)]
+        self.index += 1
+        return value
+
+    def cache(self, generated):
+        """
+        Return name of file saved into storage or File with payload of generated file.
+        """
+        generated.seek(0)
+        data = generated.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self.stored:
+            self.stored[digest] = self.store(digest, data, generated.name)
+        return self.stored[digest]
+
+    def store(self, digest: str, data: bytes, filename: str):
+        if self.field is None:
+            return ContentFile(data, name=filename)
+        name = self.get_storage_name(digest, filename)
+        storage = self.field.storage
+        if not storage.exists(name):
+            name = storage.save(name, ContentFile(data))
+        return name
+
+    def get_storage_name(self, digest: str, filename: str) -> str:
+        """
+        Return name of payload in storage: digest of payload with extension of generated file
+        in upload_to directory of field (or factory_generator directory if upload_to is callable).
+        """
+        filename = digest + os.path.splitext(filename)[1]
+        if callable(self.field.upload_to):
+            return self.field.storage.generate_filename(posixpath.join(CACHE_DIR, filename))
+        return self.field.generate_filename(None, filename)
+
+
+def get_file_overrides(factory_class: DjangoModelFactory, size: int,
+                       store: bool=True) -> Dict[str, CachedFile]:
+    """
+    Return overrides of FileField and ImageField declarations of factory which reuse pool of payloads.
+    :param factory_class: Factory class.
+    :param size: Quantity of generated payloads of every declaration.
+    :param store: If True, payloads are saved into storage of model fields.
+    """
+    if not size:
+        return {}
+    overrides = {}
+    for name, declaration in factory_class._meta.declarations.items():
+        if isinstance(declaration, factory_django.FileField):
+            field = None
+            if store:
+                field = factory_class._meta.model._meta.get_field(name)
+            overrides[name] = CachedFile(declaration, size, field=field)
+    return overrides
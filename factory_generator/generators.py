@@ -1,18 +1,78 @@
+import django
+
 import factory
 from factory.declarations import SubFactory
-from typing import Dict, List
+import asyncio
+from concurrent.futures import Executor
+from functools import lru_cache, partial
+from typing import AsyncIterator, Callable, Dict, Iterator, List
+
+from factory_generator.batching import get_batched_overrides
+from factory_generator.bulk import abulk_save, bulk_save, save_pending_m2m, DEFAULT_BATCH_SIZE
+from factory_generator.pgcopy import copy_save
+from factory_generator.relations import get_related_overrides, skip_postgeneration_save
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+ORM = 'orm'
+BULK = 'bulk'
+COPY = 'copy'
+LOADERS = (ORM, BULK, COPY)
+
+DEFAULT_QUEUE_SIZE = 2
+
+# Async generators use asgiref shipped with Django since 3.0,
+# agenerate_to_db uses QuerySet.abulk_create (Django 4.1) and Model.asave (Django 4.2).
+ASYNC_JSON_DJANGO_VERSION = (3, 0)
+ASYNC_DB_DJANGO_VERSION = (4, 2)
 
 
-def generate_to_dict(factory_class) -> Dict:
+@lru_cache(maxsize=None)
+def get_dict_factory(factory_class):
     """
-    Converting a factory’s output to a dict, including SubFactories
+    Return factory which builds dict from declarations of factory_class.
+    SubFactories are replaced with factories building dicts too.
+    Factory is created once for every factory class, so building a dict costs
+    only evaluating of declarations.
     """
     subs = {}
-    factory_data = factory_class.__dict__
-    for k in factory_data.keys():
-        if isinstance(factory_data[k], SubFactory):
-            subs[k] = generate_to_dict(factory_data[k].get_factory())
-    return factory.build(dict, FACTORY_CLASS=factory_class, **subs)
+    for name, declaration in factory_class._meta.declarations.items():
+        if isinstance(declaration, SubFactory):
+            subs[name] = factory.SubFactory(get_dict_factory(declaration.get_factory()))
+    return factory.make_factory(dict, FACTORY_CLASS=factory_class, **subs)
+
+
+def generate_to_dict(factory_class, **kwargs) -> Dict:
+    """
+    Converting a factory’s output to a dict, including SubFactories
+    Keyword arguments override declarations of factory.
+    """
+    return get_dict_factory(factory_class).build(**kwargs)
+
+
+def iter_generate_to_json(factory_class, quantity=1, batched=False, **kwargs) -> Iterator[Dict]:
+    """
+    Generate json data based on factory class.
+    Yield dictionaries with generated data one by one, so only one record is kept in memory.
+    Keyword arguments override declarations of factory.
+    If batched is True, values of Faker and Sequence declarations are generated
+    for chunks of DEFAULT_CHUNK_SIZE records at once.
+    RandomRelated declarations choose primary keys of existing related objects,
+    pools passed already filled in keyword arguments aren't queried again.
+    """
+    kwargs.update(get_related_overrides(factory_class, create=False, overrides=kwargs))
+    if not batched:
+        for i in range(quantity):
+            yield generate_to_dict(factory_class, **kwargs)
+        return
+
+    dict_factory = get_dict_factory(factory_class)
+    for start in range(0, quantity, DEFAULT_CHUNK_SIZE):
+        size = min(DEFAULT_CHUNK_SIZE, quantity - start)
+        overrides = get_batched_overrides(dict_factory, size, exclude=kwargs)
+        for i in range(size):
+            yield dict_factory.build(**overrides, **kwargs)
 
 
 def generate_to_json(factory_class, quantity=1, **kwargs) -> List[Dict]:
@@ -20,14 +80,167 @@ def generate_to_json(factory_class, quantity=1, **kwargs) -> List[Dict]:
     Generate json data based on factory class.
     Return list of dictionaries with generated data.
     """
-    json_data = []
-    for i in range(quantity):
-        json_data.append(generate_to_dict(factory_class))
-    return json_data
+    return list(iter_generate_to_json(factory_class, quantity=quantity, **kwargs))
 
 
-def generate_to_db(factory_class, quantity=1, **kwargs):
+def generate_to_db(factory_class, quantity=1, bulk=False, batch_size=DEFAULT_BATCH_SIZE, loader=None,
+                   batched=False, **kwargs):
     """
     Generate sample data and fill database.
+    Return list of created objects.
+    If bulk is True or loader is "bulk", instances are built by factory and saved with bulk_create
+    by chunks of batch_size, including parents of SubFactories.
+    If loader is "copy", instances are built and saved with COPY FROM STDIN on PostgreSQL
+    and with bulk_create on other databases.
+    In these cases return quantity of created objects, including parents.
+    If batched is True, values of Faker and Sequence declarations are generated
+    for chunks of batch_size records at once.
+    Pools of RandomRelated declarations are filled once and related objects are attached
+    with one bulk_create of through model per chunk, so created records aren't saved again after it.
     """
-    return factory_class.create_batch(quantity, **kwargs)
+    if loader is None:
+        loader = BULK if bulk else ORM
+    related_overrides = get_related_overrides(factory_class, bulk=loader != ORM, batch_size=batch_size,
+                                              overrides=kwargs)
+    kwargs.update(related_overrides)
+    with skip_postgeneration_save(factory_class):
+        if loader == ORM and not batched:
+            result = factory_class.create_batch(quantity, **kwargs)
+            if related_overrides:
+                save_pending_m2m(result, batch_size=batch_size, using=factory_class._meta.database)
+            return result
+
+        save = copy_save if loader == COPY else bulk_save
+        result = [] if loader == ORM else 0
+        for start in range(0, quantity, batch_size):
+            size = min(batch_size, quantity - start)
+            overrides = get_batched_overrides(factory_class, size, exclude=kwargs) if batched else {}
+            if loader == ORM:
+                created = factory_class.create_batch(size, **overrides, **kwargs)
+                if related_overrides:
+                    save_pending_m2m(created, batch_size=batch_size, using=factory_class._meta.database)
+                result += created
+            else:
+                instances = factory_class.build_batch(size, **overrides, **kwargs)
+                result += save(instances, batch_size=batch_size, using=factory_class._meta.database)
+        return result
+
+
+def check_async_support(min_version):
+    """
+    Raise RuntimeError if installed Django is older than min_version required by async generator.
+    """
+    if django.VERSION < min_version:
+        raise RuntimeError(
+            f"This coroutine requires Django {'.'.join(map(str, min_version))} or newer, "
+            f"installed Django is {django.get_version()}."
+        )
+
+
+async def aiter_built_chunks(build: Callable[[int], List], quantity: int, chunk_size: int,
+                             queue_size: int=DEFAULT_QUEUE_SIZE,
+                             executor: Executor=None) -> AsyncIterator[List]:
+    """
+    Build chunks of records in executor and yield them through bounded queue,
+    so next chunks are built while consumer processes previous chunk.
+    :param build: Function which builds list of size records.
+    :param quantity: Quantity of records.
+    :param chunk_size: Quantity of records of chunk.
+    :param queue_size: Maximum quantity of built chunks waiting for consumer.
+    :param executor: Executor where chunks are built, default executor of event loop if not specified.
+    """
+    loop = asyncio.get_event_loop()
+    queue = asyncio.Queue(maxsize=queue_size)
+
+    async def produce():
+        try:
+            for start in range(0, quantity, chunk_size):
+                size = min(chunk_size, quantity - start)
+                await queue.put(await loop.run_in_executor(executor, build, size))
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def aiter_generate_to_json(factory_class, quantity=1, batched=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                                 queue_size=DEFAULT_QUEUE_SIZE, executor=None,
+                                 **kwargs) -> AsyncIterator[Dict]:
+    """
+    The same as iter_generate_to_json, but records are built by chunks of chunk_size in executor,
+    so event loop isnt blocked while they are built. Requires Django 3.0 or newer.
+    """
+    check_async_support(ASYNC_JSON_DJANGO_VERSION)
+    from asgiref.sync import sync_to_async
+
+    # Pools are filled in thread of database connection, not in executor.
+    related_overrides = await sync_to_async(get_related_overrides)(factory_class, create=False,
+                                                                   overrides=kwargs)
+    kwargs.update(related_overrides)
+
+    def build(size):
+        return list(iter_generate_to_json(factory_class, quantity=size, batched=batched, **kwargs))
+
+    chunks = aiter_built_chunks(build, quantity, chunk_size, queue_size=queue_size, executor=executor)
+    try:
+        async for chunk in chunks:
+            for record in chunk:
+                yield record
+    finally:
+        await chunks.aclose()
+
+
+async def agenerate_to_json(factory_class, quantity=1, **kwargs) -> List[Dict]:
+    """
+    Generate json data based on factory class without blocking event loop.
+    Return list of dictionaries with generated data.
+    """
+    return [record async for record in aiter_generate_to_json(factory_class, quantity=quantity, **kwargs)]
+
+
+def build_instances(factory_class, size, batched=False, **kwargs) -> List:
+    """
+    Return list of size instances built by factory.
+    """
+    overrides = get_batched_overrides(factory_class, size, exclude=kwargs) if batched else {}
+    return factory_class.build_batch(size, **overrides, **kwargs)
+
+
+async def agenerate_to_db(factory_class, quantity=1, batch_size=DEFAULT_BATCH_SIZE, batched=False,
+                          queue_size=DEFAULT_QUEUE_SIZE, executor=None, **kwargs) -> int:
+    """
+    Generate sample data and fill database without blocking event loop.
+    Instances are built by chunks of batch_size in executor and saved with abulk_create
+    (including parents of SubFactories) while next chunks are built.
+    At most queue_size built chunks wait for saving, so memory usage doesn't depend on quantity.
+    Return quantity of created objects, including parents. Requires Django 4.2 or newer.
+    """
+    check_async_support(ASYNC_DB_DJANGO_VERSION)
+    from asgiref.sync import sync_to_async
+
+    related_overrides = await sync_to_async(get_related_overrides)(factory_class, bulk=True,
+                                                                   batch_size=batch_size, overrides=kwargs)
+    kwargs.update(related_overrides)
+    build = partial(build_instances, factory_class, batched=batched, **kwargs)
+    chunks = aiter_built_chunks(build, quantity, batch_size, queue_size=queue_size, executor=executor)
+    created = 0
+    try:
+        async for instances in chunks:
+            created += await abulk_save(instances, batch_size=batch_size,
+                                        using=factory_class._meta.database)
+    finally:
+        await chunks.aclose()
+    return created
@@ -0,0 +1,141 @@
+from django.apps import AppConfig
+
+from functools import lru_cache
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+from factory_generator import FACTORIES_MODULE_NAME
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+
+def get_file_signature(file_path: str) -> Optional[List]:
+    """
+    Return [path, mtime, size] of file or None if file doesnt exist.
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return [file_path, stat.st_mtime_ns, stat.st_size]
+
+
+def get_module_signature(app_config: AppConfig) -> Optional[List]:
+    """
+    Return [path, mtime, size] of factories module file of app or None if app doesnt have it.
+    :param app_config: Django application config object.
+    """
+    for file_name in (f'{FACTORIES_MODULE_NAME}.py', os.path.join(FACTORIES_MODULE_NAME, '__init__.py')):
+        signature = get_file_signature(os.path.join(app_config.path, file_name))
+        if signature is not None:
+            return signature
+    return None
+
+
+def get_sources_signatures(factories: Dict) -> List[List]:
+    """
+    Return signatures of source files of modules where factories are defined,
+    so factories re-exported by factories module from other modules are tracked too.
+    :param factories: Dict of {factory name: factory class} of app.
+    """
+    file_paths = set()
+    for factory_class in factories.values():
+        file_path = getattr(sys.modules.get(factory_class.__module__), '__file__', None)
+        if file_path:
+            file_paths.add(file_path)
+    return [get_file_signature(file_path) for file_path in sorted(file_paths)]
+
+
+@lru_cache(maxsize=None)
+def load_index(index_path: str) -> Dict:
+    """
+    Load index from file. Return empty index if file not found or has other version.
+    Index is loaded once, use load_index.cache_clear() to reload it.
+    :param index_path: Path to index file.
+    """
+    try:
+        with open(index_path, 'r') as fp:
+            index = json.load(fp)
+    except (FileNotFoundError, ValueError):
+        logger.debug(f'Factories index {index_path} not found or corrupted.')
+        return {'version': INDEX_VERSION, 'apps': {}}
+    if index.get('version') != INDEX_VERSION:
+        return {'version': INDEX_VERSION, 'apps': {}}
+    return index
+
+
+def save_index(index_path: str, index: Dict):
+    """
+    Write index into file.
+    :param index_path: Path to index file.
+    :param index: Index to write.
+    """
+    tmp_path = f'{index_path}.tmp'
+    with open(tmp_path, 'w') as fp:
+        json.dump(index, fp, indent=2, sort_keys=True)
+    os.replace(tmp_path, index_path)
+
+
+def make_app_entry(signature: Optional[List], factories: Dict) -> Dict:
+    """
+    Return index entry of app.
+    :param signature: Signature of factories module returned by get_module_signature.
+    :param factories: Dict of {factory name: factory class} of app.
+    """
+    return {
+        'signature': signature,
+        'sources': get_sources_signatures(factories),
+        'factories': {
+            name: {
+                'module': factory_class.__module__,
+                'qualname': factory_class.__qualname__,
+                'model': factory_class._meta.model._meta.label,
+            }
+            for name, factory_class in factories.items()
+        }
+    }
+
+
+def get_app_entry(index_path: str, app_config: AppConfig) -> Optional[Dict]:
+    """
+    Return index entry of app or None if app isnt indexed or its factories module
+    or source files of its factories were changed.
+    :param index_path: Path to index file.
+    :param app_config: Django application config object.
+    """
+    entry = load_index(index_path)['apps'].get(app_config.label)
+    if entry is None or entry['signature'] != get_module_signature(app_config):
+        return None
+    if any(get_file_signature(signature[0]) != signature for signature in entry['sources']):
+        return None
+    return entry
+
+
+def set_app_entry(index_path: str, app_config: AppConfig, factories: Dict):
+    """
+    Update index entry of app and write index into file.
+    :param index_path: Path to index file.
+    :param app_config: Django application config object.
+    :param factories: Dict of {factory name: factory class} of app.
+    """
+    index = load_index(index_path)
+    index['apps'][app_config.label] = make_app_entry(get_module_signature(app_config), factories)
+    save_index(index_path, index)
+
+
+def load_factory(factory_info: Dict):
+    """
+    Import module where factory is defined and return factory class.
+    :param factory_info: Factory info from index entry.
+    """
+    obj = importlib.import_module(factory_info['module'])
+    for name in factory_info['qualname'].split('.'):
+        obj = getattr(obj, name)
+    return obj
@@ -1,9 +1,12 @@
 from django.core.management.base import BaseCommand, CommandError
 
+import factory.random
 from factory.django import DjangoModelFactory
-from typing import List
+from contextlib import ExitStack
+from typing import Dict, List
 
-from factory_generator import utils, FACTORIES_MODULE_NAME
+from factory_generator import planning, utils, FACTORIES_MODULE_NAME
+from factory_generator.profiling import Profiler
 
 
 class BaseGenerateCommand(BaseCommand):
@@ -11,10 +14,38 @@ class BaseGenerateCommand(BaseCommand):
     Base class for generating commands.
     It defines getting options and parameters for generating.
     """
+    profiler = None
+
     def generate(self, generate_factories: List[DjangoModelFactory], 
                     update: bool=False, quantity: int=1, **kwargs):
         raise NotImplementedError('You should define method to generate.')
 
+    def get_generate_options(self, config: utils.Config) -> Dict:
+        """
+        Return command specific keyword arguments for generate method.
+        :param config: Configuration object.
+        """
+        return {}
+
+    def get_quantity(self, factory_class: DjangoModelFactory, quantity: int,
+                     quantities: Dict[DjangoModelFactory, int]=None) -> int:
+        """
+        Return quantity of records of factory planned in quantities or default quantity.
+        :param quantities: Dict of {factory class: quantity} planned from configuration file.
+        """
+        if not quantities:
+            return quantity
+        return quantities.get(factory_class, quantity)
+
+    def profile_factory(self, factory_class: DjangoModelFactory, quantity: int):
+        """
+        Return context manager which collects stats of generating records of factory,
+        if profiling is enabled.
+        """
+        if self.profiler is None:
+            return ExitStack()
+        return self.profiler.profile_factory(factory_class, quantity)
+
     def add_arguments(self, parser):
         parser.add_argument(
             'args', metavar='app_label[.FactoryName]', nargs='*',
@@ -42,6 +73,36 @@ class BaseGenerateCommand(BaseCommand):
             help='Path to configuration .ini file related of project base directory.',
         )
 
+        parser.add_argument(
+            '--file-pool', type=int,
+            help='Generate only specified quantity of payloads for every FileField and ImageField '
+                 'declaration and reuse them for next records.',
+        )
+
+        parser.add_argument(
+            '--batched', action='store_true',
+            help='If specified, values of Faker and Sequence declarations are generated for chunks '
+                 'of records at once instead of one record at a time.',
+        )
+
+        parser.add_argument(
+            '--seed', type=int,
+            help='Seed of random state of factory_boy and Faker. Random state is seeded for every factory '
+                 'and chunk of records, so the same seed generates the same records.',
+        )
+
+        parser.add_argument(
+            '--profile', action='store_true',
+            help='If specified, time, rows/sec and database queries of every factory and time of '
+                 'every declaration are printed to stderr.',
+        )
+
+        parser.add_argument(
+            '--profile-output', type=str,
+            help='Path to file where profiling stats are written: cProfile stats if path ends with .prof, '
+                 'otherwise json. Requires --profile.',
+        )
+
     def handle(self, *args, **options):
         if options['file']:
             config_path = utils.get_full_file_path(options['file'])
@@ -52,14 +113,35 @@ class BaseGenerateCommand(BaseCommand):
         else:
             config = utils.Config(
                 labels=args,
-                exclude=options['exclude'],
-                quantity=options['quantity'],
-                update=options['update'],
+                **{name: options[name] for name in utils.Config._fields if name in options}
             )
         
+        if config.seed is not None:
+            # Values of Faker instances called in factories modules are generated on import.
+            factory.random.reseed_random(config.seed)
+
         if not config.labels:
             generate_factories = utils.get_all_factories()
         else:
             generate_factories = utils.parse_factories_from_labels(config.labels, config.exclude)
 
-        return self.generate(generate_factories, update=config.update, quantity=config.quantity)
+        options = self.get_generate_options(config)
+        if config.factory_quantities:
+            # Quantities of factories which arent in configuration file are targets in top-up mode.
+            default_quantity = config.quantity if config.target is None else config.target
+            options['quantities'] = planning.get_quantities(
+                generate_factories, default_quantity, config.factory_quantities,
+            )
+
+        options.update(update=config.update, quantity=config.quantity)
+        if not config.profile:
+            return self.generate(generate_factories, **options)
+
+        use_cprofile = bool(config.profile_output and config.profile_output.endswith('.prof'))
+        self.profiler = Profiler(use_cprofile=use_cprofile)
+        with self.profiler.enable():
+            result = self.generate(generate_factories, **options)
+        self.stderr.write(self.profiler.format_summary())
+        if config.profile_output:
+            self.profiler.dump(config.profile_output)
+        return result
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+import os
+
+from factory_generator.client import DEFAULT_HOST, DEFAULT_PORT
+from factory_generator.server import FactoriesRegistry, GenerateServer, UnixGenerateServer
+
+
+class Command(BaseCommand):
+    help = 'Serve json records generated by factories over HTTP, so django and factories are loaded once'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--bind', default=f'{DEFAULT_HOST}:{DEFAULT_PORT}',
+            help='Address of server in form host:port.',
+        )
+
+        parser.add_argument(
+            '--socket', dest='socket_path',
+            help='Path to unix socket which is listened instead of TCP address.',
+        )
+
+        parser.add_argument(
+            '--verbose', action='store_true',
+            help='If specified, every request is logged to stderr.',
+        )
+
+    def get_server(self, bind: str, socket_path: str=None, verbose: bool=False):
+        """
+        Return server listening unix socket if socket_path is specified, otherwise TCP address.
+        """
+        registry = FactoriesRegistry()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            return UnixGenerateServer(socket_path, registry, verbose=verbose)
+
+        host, _, port = bind.rpartition(':')
+        try:
+            port = int(port)
+        except ValueError:
+            raise CommandError('Address specified incorrectly. Use form host:port.')
+        return GenerateServer((host or DEFAULT_HOST, port), registry, verbose=verbose)
+
+    def handle(self, *args, **options):
+        server = self.get_server(options['bind'], options['socket_path'], options['verbose'])
+        address = options['socket_path'] or '%s:%s' % server.server_address[:2]
+        self.stdout.write(f'Serving {len(server.registry.factories)} factories on {address}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if options['socket_path'] and os.path.exists(options['socket_path']):
+                os.remove(options['socket_path'])
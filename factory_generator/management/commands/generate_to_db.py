@@ -1,30 +1,552 @@
+from django.core.management.base import CommandError
 from django.db import transaction
+from django.db.models.signals import pre_save, post_save, m2m_changed
 
-from factory_generator.generators import generate_to_db
+from factory.django import mute_signals as mute_model_signals
+
+from factory_generator.bulk import DEFAULT_BATCH_SIZE
+from factory_generator.checkpoints import Checkpoint
+from factory_generator.concurrency import (
+    run_in_connections, supports_concurrent_writes, thread_safe_sequences,
+)
+from factory_generator.databases import atomic, get_databases, use_database
+from factory_generator.files import get_file_overrides
+from factory_generator.generators import generate_to_db, BULK, COPY, LOADERS, ORM
+from factory_generator import planning
+from factory_generator import pools as pools_utils
 from factory_generator import utils
 from factory_generator.management.base import BaseGenerateCommand
+from factory_generator.pgcopy import can_copy
+from factory_generator.seeding import get_chunks, get_sequence_offsets, seed_chunk
+from factory_generator.scheduler import get_dependency_levels, sort_factories
+from factory_generator.signals import post_generate
+from factory_generator.snapshots import (
+    Snapshot, get_file_models, get_non_empty_models, get_snapshot_key, get_snapshot_models,
+)
+from factory_generator.truncate import truncate_by_factories
+
+from contextlib import ExitStack
+from functools import partial
+import math
+import time
+
+
+MUTED_SIGNALS = (pre_save, post_save, m2m_changed)
 
 
 class Command(BaseGenerateCommand):
     help = 'Fill database using data generated by factories in django apps'
 
-    def generate(self, generate_factories, update=False, quantity=1):
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            '--bulk', action='store_true',
+            help='If specified, records will be built by factories and inserted with bulk_create.',
+        )
+
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help='Quantity of records inserted by one query in bulk mode.',
+        )
+
+        parser.add_argument(
+            '--loader', choices=LOADERS,
+            help='How records are inserted: "orm" saves every record, "bulk" is the same as --bulk, '
+                 '"copy" streams records with COPY FROM STDIN on PostgreSQL '
+                 '(bulk_create is used on other databases).',
+        )
+
+        parser.add_argument(
+            '--pool', action='append', default=[], dest='pools',
+            help='Reuse pool of parent records for relation instead of creating parent for each record. '
+                 'Use form app_label.FactoryName.field=size[:round_robin|random] '
+                 '(use multiple --pool to specify multiple relations).',
+        )
+
+        parser.add_argument(
+            '--commit-every', type=int,
+            help='Commit transaction after every specified quantity of records of factory '
+                 'instead of generating all records in one transaction.',
+        )
+
+        parser.add_argument(
+            '--checkpoint', type=str,
+            help='Path to file where progress is saved after every commit. '
+                 'If generation fails, run command with the same checkpoint to continue it. '
+                 'Requires --commit-every.',
+        )
+
+        parser.add_argument(
+            '--update-strategy', choices=utils.UPDATE_STRATEGIES, default=utils.DELETE,
+            help='How records are removed by --update: "delete" uses ORM delete with cascades and '
+                 'signals, "truncate" uses TRUNCATE ... CASCADE (DELETE FROM on other databases '
+                 'than PostgreSQL) and removes records of models referring to generated models too.',
+        )
+
+        parser.add_argument(
+            '--mute-signals', action='store_const', const=[utils.ALL_FACTORIES], default=[],
+            help='If specified, pre_save, post_save and m2m_changed signals are not sent while records '
+                 'are created. Receivers of factory_generator.signals.post_generate are called once '
+                 'for every factory instead.',
+        )
+
+        parser.add_argument(
+            '--target', type=int,
+            help='Target quantity of records of every model. Only records which are missing to reach it '
+                 'are created, existing records are kept. Quantities of factory sections of '
+                 'configuration file are targets too.',
+        )
+
+        parser.add_argument(
+            '--snapshot-dir',
+            help='Path to directory where records of generated models are cached. If factories and '
+                 'options didnt change since previous run, records are restored from cache instead of '
+                 'generating. Tables of generated models must be empty or emptied by --update.',
+        )
+
+        parser.add_argument(
+            '--database',
+            help='Alias of database where records are created instead of database of factories.',
+        )
+
+        parser.add_argument(
+            '--connections', type=int, default=1,
+            help='Quantity of database connections creating records concurrently. Records are created '
+                 'by chunks in threads, every chunk is committed in its own transaction.',
+        )
+
+    def get_generate_options(self, config):
+        return {
+            'target': config.target,
+            'database': config.database,
+            'connections': config.connections,
+            'snapshot_dir': config.snapshot_dir,
+            'bulk': config.bulk,
+            'batch_size': config.batch_size,
+            'loader': config.loader,
+            'file_pool': config.file_pool,
+            'batched': config.batched,
+            'seed': config.seed,
+            'pools': config.pools,
+            'commit_every': config.commit_every,
+            'checkpoint': config.checkpoint,
+            'update_strategy': config.update_strategy,
+            'mute_signals': config.mute_signals,
+        }
+
+    def generate(self, generate_factories, update=False, quantity=1, bulk=False,
+                 batch_size=DEFAULT_BATCH_SIZE, pools=[], commit_every=None, checkpoint=None,
+                 update_strategy=utils.DELETE, mute_signals=[], quantities=None, loader=None,
+                 file_pool=None, batched=False, seed=None, target=None, database=None, connections=1,
+                 snapshot_dir=None):
         """
-        Creates records in db for every factory class in generate_factories param 
+        Creates records in db for every factory class in generate_factories param
         with specified quantity.
+        Parents of relations specified in pools are created once and reused.
+        Factories are ordered by foreign keys of their models, so records of parent models
+        are created before records of child models and deleted after them.
+        All records are created in one transaction of every database of factories,
+        if commit_every is not specified.
+        Model signals are muted for factories which labels are in mute_signals.
+        Quantities of factories planned from configuration file override quantity.
+        Records are inserted by loader, "bulk" loader is used if bulk is True.
+        If file_pool is specified, records of every factory reuse file_pool files of every file field.
+        If batched is True, values of Faker and Sequence declarations are generated
+        by chunks of batch_size.
+        If database is specified, records are created in it instead of database of factories.
+        If connections is more than 1, records are created by chunks in threads
+        with own database connections.
+        If seed is specified, random state is seeded for every factory and chunk of commit_every records.
+        If target is specified, it is used instead of quantity as quantity of records of every model
+        in database and only missing records are created.
+        If snapshot_dir is specified, records of generated models are dumped into it after generating
+        and next run with the same factories and options restores them instead of generating.
+        Tables of generated models must be empty after records are deleted by update.
         """
-        with transaction.atomic():
-            if update:
+        if checkpoint and not commit_every:
+            raise CommandError('Checkpoint can be used only with --commit-every.')
+        if checkpoint and connections > 1:
+            raise CommandError('Checkpoint cannot be used with --connections.')
+        if checkpoint and target is not None:
+            raise CommandError('Checkpoint cannot be used with --target, rerun with --target creates '
+                               'only missing records.')
+        if target is not None and target < 0:
+            raise CommandError('Target cannot be negative.')
+        if seed is not None and connections > 1:
+            raise CommandError(
+                'Seed cannot be used with --connections, because threads share random state.'
+            )
+        if snapshot_dir and checkpoint:
+            raise CommandError('Snapshot cannot be used with --checkpoint, because continued run '
+                               'starts with records of previous run.')
+        if snapshot_dir and target is not None:
+            raise CommandError(
+                'Snapshot cannot be used with --target, because records depend on existing records.'
+            )
+        if update_strategy not in utils.UPDATE_STRATEGIES:
+            raise CommandError(f'Unknown update strategy: {update_strategy}')
+        if loader is None:
+            loader = BULK if bulk else ORM
+        if loader not in LOADERS:
+            raise CommandError(f'Unknown loader: {loader}')
+
+        factories_pools = pools_utils.parse_pools(pools)
+        generate_factories = sort_factories(generate_factories)
+        default_quantity = quantity if target is None else target
+        factories_quantities = {
+            factory_class: self.get_quantity(factory_class, default_quantity, quantities)
+            for factory_class in generate_factories
+        }
+        options = {
+            'loader': loader,
+            'batch_size': batch_size,
+            'pools': factories_pools,
+            'mute_signals': mute_signals,
+            'file_pool': file_pool,
+            'batched': batched,
+        }
+
+        with use_database(generate_factories, database):
+            snapshot = None
+            if snapshot_dir:
+                snapshot_key = get_snapshot_key(generate_factories, {
+                    'quantities': {
+                        utils.get_factory_label(factory_class): factory_quantity
+                        for factory_class, factory_quantity in factories_quantities.items()
+                    },
+                    'loader': loader,
+                    'pools': pools,
+                    'mute_signals': mute_signals,
+                    'file_pool': file_pool,
+                    'batched': batched,
+                    'seed': seed,
+                    'databases': get_databases(generate_factories),
+                })
+                snapshot = Snapshot(snapshot_dir, snapshot_key)
+
+            if loader == COPY:
+                databases = {factory_class._meta.database for factory_class in generate_factories}
+                for factory_database in sorted(databases):
+                    if not can_copy(factory_database):
+                        self.stderr.write(
+                            f'Database {factory_database} doesnt support COPY, '
+                            f'bulk_create is used instead.'
+                        )
+
+            if connections > 1:
+                databases = {factory_class._meta.database for factory_class in generate_factories}
+                if not all(supports_concurrent_writes(factory_database) for factory_database in databases):
+                    self.stderr.write(
+                        'Database doesnt support concurrent writes, one connection is used instead.'
+                    )
+                    connections = 1
+
+            if snapshot:
+                snapshot_models = get_snapshot_models(generate_factories)
+                if snapshot.exists(snapshot_models):
+                    self.restore_snapshot(snapshot, snapshot_models, generate_factories, update,
+                                          update_strategy)
+                    return
+
+            factories_databases = get_databases(generate_factories)
+            targets = planning.get_model_targets(factories_quantities) if target is not None else None
+            sequence_offsets = get_sequence_offsets(factories_quantities) if seed is not None else {}
+            if connections > 1:
+                if update:
+                    with atomic(factories_databases):
+                        self.delete(generate_factories, update_strategy)
+                if snapshot:
+                    self.check_snapshot_tables(snapshot_models)
+                self.generate_concurrently(factories_quantities, connections, commit_every=commit_every,
+                                           targets=targets, **options)
+            elif not commit_every:
+                with atomic(factories_databases):
+                    if update:
+                        self.delete(generate_factories, update_strategy)
+                    if snapshot:
+                        self.check_snapshot_tables(snapshot_models)
+                    for factory_class in generate_factories:
+                        self.generate_factory(
+                            factory_class, factories_quantities[factory_class], seed=seed, targets=targets,
+                            sequence_offsets=sequence_offsets.get(factory_class), **options
+                        )
+            else:
+                progress = Checkpoint(checkpoint) if checkpoint else None
+                if update and not (progress and progress.deleted):
+                    with atomic(factories_databases):
+                        self.delete(generate_factories, update_strategy)
+                    if progress:
+                        progress.set_deleted()
+                if snapshot:
+                    self.check_snapshot_tables(snapshot_models)
+
                 for factory_class in generate_factories:
-                    result = utils.delete_by_factory(factory_class)
-                    deleted_count = result[0]
-                    if deleted_count > 0:
-                        deleted_models = [str(m) for m in result[1].keys()]
-                        message = f"Deleted {result[0]} record(s) of {','.join(deleted_models)}"
-                        self.stdout.write(self.style.SUCCESS(message))
-
-            for factory_class in generate_factories:
-                generate_to_db(factory_class, quantity=quantity)
-                message = f'Successfully created {quantity} objects of model {factory_class._meta.model}'
+                    self.generate_factory(factory_class, factories_quantities[factory_class],
+                                          commit_every=commit_every, progress=progress, seed=seed,
+                                          targets=targets,
+                                          sequence_offsets=sequence_offsets.get(factory_class), **options)
+
+                if progress:
+                    progress.remove()
+
+            if snapshot:
+                snapshot.save(snapshot_models)
+                self.stdout.write(f'Snapshot {snapshot.key} is saved.')
+                file_models = get_file_models(snapshot_models)
+                if file_models:
+                    self.stderr.write(
+                        f"Files of {', '.join(file_models)} aren't stored in snapshot, only their names."
+                    )
+
+    def restore_snapshot(self, snapshot, snapshot_models, generate_factories, update=False,
+                         update_strategy=utils.DELETE):
+        """
+        Restore records of models from snapshot in one transaction of every database
+        instead of generating them.
+        """
+        start_time = time.perf_counter()
+        with atomic(snapshot_models):
+            if update:
+                self.delete(generate_factories, update_strategy)
+            self.check_snapshot_tables(snapshot_models)
+            snapshot.restore(snapshot_models)
+        elapsed = time.perf_counter() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully restored snapshot {snapshot.key} in {elapsed:.2f}s')
+        )
+
+    def check_snapshot_tables(self, snapshot_models):
+        """
+        Raise CommandError if tables of snapshot models have records, because snapshot has to contain
+        only generated records and it restores them with their primary keys.
+        """
+        non_empty_models = get_non_empty_models(snapshot_models)
+        if non_empty_models:
+            raise CommandError(
+                f"Snapshot requires empty tables of generated models, but {', '.join(non_empty_models)} "
+                f"have records. Use --update or generate factories of these models too."
+            )
+
+    def delete(self, generate_factories, update_strategy=utils.DELETE):
+        """
+        Delete records of every factory, factories of child models go first.
+        """
+        if update_strategy == utils.TRUNCATE:
+            for model_label, count in truncate_by_factories(generate_factories).items():
+                self.stdout.write(self.style.SUCCESS(f'Truncated {count} record(s) of {model_label}'))
+            return
+
+        for factory_class in reversed(generate_factories):
+            result = utils.delete_by_factory(factory_class)
+            deleted_count = result[0]
+            if deleted_count > 0:
+                deleted_models = [str(m) for m in result[1].keys()]
+                message = f"Deleted {result[0]} record(s) of {','.join(deleted_models)}"
                 self.stdout.write(self.style.SUCCESS(message))
-                
\ No newline at end of file
+
+    def generate_factory(self, factory_class, quantity, loader=ORM, batch_size=DEFAULT_BATCH_SIZE,
+                         pools={}, mute_signals=[], commit_every=None, progress=None, file_pool=None,
+                         batched=False, seed=None, targets=None, sequence_offsets=None):
+        """
+        Create records of factory, send post_generate signal and report rate of generation.
+        If commit_every is specified, every chunk of records is created in its own transaction
+        and saved in progress, records created by previous run with the same progress are skipped.
+        If seed is specified, random state is seeded before pools are filled and before every chunk,
+        so continued run creates the same records.
+        Sequences of factories of SubFactories start from sequence_offsets then.
+        If targets are specified, quantity is target of factory model, only missing records are created
+        and SubFactories of models with reached target reuse existing records.
+        Rate counts records of factory only, parents created by its SubFactories aren't counted.
+        """
+        if targets is not None:
+            quantity = planning.get_missing_quantity(factory_class, quantity)
+        label = utils.get_factory_label(factory_class)
+        created = progress.get_created(label) if progress else 0
+        if created >= quantity:
+            self.stdout.write(f'Records of model {factory_class._meta.model} were already created, skip.')
+            return
+
+        generated = quantity - created
+        start_time = time.perf_counter()
+        with ExitStack() as stack:
+            stack.enter_context(self.profile_factory(factory_class, generated))
+            if utils.ALL_FACTORIES in mute_signals or label in mute_signals:
+                stack.enter_context(mute_model_signals(*MUTED_SIGNALS))
+
+            if seed is not None:
+                seed_chunk(factory_class, seed, 0, sequence_offsets=sequence_offsets)
+            overrides = pools_utils.get_pool_overrides(
+                factory_class, pools.get(label, {}), bulk=loader != ORM, batch_size=batch_size,
+            )
+            if targets is not None:
+                overrides.update(
+                    planning.get_target_overrides(factory_class, targets, quantity, exclude=overrides)
+                )
+            overrides.update(get_file_overrides(factory_class, file_pool))
+            if not commit_every:
+                if seed is not None:
+                    seed_chunk(factory_class, seed, 0, sequence_offsets=sequence_offsets)
+                generate_to_db(factory_class, quantity=quantity, loader=loader, batch_size=batch_size,
+                               batched=batched, **overrides)
+            else:
+                while created < quantity:
+                    chunk_size = min(commit_every, quantity - created)
+                    if seed is not None:
+                        seed_chunk(factory_class, seed, created, sequence_offsets=sequence_offsets)
+                    with transaction.atomic(using=factory_class._meta.database):
+                        generate_to_db(factory_class, quantity=chunk_size, loader=loader,
+                                       batch_size=batch_size, batched=batched, **overrides)
+                    created += chunk_size
+                    if progress:
+                        progress.set_created(label, created)
+
+        post_generate.send(
+            sender=factory_class._meta.model, factory_class=factory_class, quantity=generated,
+            using=factory_class._meta.database,
+        )
+        elapsed = time.perf_counter() - start_time
+        rate = generated / elapsed if elapsed else generated
+        message = (
+            f'Successfully created {generated} objects of model {factory_class._meta.model} '
+            f'in {elapsed:.2f}s ({rate:.0f} objects/sec)'
+        )
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def generate_concurrently(self, factories_quantities, connections, loader=ORM,
+                              batch_size=DEFAULT_BATCH_SIZE, pools={}, mute_signals=[], commit_every=None,
+                              file_pool=None, batched=False, targets=None):
+        """
+        Create records of factories by chunks in connections threads, every thread uses
+        its own database connection and every chunk is created in its own transaction.
+        Factories of one level of dependencies are generated concurrently, next level starts
+        when previous one is finished. Model signals are muted globally, so factories with muted
+        signals are generated separately from other factories of level.
+        Chunk has commit_every records or quantity of factory is splitted between connections,
+        if commit_every isnt specified.
+        Rate of every factory and rows and throughput of every connection are reported.
+        :param factories_quantities: Dict of {factory class: quantity} in dependency order.
+        :param connections: Quantity of threads.
+        :param targets: Dict of {(model, database): target quantity}, if quantities are targets.
+        """
+        options = {
+            'loader': loader,
+            'batch_size': batch_size,
+            'pools': pools,
+            'commit_every': commit_every,
+            'file_pool': file_pool,
+            'batched': batched,
+            'targets': targets,
+        }
+        connections_stats = []
+        with thread_safe_sequences(list(factories_quantities)):
+            for level in get_dependency_levels(list(factories_quantities)):
+                mute_all = utils.ALL_FACTORIES in mute_signals
+                muted = [
+                    factory_class for factory_class in level
+                    if mute_all or utils.get_factory_label(factory_class) in mute_signals
+                ]
+                not_muted = [factory_class for factory_class in level if factory_class not in muted]
+                if muted:
+                    with mute_model_signals(*MUTED_SIGNALS):
+                        connections_stats.append(
+                            self.generate_level(muted, factories_quantities, connections, **options)
+                        )
+                if not_muted:
+                    connections_stats.append(
+                        self.generate_level(not_muted, factories_quantities, connections, **options)
+                    )
+
+        for index in range(connections):
+            tasks = sum(stats[index]['tasks'] for stats in connections_stats)
+            rows = sum(stats[index]['rows'] for stats in connections_stats)
+            seconds = sum(stats[index]['seconds'] for stats in connections_stats)
+            rate = rows / seconds if seconds else rows
+            self.stdout.write(
+                f'Connection {index + 1}: {rows} rows in {tasks} chunk(s), '
+                f'{seconds:.2f}s ({rate:.0f} rows/sec)'
+            )
+
+    def generate_level(self, level, factories_quantities, connections, loader=ORM,
+                       batch_size=DEFAULT_BATCH_SIZE, pools={}, commit_every=None, file_pool=None,
+                       batched=False, targets=None):
+        """
+        Create records of independent factories concurrently, send post_generate signal
+        and report rate of every factory.
+        If targets are specified, quantities are targets and only missing records are created.
+        Elapsed time of factory is time from start of its first chunk till end of its last chunk.
+        Return stats of connections.
+        """
+        if targets is not None:
+            factories_quantities = planning.get_missing_quantities(
+                {factory_class: factories_quantities[factory_class] for factory_class in level}
+            )
+        tasks = []
+        timings = {}
+        for factory_class in level:
+            factory_pools = pools.get(utils.get_factory_label(factory_class), {})
+            pools_records = {
+                field_path: pools_utils.fill_pool(
+                    pools_utils.get_related_factory(factory_class, field_path), pool.size,
+                    bulk=loader != ORM, batch_size=batch_size,
+                )
+                for field_path, pool in factory_pools.items()
+            }
+            quantity = factories_quantities[factory_class]
+            target_overrides = (
+                planning.get_target_overrides(factory_class, targets, quantity, exclude=factory_pools)
+                if targets is not None else {}
+            )
+            chunk_size = commit_every or max(1, math.ceil(quantity / connections))
+            timings[factory_class] = []
+            for start, size in get_chunks(quantity, chunk_size):
+                tasks.append(partial(
+                    self.generate_chunk, factory_class, size, loader=loader, batch_size=batch_size,
+                    pools=factory_pools, pools_records=pools_records, file_pool=file_pool,
+                    batched=batched, overrides=target_overrides, timings=timings[factory_class],
+                ))
+
+        stats = run_in_connections(tasks, connections)
+
+        for factory_class in level:
+            generated = factories_quantities[factory_class]
+            post_generate.send(
+                sender=factory_class._meta.model, factory_class=factory_class, quantity=generated,
+                using=factory_class._meta.database,
+            )
+            factory_timings = timings[factory_class]
+            elapsed = (
+                max(end for start, end in factory_timings) - min(start for start, end in factory_timings)
+                if factory_timings else 0.0
+            )
+            rate = generated / elapsed if elapsed else generated
+            message = (
+                f'Successfully created {generated} objects of model {factory_class._meta.model} '
+                f'in {elapsed:.2f}s ({rate:.0f} objects/sec)'
+            )
+            self.stdout.write(self.style.SUCCESS(message))
+        return stats
+
+    def generate_chunk(self, factory_class, quantity, loader=ORM, batch_size=DEFAULT_BATCH_SIZE,
+                       pools={}, pools_records={}, file_pool=None, batched=False, overrides={},
+                       timings=None) -> int:
+        """
+        Create chunk of records of factory in one transaction, it is called in thread of connection.
+        Return quantity of created records.
+        :param pools: Dict of {field: Pool} of factory.
+        :param pools_records: Dict of {field: records} of filled pools.
+        :param overrides: Other declarations passed into factory.
+        :param timings: List where (start, end) time of chunk is appended.
+        """
+        start_time = time.perf_counter()
+        overrides = dict(overrides, **{
+            field_path: pools_utils.get_pool_declaration(pools_records[field_path], pool)
+            for field_path, pool in pools.items()
+        })
+        overrides.update(get_file_overrides(factory_class, file_pool))
+        with transaction.atomic(using=factory_class._meta.database):
+            generate_to_db(factory_class, quantity=quantity, loader=loader, batch_size=batch_size,
+                           batched=batched, **overrides)
+        if timings is not None:
+            timings.append((start_time, time.perf_counter()))
+        return quantity
@@ -1,26 +1,124 @@
+from django.core.management.base import CommandError
+
 from factory_generator.encoders import DjangoFileJsonEncoder
+from factory_generator.files import get_file_overrides
 
-from factory_generator.generators import generate_to_json
+from factory_generator.generators import generate_to_json, iter_generate_to_json
 from factory_generator.management.base import BaseGenerateCommand
+from factory_generator.parallel import (
+    iter_parallel_generate_to_json, iter_seeded_generate_to_json, DEFAULT_CHUNK_SIZE,
+)
+from factory_generator.seeding import get_sequence_offsets
+from factory_generator import writers
 
+from io import StringIO
 import json
 
 
 class Command(BaseGenerateCommand):
     help = 'Generate json string using factories in django apps'
 
-    def generate(self, generate_factories, update=False, quantity=1, **kwargs):
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            '-o', '--output',
+            help='Path to file where records are written one by one instead of building whole json '
+                 'string. Use "-" to write records to stdout.',
+        )
+
+        parser.add_argument(
+            '-w', '--workers', type=int, default=1,
+            help='Quantity of processes generating records in parallel.',
+        )
+
+        parser.add_argument(
+            '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+            help='Quantity of records generated by worker process at once.',
+        )
+
+        parser.add_argument(
+            '--format', choices=list(writers.WRITERS), default=writers.JSON, dest='output_format',
+            help='Format of output: "json" is json array of fixtures, '
+                 '"jsonl" is one fixture record per line.',
+        )
+
+        parser.add_argument(
+            '--shard-size', type=int,
+            help='Split output into files of at most specified quantity of records, '
+                 'index of file is added to name of output. Requires --output.',
+        )
+
+        parser.add_argument(
+            '--compression', choices=writers.COMPRESSIONS,
+            help='Compress output file with gzip or zstd. Requires --output.',
+        )
+
+    def get_generate_options(self, config):
+        return {
+            'output': config.output,
+            'workers': config.workers,
+            'chunk_size': config.chunk_size,
+            'output_format': config.output_format,
+            'shard_size': config.shard_size,
+            'compression': config.compression,
+            'file_pool': config.file_pool,
+            'batched': config.batched,
+            'seed': config.seed,
+        }
+
+    def generate(self, generate_factories, update=False, quantity=1, output=None, workers=1,
+                 chunk_size=DEFAULT_CHUNK_SIZE, quantities=None, output_format=writers.JSON,
+                 shard_size=None, compression=None, file_pool=None, batched=False, seed=None, **kwargs):
         """
         Return json string contains models label and fiels as dict representation of factory class.
         For json serializing uses DjangoJSONEncoder as default, to specify encoder pass kwarg cls.
+        If output is specified, records are written into output file (or stdout if output is "-")
+        one by one and nothing is returned. Output can be splitted into shards of shard_size records
+        and compressed.
+        If workers is more than 1, records are generated in pool of processes by chunks of chunk_size.
+        Quantities of factories planned from configuration file override quantity.
+        Records are formatted as json array or json lines according to output_format.
+        If file_pool is specified, records of every factory reuse file_pool payloads of every file field.
+        If batched is True, values of Faker and Sequence declarations are generated by chunks.
+        If seed is specified, random state is seeded for every chunk of chunk_size records
+        of every factory, so records don't depend on workers.
         """
         if not kwargs.get('cls'):
             kwargs['cls'] = DjangoFileJsonEncoder
+        if output_format not in writers.WRITERS:
+            raise CommandError(f'Unknown format: {output_format}')
+        if (shard_size or compression) and (not output or output == '-'):
+            raise CommandError('Shards and compression can be used only with output file.')
+
+        options = {
+            'quantity': quantity,
+            'workers': workers,
+            'chunk_size': chunk_size,
+            'quantities': quantities,
+            'file_pool': file_pool,
+            'batched': batched,
+            'seed': seed,
+        }
+
+        if output:
+            return self.write(generate_factories, output, output_format=output_format,
+                              shard_size=shard_size, compression=compression, **options, **kwargs)
+
+        if workers > 1 or output_format != writers.JSON or seed is not None:
+            stream = StringIO()
+            with writers.WRITERS[output_format](stream, **kwargs) as writer:
+                self.write_records(generate_factories, writer, **options)
+            return stream.getvalue()
 
         result = []
         for factory_class in generate_factories:
             model_label = factory_class._meta.model._meta.label_lower
-            factories_data = generate_to_json(factory_class, quantity=quantity)
+            factory_quantity = self.get_quantity(factory_class, quantity, quantities)
+            overrides = get_file_overrides(factory_class, file_pool, store=False)
+            with self.profile_factory(factory_class, factory_quantity):
+                factories_data = generate_to_json(factory_class, quantity=factory_quantity,
+                                                  batched=batched, **overrides)
             for factory_data in factories_data:
                 result.append(
                     {
@@ -29,3 +127,83 @@ class Command(BaseGenerateCommand):
                     }
                 )
         return json.dumps(result, **kwargs)
+
+    def write(self, generate_factories, output, quantity=1, workers=1, chunk_size=DEFAULT_CHUNK_SIZE,
+              quantities=None, output_format=writers.JSON, shard_size=None, compression=None,
+              file_pool=None, batched=False, seed=None, **kwargs):
+        """
+        Write records of every factory into output file incrementally,
+        so memory usage doesn't depend on quantity.
+        :param output: Path to output file or "-" to write into stdout.
+        :param shard_size: Maximum quantity of records in one file.
+        :param compression: "gzip", "zstd" or None.
+        """
+        options = {
+            'quantity': quantity,
+            'workers': workers,
+            'chunk_size': chunk_size,
+            'quantities': quantities,
+            'file_pool': file_pool,
+            'batched': batched,
+            'seed': seed,
+        }
+        writer_class = writers.WRITERS[output_format]
+
+        if shard_size:
+            with writers.ShardedWriter(output, writer_class, shard_size=shard_size,
+                                       compression=compression, **kwargs) as writer:
+                self.write_records(generate_factories, writer, **options)
+            return
+
+        if output == '-':
+            self.stdout.ending = None
+            stream = self.stdout
+        else:
+            stream = writers.open_output(output, compression)
+
+        try:
+            with writer_class(stream, **kwargs) as writer:
+                self.write_records(generate_factories, writer, **options)
+        finally:
+            if stream is self.stdout:
+                if output_format == writers.JSON:
+                    stream.write('\n')
+            else:
+                stream.close()
+
+    def write_records(self, generate_factories, writer, quantity=1, workers=1,
+                      chunk_size=DEFAULT_CHUNK_SIZE, quantities=None, file_pool=None,
+                      batched=False, seed=None):
+        """
+        Write records of every factory with writer.
+        :param writer: Opened writer, e.g. writers.JsonArrayWriter.
+        """
+        factories_quantities = {
+            factory_class: self.get_quantity(factory_class, quantity, quantities)
+            for factory_class in generate_factories
+        }
+        sequence_offsets = get_sequence_offsets(factories_quantities)
+        for factory_class, factory_quantity in factories_quantities.items():
+            with self.profile_factory(factory_class, factory_quantity):
+                if workers > 1:
+                    encoded_records = iter_parallel_generate_to_json(
+                        factory_class, quantity=factory_quantity, workers=workers, chunk_size=chunk_size,
+                        seed=seed, file_pool=file_pool, batched=batched,
+                        sequence_offsets=sequence_offsets[factory_class], **writer.encoder_kwargs
+                    )
+                    for encoded_record in encoded_records:
+                        writer.write_encoded(encoded_record)
+                else:
+                    model_label = factory_class._meta.model._meta.label_lower
+                    if seed is not None:
+                        factories_data = iter_seeded_generate_to_json(
+                            factory_class, quantity=factory_quantity, chunk_size=chunk_size, seed=seed,
+                            file_pool=file_pool, batched=batched,
+                            sequence_offsets=sequence_offsets[factory_class],
+                        )
+                    else:
+                        overrides = get_file_overrides(factory_class, file_pool, store=False)
+                        factories_data = iter_generate_to_json(factory_class, quantity=factory_quantity,
+                                                               batched=batched, **overrides)
+                    for factory_data in factories_data:
+                        writer.write({'model': model_label, 'fields': factory_data})
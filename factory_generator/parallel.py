@@ -0,0 +1,130 @@
+from django.apps import apps as installed_apps
+
+import factory.random
+from factory.django import DjangoModelFactory
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from typing import Dict, Iterator, List
+
+from factory_generator.files import get_file_overrides
+from factory_generator.generators import iter_generate_to_json, DEFAULT_CHUNK_SIZE
+from factory_generator.relations import get_related_overrides
+from factory_generator.seeding import get_chunks, seed_chunk
+
+
+def init_worker():
+    """
+    Set up django in worker process if it was started without fork.
+    """
+    if not installed_apps.ready:
+        import django
+        django.setup()
+
+
+def iter_generate_chunk_to_json(factory_class: DjangoModelFactory, start: int, size: int, seed: int,
+                                file_pool: int=None, batched: bool=False,
+                                sequence_offsets: Dict[DjangoModelFactory, int]=None,
+                                related_overrides: Dict=None) -> Iterator[Dict]:
+    """
+    Generate dictionaries of records of chunk.
+    Random state is seeded by seed, factory label and start of chunk,
+    sequences start from start, so chunks don't depend on each other.
+    :param factory_class: Factory class.
+    :param start: Index of first record of chunk.
+    :param size: Quantity of records in chunk.
+    :param seed: Seed of generation.
+    :param file_pool: Quantity of generated payloads of every file declaration in chunk.
+    :param batched: If True, values of Faker and Sequence declarations are generated at once.
+    :param sequence_offsets: First sequence numbers of nested factories, see seeding.reset_sequences.
+    :param related_overrides: RandomRelated declarations with filled pools,
+        see relations.get_related_overrides.
+        Pools are queried for every chunk if they aren't specified.
+    """
+    seed_chunk(factory_class, seed, start, dict_factory=True, sequence_offsets=sequence_offsets)
+    overrides = get_file_overrides(factory_class, file_pool, store=False)
+    return iter_generate_to_json(factory_class, quantity=size, batched=batched, **overrides,
+                                 **(related_overrides or {}))
+
+
+def iter_seeded_generate_to_json(factory_class: DjangoModelFactory, quantity: int=1,
+                                 chunk_size: int=DEFAULT_CHUNK_SIZE, seed: int=0, file_pool: int=None,
+                                 batched: bool=False,
+                                 sequence_offsets: Dict[DjangoModelFactory, int]=None) -> Iterator[Dict]:
+    """
+    Generate dictionaries of records of factory by chunks in current process.
+    Records are the same as records generated by iter_parallel_generate_to_json
+    with the same seed and chunk_size.
+    """
+    related_overrides = get_related_overrides(factory_class, create=False)
+    for start, size in get_chunks(quantity, chunk_size):
+        yield from iter_generate_chunk_to_json(factory_class, start, size, seed, file_pool=file_pool,
+                                               batched=batched, sequence_offsets=sequence_offsets,
+                                               related_overrides=related_overrides)
+
+
+def generate_chunk(factory_class: DjangoModelFactory, start: int, size: int, seed: int,
+                   file_pool: int=None, batched: bool=False,
+                   sequence_offsets: Dict[DjangoModelFactory, int]=None, related_overrides: Dict=None,
+                   **kwargs) -> List[str]:
+    """
+    Generate json records of chunk and return them encoded.
+    :param factory_class: Factory class.
+    :param start: Index of first record of chunk.
+    :param size: Quantity of records in chunk.
+    :param seed: Seed of generation.
+    :param file_pool: Quantity of generated payloads of every file declaration in chunk.
+    :param batched: If True, values of Faker and Sequence declarations are generated at once.
+    :param sequence_offsets: First sequence numbers of nested factories, see seeding.reset_sequences.
+    :param related_overrides: RandomRelated declarations with filled pools,
+        see relations.get_related_overrides.
+    :param kwargs: Json encoder class as cls and its keyword arguments.
+    """
+    encoder = kwargs.pop('cls', json.JSONEncoder)(**kwargs)
+    model_label = factory_class._meta.model._meta.label_lower
+    return [
+        encoder.encode({'model': model_label, 'fields': fields})
+        for fields in iter_generate_chunk_to_json(factory_class, start, size, seed, file_pool=file_pool,
+                                                  batched=batched, sequence_offsets=sequence_offsets,
+                                                  related_overrides=related_overrides)
+    ]
+
+
+def iter_parallel_generate_to_json(factory_class: DjangoModelFactory, quantity: int=1, workers: int=None,
+                                   chunk_size: int=DEFAULT_CHUNK_SIZE, seed: int=None, file_pool: int=None,
+                                   batched: bool=False,
+                                   sequence_offsets: Dict[DjangoModelFactory, int]=None,
+                                   **kwargs) -> Iterator[str]:
+    """
+    Generate json records of factory in pool of processes.
+    Yield encoded fixture records in the same order as chunks, the results of
+    at most two chunks per worker are kept in memory.
+    :param factory_class: Factory class.
+    :param quantity: Quantity of records.
+    :param workers: Quantity of worker processes, by default number of processors.
+    :param chunk_size: Quantity of records generated by worker at once.
+    :param seed: Seed of generation. If not specified, it is taken from factory_boy random state.
+    :param file_pool: Quantity of generated payloads of every file declaration in every chunk.
+    :param batched: If True, values of Faker and Sequence declarations are generated at once
+        for every chunk.
+    :param sequence_offsets: First sequence numbers of nested factories, see seeding.reset_sequences.
+    :param kwargs: Json encoder class as cls and its keyword arguments.
+    """
+    if seed is None:
+        seed = factory.random.randgen.getrandbits(64)
+    # Pools of related objects are queried once and sent to workers with chunks.
+    related_overrides = get_related_overrides(factory_class, create=False)
+    workers = workers or os.cpu_count() or 1
+    chunks = deque(get_chunks(quantity, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        max_pending = workers * 2
+        pending = deque()
+        while chunks or pending:
+            while chunks and len(pending) < max_pending:
+                start, size = chunks.popleft()
+                pending.append(executor.submit(
+                    generate_chunk, factory_class, start, size, seed, file_pool=file_pool, batched=batched,
+                    sequence_offsets=sequence_offsets, related_overrides=related_overrides, **kwargs
+                ))
+            yield from pending.popleft().result()
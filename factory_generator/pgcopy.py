@@ -0,0 +1,192 @@
+from django.db import connections, router
+from django.db.models import Model
+
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+import json
+from typing import List
+
+from factory_generator.bulk import (
+    bulk_save, get_parent_fields, get_unsaved_parents, has_pending_m2m, reassign_parents, save_pending_m2m,
+    DEFAULT_BATCH_SIZE,
+)
+
+
+NULL = '\\N'
+
+COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+def can_copy(using: str) -> bool:
+    """
+    Return True if database supports COPY FROM STDIN.
+    """
+    return connections[using].vendor == 'postgresql'
+
+
+def get_text_value(value) -> str:
+    """
+    Return text representation of value prepared for database, None for NULL.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f'{value.total_seconds()} seconds'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        items = []
+        for item in map(get_text_value, value):
+            if item is None:
+                items.append('NULL')
+            else:
+                items.append('"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"')
+        return '{' + ','.join(items) + '}'
+    return str(value)
+
+
+def format_copy_value(value) -> str:
+    """
+    Return value formatted for text format of COPY.
+    """
+    text = get_text_value(value)
+    return NULL if text is None else text.translate(COPY_ESCAPES)
+
+
+def get_copy_fields(model_class) -> List:
+    """
+    Return concrete local fields of model which are copied.
+    """
+    return [field for field in model_class._meta.local_concrete_fields if field.column]
+
+
+def get_copy_value(obj: Model, field, connection) -> str:
+    """
+    Return value of field of object prepared for database and formatted for COPY.
+    pre_save of field is called, so auto_now fields are set and files are saved to storage.
+    """
+    value = field.pre_save(obj, add=True)
+    if field.get_internal_type() == 'JSONField':
+        return NULL if value is None else json.dumps(value, cls=field.encoder).translate(COPY_ESCAPES)
+    return format_copy_value(field.get_db_prep_save(value, connection))
+
+
+def format_copy_rows(instances: List[Model], fields: List, connection) -> str:
+    """
+    Return instances formatted as rows of text format of COPY.
+    """
+    return ''.join(
+        '\t'.join(get_copy_value(obj, field, connection) for field in fields) + '\n'
+        for obj in instances
+    )
+
+
+def get_pk_sequence(model_class, using: str) -> str:
+    """
+    Return name of sequence of primary key of model or None if primary key isnt serial.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            'SELECT pg_get_serial_sequence(%s, %s)',
+            [model_class._meta.db_table, model_class._meta.pk.column]
+        )
+        return cursor.fetchone()[0]
+
+
+def reserve_pks(sequence: str, count: int, using: str) -> List[int]:
+    """
+    Reserve count values of sequence with one query.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute('SELECT nextval(%s) FROM generate_series(1, %s)', [sequence, count])
+        return [row[0] for row in cursor.fetchall()]
+
+
+def assign_pks(instances: List[Model], using: str) -> bool:
+    """
+    Set primary keys reserved from sequence to instances without primary keys.
+    Return False if primary keys cant be reserved, because primary key isnt serial.
+    """
+    without_pk = [obj for obj in instances if obj.pk is None]
+    if not without_pk:
+        return True
+    model_class = type(instances[0])
+    sequence = get_pk_sequence(model_class, using)
+    if sequence is None:
+        return False
+    for obj, pk in zip(without_pk, reserve_pks(sequence, len(without_pk), using)):
+        obj.pk = pk
+    return True
+
+
+def copy_rows(model_class, fields: List, data: str, using: str):
+    """
+    Stream rows into table of model with COPY FROM STDIN,
+    using copy_expert of psycopg2 or copy of psycopg.
+    """
+    columns = ', '.join(connections[using].ops.quote_name(field.column) for field in fields)
+    table = connections[using].ops.quote_name(model_class._meta.db_table)
+    sql = f'COPY {table} ({columns}) FROM STDIN'
+    with connections[using].cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            raw_cursor.copy_expert(sql, StringIO(data))
+        else:
+            with raw_cursor.copy(sql) as copy:
+                copy.write(data)
+
+
+def copy_save(instances: List[Model], batch_size: int=DEFAULT_BATCH_SIZE, using: str=None,
+              return_pks: bool=False) -> int:
+    """
+    Save built instances of one model with COPY FROM STDIN.
+    Primary keys are reserved from sequence before, so unsaved parents referenced by foreign keys
+    are copied before children and children refer to them without reading rows back.
+    Related objects of many to many fields pending on instances are attached with bulk_create
+    after copying.
+    Instances are saved with bulk_save on databases other than PostgreSQL,
+    for models of multi-table inheritance and for models without serial primary keys.
+    Return quantity of created objects, including parents.
+    :param instances: List of unsaved instances of the same model.
+    :param batch_size: Quantity of objects copied by one query.
+    :param using: Database alias.
+    :param return_pks: If True, instances must get primary keys after saving.
+    """
+    if not instances:
+        return 0
+
+    model_class = type(instances[0])
+    using = using or router.db_for_write(model_class)
+    if not can_copy(using) or model_class._meta.parents:
+        return bulk_save(instances, batch_size=batch_size, using=using, return_pks=return_pks)
+
+    created = 0
+    for field in get_parent_fields(model_class):
+        parents = get_unsaved_parents(instances, field)
+        if parents:
+            created += copy_save(parents, batch_size=batch_size, using=using, return_pks=True)
+            reassign_parents(instances, field, using)
+
+    if not assign_pks(instances, using):
+        return created + bulk_save(instances, batch_size=batch_size, using=using, return_pks=return_pks)
+
+    connection = connections[using]
+    fields = get_copy_fields(model_class)
+    for start in range(0, len(instances), batch_size):
+        batch = instances[start:start + batch_size]
+        copy_rows(model_class, fields, format_copy_rows(batch, fields, connection), using)
+        for obj in batch:
+            obj._state.adding = False
+            obj._state.db = using
+    if has_pending_m2m(instances):
+        save_pending_m2m(instances, batch_size=batch_size, using=using)
+    return created + len(instances)
@@ -0,0 +1,148 @@
+from django.core.management.base import CommandError
+
+import factory
+from factory.declarations import SubFactory
+from factory.django import DjangoModelFactory
+from typing import Dict, Iterable, List, Tuple
+
+from factory_generator.pools import fill_pool
+from factory_generator.utils import FactoryQuantity, get_factory_label
+
+
+# Maximum quantity of existing parents which SubFactories of models with reached target are replaced with.
+TARGET_POOL_SIZE = 1000
+
+
+def get_label_quantity(label: str, quantity: int, factory_quantities: Dict[str, FactoryQuantity],
+                       planned: Dict[str, int], path: List[str]=[]) -> int:
+    """
+    Return quantity of records of factory with label.
+    Quantity of factory with ratio is planned from quantity of its parent factory,
+    quantity of factory which isnt in factory_quantities is the default quantity.
+    :param label: Label of factory in form "app_label.FactoryName".
+    :param quantity: Default quantity.
+    :param factory_quantities: Dict of {label: FactoryQuantity}.
+    :param planned: Dict of {label: quantity} of already planned factories, it is updated.
+    :param path: Labels of factories which quantities depend on quantity of this factory.
+
+    Raise CommandError if ratios form a cycle.
+    """
+    if label in planned:
+        return planned[label]
+    if label in path:
+        raise CommandError(f"Quantities of factories {' -> '.join(path + [label])} depend on each other.")
+
+    spec = factory_quantities.get(label)
+    if spec is None:
+        result = quantity
+    elif spec.quantity is not None:
+        result = spec.quantity
+    else:
+        parent_quantity = get_label_quantity(
+            spec.per, quantity, factory_quantities, planned, path + [label]
+        )
+        result = round(parent_quantity * spec.ratio)
+    planned[label] = result
+    return result
+
+
+def get_quantities(generate_factories: List[DjangoModelFactory], quantity: int=1,
+                   factory_quantities: Dict[str, FactoryQuantity]={}) -> Dict[DjangoModelFactory, int]:
+    """
+    Return dict of {factory class: quantity of records} for every factory.
+    :param generate_factories: List of factory classes.
+    :param quantity: Quantity of records of factories which arent in factory_quantities.
+    :param factory_quantities: Dict of {"app_label.FactoryName": FactoryQuantity}.
+    """
+    planned = {}
+    return {
+        factory_class: get_label_quantity(
+            get_factory_label(factory_class), quantity, factory_quantities, planned
+        )
+        for factory_class in generate_factories
+    }
+
+
+def get_missing_quantities(
+    factories_quantities: Dict[DjangoModelFactory, int]
+) -> Dict[DjangoModelFactory, int]:
+    """
+    Return dict of {factory class: quantity of records} which are missing
+    to reach target quantities of models in database of factories.
+    Records of model are counted once, so factories of the same model share its target.
+    :param factories_quantities: Dict of {factory class: target quantity of records}.
+    """
+    existing = {}
+    result = {}
+    for factory_class, target in factories_quantities.items():
+        model_class = factory_class._meta.model
+        key = (model_class, factory_class._meta.database)
+        if key not in existing:
+            existing[key] = model_class._default_manager.using(factory_class._meta.database).count()
+        result[factory_class] = max(0, target - existing[key])
+        existing[key] += result[factory_class]
+    return result
+
+
+def count_records(factory_class: DjangoModelFactory) -> int:
+    """
+    Return quantity of records of factory model in database of factory.
+    """
+    return factory_class._meta.model._default_manager.using(factory_class._meta.database).count()
+
+
+def get_missing_quantity(factory_class: DjangoModelFactory, target: int) -> int:
+    """
+    Return quantity of records which are missing to reach target quantity of factory model.
+    Count records right before factory is generated, so records created by previous factories
+    of the same model or its parents are counted too.
+    """
+    return max(0, target - count_records(factory_class))
+
+
+def get_model_targets(factories_quantities: Dict[DjangoModelFactory, int]) -> Dict[Tuple, int]:
+    """
+    Return dict of {(model, database): target quantity} of factories.
+    :param factories_quantities: Dict of {factory class: target quantity of records}.
+    """
+    targets = {}
+    for factory_class, target in factories_quantities.items():
+        key = (factory_class._meta.model, factory_class._meta.database)
+        targets[key] = max(target, targets.get(key, 0))
+    return targets
+
+
+def get_target_overrides(factory_class: DjangoModelFactory, targets: Dict[Tuple, int], quantity: int,
+                         exclude: Iterable[str]=()) -> Dict:
+    """
+    Return declarations which replace SubFactories of models with reached target
+    by existing records, so parents of generated records don't exceed their target.
+    Nested SubFactories are replaced by path, e.g. company__city.
+    :param factory_class: Factory class of generated records.
+    :param targets: Dict of {(model, database): target quantity}, e.g. get_model_targets result.
+    :param quantity: Quantity of generated records, parents are reused round robin
+                     if there are less of them.
+    :param exclude: Paths of SubFactories which are overridden already.
+    """
+    overrides = {}
+
+    def replace(related_factory, prefix):
+        for name, declaration in related_factory._meta.declarations.items():
+            path = f'{prefix}{name}'
+            if not isinstance(declaration, SubFactory) or path in exclude:
+                continue
+            parent_factory = declaration.get_factory()
+            if not issubclass(parent_factory, DjangoModelFactory):
+                continue
+            target = targets.get((parent_factory._meta.model, parent_factory._meta.database))
+            if target is not None:
+                count = count_records(parent_factory)
+                if count and count >= target:
+                    records = fill_pool(parent_factory, min(count, quantity, TARGET_POOL_SIZE))
+                    overrides[path] = factory.Iterator(records)
+                    continue
+            replace(parent_factory, f'{path}__')
+
+    if quantity > 0:
+        replace(factory_class, '')
+    return overrides
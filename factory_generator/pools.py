@@ -0,0 +1,123 @@
+from django.core.management.base import CommandError
+
+import factory
+from factory.declarations import SubFactory
+from factory.django import DjangoModelFactory
+from factory.fuzzy import FuzzyChoice
+from typing import Dict, List, NamedTuple
+
+from factory_generator.bulk import bulk_save, DEFAULT_BATCH_SIZE
+
+
+ROUND_ROBIN = 'round_robin'
+RANDOM = 'random'
+POOL_MODES = (ROUND_ROBIN, RANDOM)
+
+
+class Pool(NamedTuple):
+    """
+    Pool of parent records for relation.
+    :attr size: Quantity of parent records in pool.
+    :attr mode: How parents are assigned to children, round_robin or random.
+    """
+    size: int
+    mode: str = ROUND_ROBIN
+
+
+def parse_pools(specs: List[str]) -> Dict[str, Dict[str, Pool]]:
+    """
+    Parse pool specifications of "app_label.FactoryName.field=size[:mode]".
+    Field can be a path to nested SubFactory, e.g. company__city.
+    :param specs: List of pool specifications.
+
+    Returns dict of {factory label: {field: Pool}}.
+    """
+    pools = {}
+    for spec in specs:
+        spec = spec.strip()
+        if not spec:
+            continue
+        try:
+            relation, value = spec.split('=')
+            app_name, factory_name, field_name = relation.strip().split('.')
+            size, _, mode = value.strip().partition(':')
+            pool = Pool(size=int(size), mode=mode or ROUND_ROBIN)
+        except ValueError:
+            raise CommandError(
+                f'Pool {spec} specified incorrectly. Use form app_label.FactoryName.field=size[:mode].'
+            )
+        if pool.mode not in POOL_MODES:
+            raise CommandError(f"Unknown pool mode: {pool.mode}. Use one of {', '.join(POOL_MODES)}.")
+        if pool.size < 1:
+            raise CommandError(f'Size of pool {spec} must be positive.')
+        pools.setdefault(f'{app_name}.{factory_name}', {})[field_name] = pool
+    return pools
+
+
+def get_related_factory(factory_class: DjangoModelFactory, field_path: str) -> DjangoModelFactory:
+    """
+    Return factory of SubFactory declared by field path of factory class.
+    :param factory_class: Factory class.
+    :param field_path: Name of SubFactory attribute or path to nested one, e.g. company__city.
+
+    Raise CommandError if factory doesnt declare such SubFactory.
+    """
+    related_factory = factory_class
+    for field_name in field_path.split('__'):
+        declaration = related_factory._meta.declarations.get(field_name)
+        if not isinstance(declaration, SubFactory):
+            raise CommandError(f'Factory {factory_class.__name__} doesnt have SubFactory {field_path}')
+        related_factory = declaration.get_factory()
+    return related_factory
+
+
+def fill_pool(factory_class: DjangoModelFactory, size: int, bulk: bool=False,
+              batch_size: int=DEFAULT_BATCH_SIZE) -> List:
+    """
+    Return list of records for pool.
+    Existing records of factory model are sampled first, missing ones are created by factory.
+    :param factory_class: Factory of parent records.
+    :param size: Size of pool.
+    :param bulk: If True, missing records are created with bulk_create.
+    :param batch_size: Quantity of records inserted by one query in bulk mode.
+    """
+    manager = factory_class._meta.model._default_manager.using(factory_class._meta.database)
+    records = list(manager.order_by('?')[:size])
+    missing = size - len(records)
+    if missing > 0:
+        if bulk:
+            created = factory_class.build_batch(missing)
+            bulk_save(created, batch_size=batch_size, using=factory_class._meta.database, return_pks=True)
+        else:
+            created = factory_class.create_batch(missing)
+        records.extend(created)
+    return records
+
+
+def get_pool_overrides(factory_class: DjangoModelFactory, pools: Dict[str, Pool], bulk: bool=False,
+                       batch_size: int=DEFAULT_BATCH_SIZE) -> Dict:
+    """
+    Fill pools and return declarations to pass into factory,
+    which assign pooled parents to generated records instead of creating new ones.
+    :param factory_class: Factory class of generated records.
+    :param pools: Dict of {field: Pool}.
+    :param bulk: If True, missing parents are created with bulk_create.
+    :param batch_size: Quantity of records inserted by one query in bulk mode.
+    """
+    overrides = {}
+    for field_path, pool in pools.items():
+        related_factory = get_related_factory(factory_class, field_path)
+        records = fill_pool(related_factory, pool.size, bulk=bulk, batch_size=batch_size)
+        overrides[field_path] = get_pool_declaration(records, pool)
+    return overrides
+
+
+def get_pool_declaration(records: List, pool: Pool):
+    """
+    Return declaration which assigns records of pool according to mode of pool.
+    :param records: Records of filled pool.
+    :param pool: Pool object.
+    """
+    if pool.mode == RANDOM:
+        return FuzzyChoice(records)
+    return factory.Iterator(records)
@@ -0,0 +1,147 @@
+from django.db import connections
+
+from factory import builder
+from factory.django import DjangoModelFactory
+import cProfile
+from contextlib import contextmanager, ExitStack
+import json
+import time
+from typing import Dict, List
+
+from factory_generator.utils import get_factory_label
+
+
+class Profiler:
+    """
+    Collects wall time and calls of factories and their declarations while generating.
+    Time of declaration includes time of nested declarations, e.g. time of SubFactory
+    includes time of building its factory.
+    :param use_cprofile: If True, cProfile stats are collected too.
+    """
+    def __init__(self, use_cprofile: bool=False):
+        self.factories = {}
+        self.declarations = {}
+        self.cprofile = cProfile.Profile() if use_cprofile else None
+
+    @contextmanager
+    def enable(self):
+        """
+        Collect stats of declarations while context is active.
+        """
+        original_getattr = builder.Resolver.__getattr__
+        profiler = self
+
+        def __getattr__(resolver, name):
+            declarations = resolver._Resolver__declarations
+            if name in resolver._Resolver__values or name not in declarations:
+                return original_getattr(resolver, name)
+            start_time = time.perf_counter()
+            try:
+                return original_getattr(resolver, name)
+            finally:
+                profiler.add_declaration(
+                    resolver._Resolver__step.builder.factory_meta, name,
+                    declarations[name].declaration, time.perf_counter() - start_time,
+                )
+
+        builder.Resolver.__getattr__ = __getattr__
+        try:
+            if self.cprofile:
+                self.cprofile.enable()
+            yield self
+        finally:
+            if self.cprofile:
+                self.cprofile.disable()
+            builder.Resolver.__getattr__ = original_getattr
+
+    def add_declaration(self, factory_meta, name: str, declaration, seconds: float):
+        if factory_meta.model is dict and factory_meta.base_factory:
+            # Dict factory built by generate_to_dict for factory class.
+            factory_meta = factory_meta.base_factory._meta
+        key = (get_factory_label(factory_meta.factory), name)
+        stats = self.declarations.setdefault(key, {
+            'factory': key[0],
+            'attribute': name,
+            'declaration': type(declaration).__name__,
+            'calls': 0,
+            'seconds': 0.0,
+        })
+        stats['calls'] += 1
+        stats['seconds'] += seconds
+
+    @contextmanager
+    def profile_factory(self, factory_class: DjangoModelFactory, quantity: int):
+        """
+        Collect wall time, rows per second and database queries of generating records of factory.
+        """
+        stats = self.factories.setdefault(get_factory_label(factory_class), {
+            'factory': get_factory_label(factory_class),
+            'rows': 0,
+            'seconds': 0.0,
+            'queries': 0,
+        })
+
+        def count_query(execute, sql, params, many, context):
+            stats['queries'] += 1
+            return execute(sql, params, many, context)
+
+        start_time = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(count_query))
+            yield stats
+        stats['seconds'] += time.perf_counter() - start_time
+        stats['rows'] += quantity
+
+    def get_factories_stats(self) -> List[Dict]:
+        """
+        Return stats of factories sorted by time.
+        """
+        result = []
+        for stats in self.factories.values():
+            seconds = stats['seconds']
+            result.append(dict(stats, rows_per_sec=stats['rows'] / seconds if seconds else None))
+        return sorted(result, key=lambda s: s['seconds'], reverse=True)
+
+    def get_declarations_stats(self) -> List[Dict]:
+        """
+        Return stats of declarations sorted by time.
+        """
+        return sorted(self.declarations.values(), key=lambda s: s['seconds'], reverse=True)
+
+    def format_summary(self) -> str:
+        """
+        Return tables of factories and declarations stats.
+        """
+        lines = [f"{'Factory':<40} {'Rows':>10} {'Time, s':>10} {'Rows/sec':>12} {'Queries':>10}"]
+        for stats in self.get_factories_stats():
+            rows_per_sec = f"{stats['rows_per_sec']:.0f}" if stats['rows_per_sec'] else '-'
+            lines.append(
+                f"{stats['factory']:<40} {stats['rows']:>10} {stats['seconds']:>10.3f} "
+                f"{rows_per_sec:>12} {stats['queries']:>10}"
+            )
+        lines.append('')
+        lines.append(
+            f"{'Factory':<40} {'Attribute':<20} {'Declaration':<20} "
+            f"{'Calls':>10} {'Time, s':>10} {'Per call, us':>12}"
+        )
+        for stats in self.get_declarations_stats():
+            per_call = stats['seconds'] / stats['calls'] * 1e6
+            lines.append(
+                f"{stats['factory']:<40} {stats['attribute']:<20} {stats['declaration']:<20} "
+                f"{stats['calls']:>10} {stats['seconds']:>10.3f} {per_call:>12.1f}"
+            )
+        return '\n'.join(lines)
+
+    def dump(self, path: str):
+        """
+        Write stats into file: cProfile stats if path ends with .prof, otherwise json.
+        """
+        if path.endswith('.prof'):
+            self.cprofile.dump_stats(path)
+            return
+        with open(path, 'w') as fp:
+            json.dump({
+                'factories': self.get_factories_stats(),
+                'declarations': self.get_declarations_stats(),
+            }, fp, indent=2)
@@ -0,0 +1,157 @@
+from factory import enums
+import factory.random
+from factory.declarations import PostGenerationDeclaration
+from factory.django import DjangoModelFactory
+from contextlib import contextmanager
+import threading
+from typing import Dict, List, Tuple, Union
+
+from factory_generator.bulk import DEFAULT_BATCH_SIZE, PENDING_M2M_ATTR
+from factory_generator.pools import fill_pool
+
+
+DEFAULT_POOL_SIZE = 100
+
+_skip_save_lock = threading.Lock()
+_skip_save_state = {}
+
+
+class RandomRelated(PostGenerationDeclaration):
+    """
+    Attaches k random objects of related factory to many to many field of generated record.
+    Related objects are chosen from pool of pool_size objects: existing objects of related model
+    are used first, missing ones are created by related factory when records are created.
+    Records built to json get list of primary keys of related objects.
+    Records created by generate_to_db get related objects with one bulk_create of through model per chunk,
+    otherwise records created by factory get them with set() of field.
+    :param related_factory: Factory of related objects.
+    :param k: Quantity of related objects of every record or tuple of (minimum, maximum) quantity.
+    :param pool_size: Quantity of related objects which are chosen from.
+    :param pks: Primary keys of filled pool, pool is filled for every record if they arent specified.
+    :param defer: If True, related objects of created records are attached later with save_pending_m2m.
+    :param name: Name of many to many field, it is taken from attribute of factory class if not specified,
+        so it is required only when declaration is passed into factory as keyword argument.
+    """
+    def __init__(self, related_factory: DjangoModelFactory, k: Union[int, Tuple[int, int]]=1,
+                 pool_size: int=DEFAULT_POOL_SIZE, pks: List=None, defer: bool=False, name: str=None):
+        super().__init__()
+        self.related_factory = related_factory
+        self.k = k
+        self.pool_size = pool_size
+        self.pks = pks
+        self.defer = defer
+        self.name = name
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = name
+
+    def with_pool(self, pks: List, defer: bool=True, name: str=None) -> 'RandomRelated':
+        """
+        Return declaration which chooses related objects from filled pool of primary keys.
+        """
+        return type(self)(self.related_factory, k=self.k, pool_size=self.pool_size, pks=pks, defer=defer,
+                          name=name or self.name)
+
+    def fill_pool(self, create: bool=True, bulk: bool=False, batch_size: int=DEFAULT_BATCH_SIZE) -> List:
+        """
+        Return primary keys of pool of related objects.
+        :param create: If True, missing objects are created, otherwise only existing objects are used.
+        """
+        if create:
+            records = fill_pool(self.related_factory, self.pool_size, bulk=bulk, batch_size=batch_size)
+            return sorted(record.pk for record in records)
+        factory_meta = self.related_factory._meta
+        manager = factory_meta.model._default_manager.using(factory_meta.database)
+        return list(manager.order_by('pk').values_list('pk', flat=True)[:self.pool_size])
+
+    def choose(self, pks: List) -> List:
+        """
+        Return random related primary keys, random state of factory_boy is used, so they depend on seed.
+        """
+        minimum, maximum = self.k if isinstance(self.k, (tuple, list)) else (self.k, self.k)
+        count = factory.random.randgen.randint(minimum, maximum)
+        return factory.random.randgen.sample(pks, min(count, len(pks)))
+
+    def call(self, instance, step, context):
+        if self.name is None:
+            raise ValueError(
+                'Many to many field of RandomRelated is unknown, specify name argument '
+                'when declaration is passed into factory as keyword argument.'
+            )
+        create = step.builder.strategy == enums.CREATE_STRATEGY
+        if isinstance(instance, dict):
+            pks = self.pks if self.pks is not None else self.fill_pool(create=False)
+            instance[self.name] = self.choose(pks)
+            return
+        pks = self.pks if self.pks is not None else self.fill_pool(create=create)
+        chosen = self.choose(pks)
+        if create and not self.defer:
+            getattr(instance, self.name).set(chosen)
+        else:
+            instance.__dict__.setdefault(PENDING_M2M_ATTR, {})[self.name] = chosen
+
+
+def get_related_overrides(factory_class: DjangoModelFactory, create: bool=True, bulk: bool=False,
+                          batch_size: int=DEFAULT_BATCH_SIZE,
+                          overrides: Dict=None) -> Dict[str, RandomRelated]:
+    """
+    Fill pools of RandomRelated declarations of factory once and return overrides
+    which choose related objects from them and defer attaching.
+    :param factory_class: Factory class.
+    :param create: If True, missing related objects are created, otherwise only existing objects are used.
+    :param bulk: If True, missing related objects are created with bulk_create.
+    :param batch_size: Quantity of records inserted by one query in bulk mode.
+    :param overrides: Keyword arguments passed into factory. Declarations overridden by them are skipped,
+        except RandomRelated overrides without filled pool, which get pools too.
+    """
+    overrides = overrides or {}
+    declarations = dict(factory_class._meta.declarations, **overrides)
+    result = {}
+    for name, declaration in declarations.items():
+        if not isinstance(declaration, RandomRelated):
+            continue
+        if name in overrides and declaration.pks is not None:
+            continue
+        pks = declaration.fill_pool(create=create, bulk=bulk, batch_size=batch_size)
+        result[name] = declaration.with_pool(pks, name=name)
+    return result
+
+
+def has_only_related_post_declarations(factory_class: DjangoModelFactory) -> bool:
+    """
+    Return True if factory has RandomRelated declarations and no other post generation declarations.
+    """
+    post_declarations = [
+        declaration for declaration in factory_class._meta.declarations.values()
+        if isinstance(declaration, PostGenerationDeclaration)
+    ]
+    return bool(post_declarations) and all(isinstance(d, RandomRelated) for d in post_declarations)
+
+
+@contextmanager
+def skip_postgeneration_save(factory_class: DjangoModelFactory):
+    """
+    Don't save records created by factory again after post generation,
+    if all its post generation declarations are RandomRelated: they don't change fields of records.
+    Nested and concurrent usages for the same factory are counted,
+    original option is restored by the last one.
+    Nothing is changed on factory_boy older than 3.3, which doesn't have skip_postgeneration_save option.
+    """
+    meta = factory_class._meta
+    supported = getattr(meta, 'skip_postgeneration_save', None) is not None
+    if not supported or not has_only_related_post_declarations(factory_class):
+        yield
+        return
+    with _skip_save_lock:
+        if factory_class not in _skip_save_state:
+            _skip_save_state[factory_class] = [0, meta.skip_postgeneration_save]
+            meta.skip_postgeneration_save = True
+        _skip_save_state[factory_class][0] += 1
+    try:
+        yield
+    finally:
+        with _skip_save_lock:
+            _skip_save_state[factory_class][0] -= 1
+            if not _skip_save_state[factory_class][0]:
+                meta.skip_postgeneration_save = _skip_save_state.pop(factory_class)[1]
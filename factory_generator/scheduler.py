@@ -0,0 +1,74 @@
+from factory.django import DjangoModelFactory
+import logging
+from typing import Dict, List, Set
+
+from factory_generator.utils import get_factory_label
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_related_models(model_class) -> Set:
+    """
+    Return models which records must exist before records of model_class are created:
+    targets of foreign keys, one to one and many to many fields and parents of multi-table inheritance.
+    :param model_class: Django model class.
+    """
+    related_models = set(model_class._meta.parents.keys())
+    for field in model_class._meta.get_fields(include_hidden=True):
+        if field.is_relation and field.concrete and field.related_model is not None:
+            if field.many_to_one or field.one_to_one or field.many_to_many:
+                related_models.add(field.related_model)
+    related_models.discard(model_class)
+    return related_models
+
+
+def get_dependencies(generate_factories: List[DjangoModelFactory]) -> Dict[DjangoModelFactory, Set]:
+    """
+    Return dependency graph of factories as dict of {factory: factories it depends on}.
+    Factory depends on other factory from the list if its model refers to model of other factory.
+    :param generate_factories: List of factory classes.
+    """
+    factories_by_model = {}
+    for factory_class in generate_factories:
+        factories_by_model.setdefault(factory_class._meta.model, set()).add(factory_class)
+
+    dependencies = {}
+    for factory_class in generate_factories:
+        dependencies[factory_class] = set()
+        for related_model in get_related_models(factory_class._meta.model):
+            dependencies[factory_class].update(factories_by_model.get(related_model, set()))
+    return dependencies
+
+
+def get_dependency_levels(generate_factories: List[DjangoModelFactory]) -> List[List[DjangoModelFactory]]:
+    """
+    Return factories splitted into levels in topological order of foreign key graph of their models.
+    Factories of each level depend only on factories of previous levels,
+    so factories of one level can be generated concurrently.
+    Factories which form a cycle are placed in the last level.
+    :param generate_factories: List of factory classes.
+    """
+    dependencies = get_dependencies(generate_factories)
+    levels = []
+    done = set()
+    pending = sorted(dependencies.keys(), key=get_factory_label)
+    while pending:
+        level = [f for f in pending if dependencies[f] <= done]
+        if not level:
+            logger.warning(
+                f"Factories {', '.join(map(get_factory_label, pending))} have cyclic dependencies."
+            )
+            level = pending
+        levels.append(level)
+        done.update(level)
+        pending = [f for f in pending if f not in done]
+    return levels
+
+
+def sort_factories(generate_factories: List[DjangoModelFactory]) -> List[DjangoModelFactory]:
+    """
+    Return factories sorted so that factories of parent models go before factories of child models.
+    :param generate_factories: List of factory classes.
+    """
+    return [f for level in get_dependency_levels(generate_factories) for f in level]
@@ -0,0 +1,91 @@
+import factory.random
+from factory.declarations import SubFactory
+from factory.django import DjangoModelFactory
+from typing import Dict, List, Tuple
+
+from factory_generator.generators import get_dict_factory, DEFAULT_CHUNK_SIZE
+from factory_generator.utils import get_factory_label
+
+
+def get_chunks(quantity: int, chunk_size: int=DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split quantity into chunks.
+    Return list of (index of first record, quantity of records) of every chunk.
+    """
+    return [(start, min(chunk_size, quantity - start)) for start in range(0, quantity, chunk_size)]
+
+
+def get_nested_factories(factory_class: DjangoModelFactory,
+                         path: Tuple=()) -> Dict[DjangoModelFactory, int]:
+    """
+    Return dict of {factory: quantity of its records built for one record of factory_class}
+    of factories of SubFactories of factory_class and their SubFactories.
+    """
+    nested = {}
+    for declaration in factory_class._meta.declarations.values():
+        if not isinstance(declaration, SubFactory):
+            continue
+        nested_factory = declaration.get_factory()
+        if nested_factory in path or nested_factory is factory_class:
+            continue
+        nested[nested_factory] = nested.get(nested_factory, 0) + 1
+        for sub_factory, uses in get_nested_factories(nested_factory, path + (factory_class,)).items():
+            nested[sub_factory] = nested.get(sub_factory, 0) + uses
+    return nested
+
+
+def get_sequence_offsets(factories_quantities: Dict[DjangoModelFactory, int]) -> Dict:
+    """
+    Return dict of {factory: {nested factory: its first sequence number in records of factory}}.
+    Sequence numbers of every factory are allocated in ranges: its own records get numbers from 0
+    till its quantity, records built by SubFactories of every next factory get numbers after them,
+    so sequences of nested factories don't repeat between factories.
+    :param factories_quantities: Dict of {factory class: quantity of records} in order of generation.
+    """
+    next_numbers = dict(factories_quantities)
+    offsets = {}
+    for factory_class, quantity in factories_quantities.items():
+        offsets[factory_class] = {}
+        for nested_factory, uses in get_nested_factories(factory_class).items():
+            offsets[factory_class][nested_factory] = next_numbers.get(nested_factory, 0)
+            next_numbers[nested_factory] = offsets[factory_class][nested_factory] + quantity * uses
+    return offsets
+
+
+def reset_sequences(factory_class: DjangoModelFactory, value: int, dict_factory: bool=False,
+                    sequence_offsets: Dict[DjangoModelFactory, int]=None):
+    """
+    Reset sequence of factory_class to value and sequences of factories of its SubFactories
+    to their offsets plus numbers used by records before value, so every record gets its own numbers.
+    :param dict_factory: If True, sequences of dict factories building json records are reset.
+    :param sequence_offsets: Dict of {nested factory: first sequence number}, e.g. get_sequence_offsets
+                             result for factory_class. Nested sequences start from 0 if it isnt specified.
+    """
+    sequence_offsets = sequence_offsets or {}
+    get_factory = get_dict_factory if dict_factory else (lambda f: f)
+    get_factory(factory_class).reset_sequence(value, force=True)
+    for nested_factory, uses in get_nested_factories(factory_class).items():
+        get_factory(nested_factory).reset_sequence(sequence_offsets.get(nested_factory, 0) + value * uses,
+                                                   force=True)
+
+
+def get_chunk_seed(seed: int, factory_class: DjangoModelFactory, start: int) -> str:
+    """
+    Return seed of random state of chunk of records of factory.
+    """
+    return f'{seed}:{get_factory_label(factory_class)}:{start}'
+
+
+def seed_chunk(factory_class: DjangoModelFactory, seed: int, start: int, dict_factory: bool=False,
+               sequence_offsets: Dict[DjangoModelFactory, int]=None):
+    """
+    Seed random state of factory_boy and Faker by seed, factory label and start of chunk
+    and start sequences from start, so records of chunk don't depend on previous chunks.
+    :param factory_class: Factory class.
+    :param seed: Seed of generation.
+    :param start: Index of first record of chunk.
+    :param dict_factory: If True, chunk is built to json records.
+    :param sequence_offsets: First sequence numbers of nested factories, see reset_sequences.
+    """
+    factory.random.reseed_random(get_chunk_seed(seed, factory_class, start))
+    reset_sequences(factory_class, start, dict_factory=dict_factory, sequence_offsets=sequence_offsets)
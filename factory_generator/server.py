@@ -0,0 +1,175 @@
+from django.core.management.base import CommandError
+
+from factory.django import DjangoModelFactory
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import io
+import json
+import socketserver
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+from factory_generator.encoders import DjangoFileJsonEncoder
+from factory_generator.generators import iter_generate_to_json, DEFAULT_CHUNK_SIZE
+from factory_generator.parallel import iter_seeded_generate_to_json
+from factory_generator.seeding import get_sequence_offsets
+from factory_generator.utils import get_all_factories, get_factory_label
+from factory_generator import writers
+
+
+CONTENT_TYPES = {
+    writers.JSON: 'application/json',
+    writers.JSONL: 'application/x-ndjson',
+}
+
+
+class FactoriesRegistry:
+    """
+    Factories of installed apps discovered once and found by labels without importing modules again.
+    :param factories: List of factory classes, all factories of installed apps by default.
+    """
+    def __init__(self, factories: List[DjangoModelFactory]=None):
+        if factories is None:
+            factories = get_all_factories()
+        self.factories = {get_factory_label(factory_class): factory_class for factory_class in factories}
+
+    def get_factories(self, labels: List[str]) -> List[DjangoModelFactory]:
+        """
+        Return factories of labels in form "app_label.FactoryName" or "app_label".
+        Raise CommandError if label doesnt match any factory.
+        """
+        result = []
+        for label in labels:
+            if '.' in label:
+                matched = [self.factories[label]] if label in self.factories else []
+            else:
+                matched = [
+                    factory_class for factory_label, factory_class in sorted(self.factories.items())
+                    if factory_label.split('.')[0] == label
+                ]
+            if not matched:
+                raise CommandError(f'Unknown factory or app: {label}')
+            result.extend(f for f in matched if f not in result)
+        return result
+
+
+def parse_generate_query(query: str) -> Dict:
+    """
+    Return options of generation from query string of request:
+    factory (repeated for multiple labels), quantity, seed, format and chunk_size.
+    Raise CommandError if options are invalid.
+    """
+    params = parse_qs(query)
+    try:
+        options = {
+            'labels': params.get('factory', []),
+            'quantity': int(params.get('quantity', ['1'])[0]),
+            'seed': int(params['seed'][0]) if 'seed' in params else None,
+            'output_format': params.get('format', [writers.JSONL])[0],
+            'chunk_size': int(params.get('chunk_size', [str(DEFAULT_CHUNK_SIZE)])[0]),
+        }
+    except ValueError as error:
+        raise CommandError(f'Invalid parameter: {error}')
+    if not options['labels']:
+        raise CommandError('Specify at least one factory.')
+    if options['output_format'] not in writers.WRITERS:
+        raise CommandError(f"Unknown format: {options['output_format']}")
+    if options['quantity'] < 0 or options['chunk_size'] < 1:
+        raise CommandError('Quantity cannot be negative and chunk size must be positive.')
+    return options
+
+
+def write_generated(stream, generate_factories: List[DjangoModelFactory], quantity: int=1, seed: int=None,
+                    output_format: str=writers.JSONL, chunk_size: int=DEFAULT_CHUNK_SIZE):
+    """
+    Write fixture records of every factory into stream one by one.
+    If seed is specified, records are generated by chunks
+    the same as with --seed option of generate_to_json.
+    """
+    sequence_offsets = get_sequence_offsets(
+        {factory_class: quantity for factory_class in generate_factories}
+    )
+    with writers.WRITERS[output_format](stream, cls=DjangoFileJsonEncoder) as writer:
+        for factory_class in generate_factories:
+            model_label = factory_class._meta.model._meta.label_lower
+            if seed is not None:
+                factories_data = iter_seeded_generate_to_json(
+                    factory_class, quantity=quantity, chunk_size=chunk_size, seed=seed,
+                    sequence_offsets=sequence_offsets[factory_class],
+                )
+            else:
+                factories_data = iter_generate_to_json(factory_class, quantity=quantity)
+            for factory_data in factories_data:
+                writer.write({'model': model_label, 'fields': factory_data})
+
+
+class GenerateRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves GET /generate?factory=app_label.FactoryName&quantity=10&seed=1&format=jsonl
+    with records streamed while they are generated, and GET /factories with labels of factories.
+    Response isnt buffered and connection is closed after it, so records are read until end of stream.
+    """
+    server_version = 'FactoryGenerator'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/factories':
+            self.send_json(200, sorted(self.server.registry.factories))
+        elif url.path == '/generate':
+            try:
+                options = parse_generate_query(url.query)
+                generate_factories = self.server.registry.get_factories(options.pop('labels'))
+            except CommandError as error:
+                self.send_json(400, {'error': str(error)})
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPES[options['output_format']])
+            self.end_headers()
+            stream = io.TextIOWrapper(self.wfile, encoding='utf-8')
+            try:
+                write_generated(stream, generate_factories, **options)
+            finally:
+                stream.flush()
+                stream.detach()
+        else:
+            self.send_json(404, {'error': f'Unknown path: {url.path}'})
+
+    def send_json(self, status: int, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', CONTENT_TYPES[writers.JSON])
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Address of client of unix socket is empty string.
+        return str(self.client_address[0]) if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class GenerateServer(HTTPServer):
+    """
+    HTTP server of generated records listening TCP address.
+    Requests are handled one by one, because random state of factories is shared.
+    :param address: Tuple of (host, port).
+    :param registry: Registry of factories.
+    :param verbose: If True, requests are logged to stderr.
+    """
+    def __init__(self, address, registry: FactoriesRegistry, verbose: bool=False):
+        self.registry = registry
+        self.verbose = verbose
+        super().__init__(address, GenerateRequestHandler)
+
+
+class UnixGenerateServer(socketserver.UnixStreamServer):
+    """
+    HTTP server of generated records listening unix socket.
+    :param path: Path to unix socket.
+    """
+    def __init__(self, path: str, registry: FactoriesRegistry, verbose: bool=False):
+        self.registry = registry
+        self.verbose = verbose
+        super().__init__(path, GenerateRequestHandler)
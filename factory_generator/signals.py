@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+
+# Sent once after records of factory were created by generate_to_db command.
+# Receivers get sender (model class), factory_class, quantity and using (database alias),
+# so they can process new records in batch, e.g. when model signals are muted.
+post_generate = Signal()
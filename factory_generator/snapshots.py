@@ -0,0 +1,259 @@
+from django.core import serializers
+from django.core.management.color import no_style
+from django.db import connections
+from django.db.models import FileField
+
+from factory.django import DjangoModelFactory
+from functools import partial
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sqlite3
+from typing import Dict, List
+
+from factory_generator.databases import get_factories_tree
+from factory_generator.utils import get_factory_label
+
+
+SQLITE_FILE = 'db.sqlite3'
+
+
+def get_factory_source(factory_class: DjangoModelFactory) -> str:
+    """
+    Return source code of factory class or names of its declarations if source isnt available.
+    """
+    try:
+        return inspect.getsource(factory_class)
+    except (OSError, TypeError):
+        return repr(sorted(factory_class._meta.declarations))
+
+
+def get_snapshot_key(generate_factories: List[DjangoModelFactory], options: Dict) -> str:
+    """
+    Return hash of sources of factories, factories of their SubFactories and options of generation.
+    :param generate_factories: List of factory classes.
+    :param options: Json serializable dict of options which records depend on.
+    """
+    digest = hashlib.sha256()
+    for factory_class in sorted(get_factories_tree(generate_factories), key=get_factory_label):
+        digest.update(get_factory_label(factory_class).encode())
+        digest.update(get_factory_source(factory_class).encode())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def get_snapshot_models(generate_factories: List[DjangoModelFactory]) -> Dict[str, List]:
+    """
+    Return dict of {database alias: models} which records are created by factories,
+    including models of SubFactories, parents of multi-table inheritance
+    and auto created through models of many to many relations.
+    """
+    models_by_database = {}
+    for factory_class in get_factories_tree(generate_factories):
+        if not issubclass(factory_class, DjangoModelFactory):
+            continue
+        model_class = factory_class._meta.model
+        models = models_by_database.setdefault(factory_class._meta.database, set())
+        models.add(model_class)
+        models.update(model_class._meta.get_parent_list())
+        for field in model_class._meta.local_many_to_many:
+            if field.remote_field.through._meta.auto_created:
+                models.add(field.remote_field.through)
+    return {
+        using: sorted(models, key=lambda m: m._meta.label)
+        for using, models in models_by_database.items()
+    }
+
+
+def get_non_empty_models(models_by_database: Dict[str, List]) -> List[str]:
+    """
+    Return labels of models which tables have records.
+    :param models_by_database: Dict of {database alias: models}, e.g. get_snapshot_models result.
+    """
+    return [
+        model_class._meta.label
+        for using, models in models_by_database.items()
+        for model_class in models
+        if model_class._base_manager.using(using).exists()
+    ]
+
+
+def get_file_models(models_by_database: Dict[str, List]) -> List[str]:
+    """
+    Return labels of models with FileField or ImageField, which files aren't stored in snapshot.
+    """
+    return [
+        model_class._meta.label
+        for models in models_by_database.values()
+        for model_class in models
+        if any(isinstance(field, FileField) for field in model_class._meta.local_fields)
+    ]
+
+
+def dump_sqlite(path: str, models: List, using: str):
+    """
+    Copy tables of models into SQLite database file with the same schema.
+    Tables are read with connection of database, so records of its open transaction are copied too.
+    """
+    quote_name = connections[using].ops.quote_name
+    target = sqlite3.connect(os.path.join(path, SQLITE_FILE))
+    try:
+        with connections[using].cursor() as cursor:
+            for model_class in models:
+                table = model_class._meta.db_table
+                cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = %s", [table])
+                target.execute(cursor.fetchone()[0])
+                cursor.execute(f'SELECT * FROM {quote_name(table)}')
+                placeholders = ', '.join(['?'] * len(cursor.description))
+                target.executemany(f'INSERT INTO {quote_name(table)} VALUES ({placeholders})',
+                                   cursor.fetchall())
+        target.commit()
+    finally:
+        target.close()
+
+
+def restore_sqlite(path: str, models: List, using: str):
+    """
+    Insert rows of tables of models from copy of SQLite database.
+    """
+    quote_name = connections[using].ops.quote_name
+    source = sqlite3.connect(os.path.join(path, SQLITE_FILE))
+    try:
+        for model_class in models:
+            table = quote_name(model_class._meta.db_table)
+            source_cursor = source.execute(f'SELECT * FROM {table}')
+            columns = ', '.join(quote_name(description[0]) for description in source_cursor.description)
+            placeholders = ', '.join(['%s'] * len(source_cursor.description))
+            with connections[using].cursor() as cursor:
+                cursor.executemany(f'INSERT INTO {table} ({columns}) VALUES ({placeholders})',
+                                   source_cursor.fetchall())
+    finally:
+        source.close()
+
+
+def dump_copy(path: str, models: List, using: str):
+    """
+    Dump tables of models with COPY TO STDOUT, using copy_expert of psycopg2 or copy of psycopg.
+    """
+    quote_name = connections[using].ops.quote_name
+    for model_class in models:
+        sql = f'COPY {quote_name(model_class._meta.db_table)} TO STDOUT'
+        with open(os.path.join(path, f'{model_class._meta.db_table}.copy'), 'wb') as fp:
+            with connections[using].cursor() as cursor:
+                raw_cursor = cursor.cursor
+                if hasattr(raw_cursor, 'copy_expert'):
+                    raw_cursor.copy_expert(sql, fp)
+                else:
+                    with raw_cursor.copy(sql) as copy:
+                        for data in copy:
+                            fp.write(data)
+
+
+def restore_copy(path: str, models: List, using: str):
+    """
+    Restore tables of models with COPY FROM STDIN.
+    """
+    quote_name = connections[using].ops.quote_name
+    for model_class in models:
+        sql = f'COPY {quote_name(model_class._meta.db_table)} FROM STDIN'
+        with open(os.path.join(path, f'{model_class._meta.db_table}.copy'), 'rb') as fp:
+            with connections[using].cursor() as cursor:
+                raw_cursor = cursor.cursor
+                if hasattr(raw_cursor, 'copy_expert'):
+                    raw_cursor.copy_expert(sql, fp)
+                else:
+                    with raw_cursor.copy(sql) as copy:
+                        for data in iter(partial(fp.read, 65536), b''):
+                            copy.write(data)
+
+
+def dump_serialized(path: str, models: List, using: str):
+    """
+    Dump records of models with django json serializer.
+    """
+    for model_class in models:
+        with open(os.path.join(path, f'{model_class._meta.label_lower}.json'), 'w') as fp:
+            queryset = model_class._base_manager.using(using).order_by(model_class._meta.pk.name)
+            serializers.serialize('json', queryset, stream=fp)
+
+
+def restore_serialized(path: str, models: List, using: str):
+    """
+    Restore records of models with django json serializer.
+    """
+    for model_class in models:
+        with open(os.path.join(path, f'{model_class._meta.label_lower}.json'), 'r') as fp:
+            for deserialized_object in serializers.deserialize('json', fp, using=using):
+                deserialized_object.save(using=using)
+
+
+DUMPERS = {
+    'sqlite': (dump_sqlite, restore_sqlite),
+    'postgresql': (dump_copy, restore_copy),
+}
+
+
+def get_dumper(using: str):
+    """
+    Return (dump, restore) functions for database: file copy for SQLite, COPY for PostgreSQL
+    and django serializers for other databases.
+    """
+    return DUMPERS.get(connections[using].vendor, (dump_serialized, restore_serialized))
+
+
+class Snapshot:
+    """
+    Records of generated models stored in cache directory under key of generation.
+    Every database is stored in its own directory, snapshot is complete only after all of them are dumped.
+    Whole tables are dumped and restored with primary keys of records, so they should be empty
+    before generating and restoring. Files of FileField and ImageField aren't stored.
+    :param directory: Path to cache directory.
+    :param key: Key of snapshot, e.g. get_snapshot_key result.
+    """
+    def __init__(self, directory: str, key: str):
+        self.directory = directory
+        self.key = key
+        self.path = os.path.join(directory, key)
+
+    def exists(self, models_by_database: Dict[str, List]=None) -> bool:
+        """
+        Return True if snapshot is saved, including directories of all databases of models_by_database.
+        """
+        databases = models_by_database or {}
+        return os.path.isdir(self.path) and all(
+            os.path.isdir(os.path.join(self.path, using)) for using in databases
+        )
+
+    def save(self, models_by_database: Dict[str, List]):
+        """
+        Dump records of models of every database.
+        :param models_by_database: Dict of {database alias: models}, e.g. get_snapshot_models result.
+        """
+        tmp_path = f'{self.path}.tmp'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        for using, models in models_by_database.items():
+            database_path = os.path.join(tmp_path, using)
+            os.makedirs(database_path)
+            dump, restore = get_dumper(using)
+            dump(database_path, models, using)
+        # Incomplete snapshot is replaced.
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.replace(tmp_path, self.path)
+
+    def restore(self, models_by_database: Dict[str, List]):
+        """
+        Insert dumped records of models of every database and reset sequences of their primary keys.
+        Records keep their primary keys, so tables should be empty, see get_non_empty_models.
+        :param models_by_database: Dict of {database alias: models}, e.g. get_snapshot_models result.
+        """
+        for using, models in models_by_database.items():
+            dump, restore = get_dumper(using)
+            restore(os.path.join(self.path, using), models, using)
+            connection = connections[using]
+            sequence_sql = connection.ops.sequence_reset_sql(no_style(), models)
+            if sequence_sql:
+                with connection.cursor() as cursor:
+                    for sql in sequence_sql:
+                        cursor.execute(sql)
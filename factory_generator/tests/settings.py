@@ -24,7 +24,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': "mem_db"
-    }
+    },
+    'other': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': "other_mem_db"
+    },
 }
 
 SITE_ID = 1
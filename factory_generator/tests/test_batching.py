@@ -0,0 +1,85 @@
+from django.test import TestCase, override_settings
+
+import factory
+
+from factory_generator import generators
+from factory_generator.batching import Batched, get_batched_overrides, peek_sequence
+
+from factory_generator.tests.testapp.factories import PersonFactory
+from factory_generator.tests.testapp.models import City, Person
+
+import shutil
+import tempfile
+
+
+class FakerCityFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = City
+
+    title = factory.Faker('city')
+
+
+class FakerPersonFactory(PersonFactory):
+    name = factory.Faker('first_name')
+    company__name = factory.Faker('company')
+
+
+class TestBatchedOverrides(TestCase):
+
+    def test_overrides(self):
+        overrides = get_batched_overrides(FakerPersonFactory, 3)
+        self.assertEqual(set(overrides), {'name', 'phone', 'company__name'})
+        self.assertTrue(all(isinstance(d, Batched) for d in overrides.values()))
+
+    def test_exclude(self):
+        overrides = get_batched_overrides(FakerPersonFactory, 3, exclude=['name'])
+        self.assertEqual(set(overrides), {'phone', 'company__name'})
+
+    def test_skip_dynamic_declarations(self):
+        class DynamicFactory(factory.DictFactory):
+            length = 5
+            code = factory.Faker('pystr', max_chars=factory.SelfAttribute('length'))
+            title = factory.LazyAttributeSequence(lambda obj, n: f'{obj.length}-{n}')
+
+        self.assertEqual(get_batched_overrides(DynamicFactory, 3), {})
+
+    def test_sequence(self):
+        start = peek_sequence(FakerPersonFactory)
+        overrides = get_batched_overrides(FakerPersonFactory, 3)
+        persons = FakerPersonFactory.build_batch(3, **overrides)
+        self.assertEqual([p.phone for p in persons], ['123-555-%04d' % (start + i) for i in range(3)])
+        self.assertEqual(peek_sequence(FakerPersonFactory), start + 3)
+
+
+class TestBatchedGenerators(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_generate_to_json(self):
+        records = generators.generate_to_json(FakerPersonFactory, quantity=5, batched=True)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(len({r['phone'] for r in records}), 5)
+        for record in records:
+            self.assertEqual(record['email'], f"{record['name']}@example.com")
+
+    def test_generate_to_json_with_overrides(self):
+        records = generators.generate_to_json(FakerCityFactory, quantity=3, batched=True, title='Paris')
+        self.assertEqual([r['title'] for r in records], ['Paris'] * 3)
+
+    def test_generate_to_db(self):
+        created = generators.generate_to_db(FakerPersonFactory, quantity=5, batched=True, batch_size=2)
+        self.assertEqual(len(created), 5)
+        self.assertEqual(Person.objects.values('phone').distinct().count(), 5)
+
+    def test_generate_to_db_bulk(self):
+        created = generators.generate_to_db(FakerCityFactory, quantity=5, bulk=True, batched=True,
+                                            batch_size=2)
+        self.assertEqual(created, 5)
+        self.assertEqual(City.objects.exclude(title='').count(), 5)
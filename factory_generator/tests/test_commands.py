@@ -1,27 +1,44 @@
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from factory_generator.encoders import DjangoFileJsonEncoder
+from django.db.models.signals import post_save
 from django.test import TestCase
 
+from factory_generator.bulk import DEFAULT_BATCH_SIZE
 from factory_generator.management.base import BaseGenerateCommand
 from factory_generator.management.commands.generate_to_db import Command \
     as GenerateToDbCommand
 from factory_generator.management.commands.generate_to_json import Command \
     as GenerateToJsonCommand
-from factory_generator.utils import Config, get_full_file_path
-from factory_generator.generators import generate_to_json
+from factory_generator.profiling import Profiler
+from factory_generator.signals import post_generate
+from factory_generator.utils import Config, FactoryQuantity, get_full_file_path, ALL_FACTORIES
+from factory_generator.generators import generate_to_db, generate_to_json, BULK
 
-from factory_generator.tests.testapp.factories import CityFactory
-from factory_generator.tests.testapp.models import City
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory, PersonFactory
+from factory_generator.tests.testapp.models import City, Company, Person
 
+import factory
 from faker import Faker
+import gzip
 import json
+import os
+import shutil
+import tempfile
+import time
 from unittest.mock import patch, Mock
 
 
 fake = Faker()
 
 
+class FakerCityFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = City
+
+    title = factory.Faker('city')
+
+
 class TestBaseGenerateCmd(TestCase):
 
     def setUp(self):
@@ -155,6 +172,35 @@ class TestBaseGenerateCmd(TestCase):
         tested_call_kwargs = mock_generate.call_args[1]
         self.assertEqual(tested_call_kwargs['update'], expected_update)
 
+    @patch('factory_generator.management.base.utils.load_file_config')
+    @patch('factory_generator.management.base.BaseGenerateCommand.generate')
+    def test_call_generate_with_factory_quantities(self, mock_generate, mock_load_config):
+        mock_generate.return_value = ''
+        mock_load_config.return_value = Config(
+            labels=['testapp.CityFactory', 'testapp.CompanyFactory'], exclude=[], update=False, quantity=2,
+            factory_quantities={
+                'testapp.CompanyFactory': FactoryQuantity(per='testapp.CityFactory', ratio=5),
+            },
+        )
+        call_command(self.cmd, file=fake.file_name(extension='ini'))
+        tested_call_kwargs = mock_generate.call_args[1]
+        self.assertEqual(tested_call_kwargs['quantities'], {CityFactory: 2, CompanyFactory: 10})
+
+    @patch('factory_generator.management.base.utils.load_file_config')
+    @patch('factory_generator.management.base.BaseGenerateCommand.generate')
+    def test_call_generate_with_target_quantities(self, mock_generate, mock_load_config):
+        mock_generate.return_value = ''
+        mock_load_config.return_value = Config(
+            labels=['testapp.CityFactory', 'testapp.CompanyFactory'], exclude=[], update=False, quantity=2,
+            target=4,
+            factory_quantities={
+                'testapp.CompanyFactory': FactoryQuantity(per='testapp.CityFactory', ratio=5),
+            },
+        )
+        call_command(self.cmd, file=fake.file_name(extension='ini'))
+        tested_call_kwargs = mock_generate.call_args[1]
+        self.assertEqual(tested_call_kwargs['quantities'], {CityFactory: 4, CompanyFactory: 20})
+
 
 class TestGenerateToDbCmd(TestCase):
 
@@ -167,7 +213,8 @@ class TestGenerateToDbCmd(TestCase):
         factories = [expected_factory]
         self.cmd.generate(factories)
         mock_generate.assert_called_once()
-        mock_generate.assert_called_with(expected_factory, quantity=1)
+        mock_generate.assert_called_with(expected_factory, quantity=1, loader='orm',
+                                         batch_size=DEFAULT_BATCH_SIZE, batched=False)
 
     @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
     @patch('factory_generator.management.commands.generate_to_db.utils.delete_by_factory')
@@ -179,7 +226,8 @@ class TestGenerateToDbCmd(TestCase):
         mock_delete.assert_called_once()
         mock_delete.assert_called_with(expected_factory)
         mock_generate.assert_called_once()
-        mock_generate.assert_called_with(expected_factory, quantity=1)
+        mock_generate.assert_called_with(expected_factory, quantity=1, loader='orm',
+                                         batch_size=DEFAULT_BATCH_SIZE, batched=False)
 
     @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
     def test_generate_with_quantity(self, mock_generate):
@@ -188,7 +236,161 @@ class TestGenerateToDbCmd(TestCase):
         factories = [expected_factory]
         self.cmd.generate(factories, quantity=expected_quantity)
         mock_generate.assert_called_once()
-        mock_generate.assert_called_with(expected_factory, quantity=expected_quantity)
+        mock_generate.assert_called_with(expected_factory, quantity=expected_quantity, loader='orm',
+                                         batch_size=DEFAULT_BATCH_SIZE, batched=False)
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_generate_bulk(self, mock_generate):
+        expected_factory = CityFactory
+        expected_batch_size = fake.pyint(min_value=1)
+        self.cmd.generate([expected_factory], bulk=True, batch_size=expected_batch_size)
+        mock_generate.assert_called_once()
+        mock_generate.assert_called_with(expected_factory, quantity=1, loader='bulk',
+                                         batch_size=expected_batch_size, batched=False)
+
+    def test_copy_loader_fallback(self):
+        self.cmd.stdout = Mock()
+        self.cmd.stderr = Mock()
+        self.cmd.generate([CityFactory], quantity=3, loader='copy')
+        self.assertEqual(City.objects.count(), 3)
+        self.assertIn('COPY', self.cmd.stderr.write.call_args[0][0])
+
+    def test_unknown_loader(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], loader='insert')
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_file_pool(self, mock_generate):
+        self.cmd.stdout = Mock()
+        self.cmd.generate([PersonFactory], file_pool=3)
+        tested_call_kwargs = mock_generate.call_args[1]
+        self.assertEqual(tested_call_kwargs['photo'].size, 3)
+        self.assertEqual(tested_call_kwargs['passport_scan'].size, 3)
+
+    @patch('factory_generator.management.commands.generate_to_db.Command.generate')
+    def test_loader_option(self, mock_generate):
+        mock_generate.return_value = ''
+        call_command(self.cmd, 'testapp.CityFactory', loader='copy')
+        self.assertEqual(mock_generate.call_args[1]['loader'], 'copy')
+
+    @patch('factory_generator.management.commands.generate_to_db.Command.generate')
+    def test_bulk_options(self, mock_generate):
+        mock_generate.return_value = ''
+        expected_batch_size = fake.pyint(min_value=1)
+        call_command(self.cmd, 'testapp.CityFactory', bulk=True, batch_size=expected_batch_size)
+        tested_call_kwargs = mock_generate.call_args[1]
+        self.assertTrue(tested_call_kwargs['bulk'])
+        self.assertEqual(tested_call_kwargs['batch_size'], expected_batch_size)
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    @patch('factory_generator.management.commands.generate_to_db.utils.delete_by_factory')
+    def test_generate_in_dependency_order(self, mock_delete, mock_generate):
+        mock_delete.return_value = (0, {})
+        self.cmd.generate([CompanyFactory, CityFactory], update=True)
+        self.assertEqual([c[0][0] for c in mock_generate.call_args_list], [CityFactory, CompanyFactory])
+        self.assertEqual([c[0][0] for c in mock_delete.call_args_list], [CompanyFactory, CityFactory])
+
+    def test_generate_with_pools(self):
+        self.cmd.stdout = Mock()
+        self.cmd.generate([CompanyFactory], quantity=5, pools=['testapp.CompanyFactory.city=2'])
+        self.assertEqual(City.objects.count(), 2)
+        self.assertEqual(Company.objects.count(), 5)
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_commit_every(self, mock_generate):
+        self.cmd.generate([CityFactory], quantity=5, commit_every=2)
+        self.assertEqual([c[1]['quantity'] for c in mock_generate.call_args_list], [2, 2, 1])
+
+    def test_checkpoint_without_commit_every(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], checkpoint=fake.file_name(extension='json'))
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_resume_from_checkpoint(self, mock_generate):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = os.path.join(tmp_dir, 'checkpoint.json')
+            mock_generate.side_effect = [None, Exception()]
+            with self.assertRaises(Exception):
+                self.cmd.generate([CityFactory], quantity=5, commit_every=2, checkpoint=checkpoint)
+            with open(checkpoint) as fp:
+                self.assertEqual(json.load(fp)['created'], {'testapp.CityFactory': 2})
+
+            mock_generate.reset_mock()
+            mock_generate.side_effect = None
+            self.cmd.generate([CityFactory], quantity=5, commit_every=2, checkpoint=checkpoint)
+            self.assertEqual([c[1]['quantity'] for c in mock_generate.call_args_list], [2, 1])
+            self.assertFalse(os.path.exists(checkpoint))
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    @patch('factory_generator.management.commands.generate_to_db.utils.delete_by_factory')
+    def test_resume_without_deleting(self, mock_delete, mock_generate):
+        mock_delete.return_value = (0, {})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = os.path.join(tmp_dir, 'checkpoint.json')
+            mock_generate.side_effect = Exception()
+            with self.assertRaises(Exception):
+                self.cmd.generate([CityFactory], update=True, commit_every=1, checkpoint=checkpoint)
+            mock_generate.side_effect = None
+            self.cmd.generate([CityFactory], update=True, commit_every=1, checkpoint=checkpoint)
+        mock_delete.assert_called_once()
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    @patch('factory_generator.management.commands.generate_to_db.truncate_by_factories')
+    def test_generate_with_truncate(self, mock_truncate, mock_generate):
+        mock_truncate.return_value = {'testapp.City': 1}
+        self.cmd.stdout = Mock()
+        self.cmd.generate([CityFactory], update=True, update_strategy='truncate')
+        mock_truncate.assert_called_once_with([CityFactory])
+        mock_generate.assert_called_once()
+
+    def test_unknown_update_strategy(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], update=True, update_strategy='drop')
+
+    def test_mute_signals(self):
+        receiver = Mock()
+        post_generate_receiver = Mock()
+        post_save.connect(receiver, sender=City)
+        post_generate.connect(post_generate_receiver, sender=City)
+        self.addCleanup(post_save.disconnect, receiver, sender=City)
+        self.addCleanup(post_generate.disconnect, post_generate_receiver, sender=City)
+        self.cmd.stdout = Mock()
+
+        self.cmd.generate([CityFactory], quantity=3, mute_signals=['testapp.CityFactory'])
+        receiver.assert_not_called()
+        post_generate_receiver.assert_called_once()
+        self.assertEqual(post_generate_receiver.call_args[1]['quantity'], 3)
+        self.assertEqual(post_generate_receiver.call_args[1]['factory_class'], CityFactory)
+
+        self.cmd.generate([CityFactory], quantity=3, mute_signals=['testapp.CompanyFactory'])
+        self.assertEqual(receiver.call_count, 3)
+
+    @patch('factory_generator.management.commands.generate_to_db.Command.generate')
+    def test_mute_signals_option(self, mock_generate):
+        mock_generate.return_value = ''
+        call_command(self.cmd, 'testapp.CityFactory', mute_signals=[ALL_FACTORIES])
+        self.assertEqual(mock_generate.call_args[1]['mute_signals'], [ALL_FACTORIES])
+
+    def test_profile(self):
+        self.cmd.stdout = Mock()
+        self.cmd.stderr = Mock()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'profile.json')
+            call_command(self.cmd, 'testapp.CityFactory', quantity=2, profile=True, profile_output=output)
+            with open(output) as fp:
+                tested_data = json.load(fp)
+        self.assertEqual(tested_data['factories'][0]['factory'], 'testapp.CityFactory')
+        self.assertEqual(tested_data['factories'][0]['rows'], 2)
+        self.assertIn('testapp.CityFactory', self.cmd.stderr.write.call_args[0][0])
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_generate_with_quantities(self, mock_generate):
+        self.cmd.stdout = Mock()
+        self.cmd.generate([CityFactory, CompanyFactory], quantity=3, quantities={CityFactory: 7})
+        self.assertEqual(
+            [(c[0][0], c[1]['quantity']) for c in mock_generate.call_args_list],
+            [(CityFactory, 7), (CompanyFactory, 3)]
+        )
 
     @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
     def test_atomic(self, mock_generate):
@@ -199,6 +401,240 @@ class TestGenerateToDbCmd(TestCase):
             self.cmd.generate(factories, update=True)
         self.assertTrue(City.objects.filter(pk=expected_city.pk).exists())
 
+    def test_target(self):
+        CityFactory.create_batch(2)
+        self.cmd.generate([CityFactory], quantity=1, target=5)
+        self.assertEqual(City.objects.count(), 5)
+        self.cmd.generate([CityFactory], quantity=1, target=5)
+        self.assertEqual(City.objects.count(), 5)
+
+    def test_target_with_update(self):
+        CityFactory.create_batch(2)
+        self.cmd.generate([CityFactory], update=True, target=3, commit_every=2)
+        self.assertEqual(City.objects.count(), 3)
+
+    def test_target_quantities(self):
+        CityFactory.create_batch(2)
+        self.cmd.generate([CityFactory, CompanyFactory], target=3,
+                          quantities={CityFactory: 4, CompanyFactory: 1})
+        self.assertEqual(City.objects.count(), 4)
+        self.assertEqual(Company.objects.count(), 1)
+
+    def test_target_of_parents(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = self.settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.cmd.generate([CityFactory, CompanyFactory, PersonFactory], target=3, loader=BULK)
+        self.assertEqual(City.objects.count(), 3)
+        self.assertEqual(Company.objects.count(), 3)
+        self.assertEqual(Person.objects.count(), 3)
+        self.cmd.generate([CityFactory, PersonFactory], target=5, commit_every=2)
+        self.assertEqual(City.objects.count(), 5)
+        # Company isnt generated, so people create new companies and reuse cities.
+        self.assertEqual(Company.objects.count(), 5)
+        self.assertEqual(Person.objects.count(), 5)
+
+    @patch('factory_generator.management.commands.generate_to_db.supports_concurrent_writes',
+           return_value=True)
+    @patch('factory_generator.management.commands.generate_to_db.run_in_connections')
+    def test_target_with_connections(self, mock_run, mock_supports):
+        # Tasks run in main thread, because in memory database isnt shared between threads.
+        mock_run.side_effect = lambda tasks, connections: [
+            {'tasks': len(tasks), 'rows': sum(task() for task in tasks), 'seconds': 0.0}
+        ] + [{'tasks': 0, 'rows': 0, 'seconds': 0.0}] * (connections - 1)
+        CityFactory.create_batch(2)
+        self.cmd.generate([CityFactory, CompanyFactory], target=4, connections=2)
+        self.assertEqual(City.objects.count(), 4)
+        self.assertEqual(Company.objects.count(), 4)
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db',
+           side_effect=generate_to_db)
+    def test_snapshot(self, mock_generate):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        self.cmd.generate([CityFactory, CompanyFactory], quantity=2, snapshot_dir=snapshot_dir)
+        self.assertEqual(mock_generate.call_count, 2)
+        titles = sorted(City.objects.values_list('title', flat=True))
+
+        self.cmd.generate([CityFactory, CompanyFactory], quantity=2, update=True,
+                          snapshot_dir=snapshot_dir)
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertEqual(sorted(City.objects.values_list('title', flat=True)), titles)
+        self.assertEqual(Company.objects.count(), 2)
+
+        self.cmd.generate([CityFactory, CompanyFactory], quantity=3, update=True,
+                          snapshot_dir=snapshot_dir)
+        self.assertEqual(mock_generate.call_count, 4)
+        self.assertEqual(Company.objects.count(), 3)
+
+    def test_snapshot_with_existing_records(self):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        CityFactory.create_batch(5)
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], quantity=3, snapshot_dir=snapshot_dir)
+        self.assertEqual(City.objects.count(), 5)
+        # Cities created by SubFactory arent deleted by update of CompanyFactory.
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CompanyFactory], quantity=3, update=True, snapshot_dir=snapshot_dir)
+
+        self.cmd.generate([CityFactory], quantity=3, update=True, snapshot_dir=snapshot_dir)
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], quantity=3, snapshot_dir=snapshot_dir)
+        self.assertEqual(City.objects.count(), 3)
+        self.cmd.generate([CityFactory], quantity=3, update=True, snapshot_dir=snapshot_dir)
+        self.assertEqual(City.objects.count(), 3)
+
+    def test_snapshot_with_checkpoint(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], snapshot_dir='snapshots', commit_every=1,
+                              checkpoint='progress.json')
+
+    def test_snapshot_with_target(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], snapshot_dir='snapshots', target=2)
+
+    def test_seed(self):
+        self.cmd.generate([FakerCityFactory], quantity=3, seed=1)
+        expected_titles = list(City.objects.order_by('pk').values_list('title', flat=True))
+        self.cmd.generate([FakerCityFactory], quantity=3, update=True, seed=1, commit_every=2)
+        self.assertEqual(list(City.objects.order_by('pk').values_list('title', flat=True))[:2],
+                         expected_titles[:2])
+        self.cmd.generate([FakerCityFactory], quantity=3, update=True, seed=1, commit_every=2)
+        titles = list(City.objects.order_by('pk').values_list('title', flat=True))
+        self.cmd.generate([FakerCityFactory], quantity=3, update=True, seed=1, commit_every=2)
+        self.assertEqual(list(City.objects.order_by('pk').values_list('title', flat=True)), titles)
+
+    def test_seed_with_connections(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], seed=1, connections=2)
+
+    def test_target_with_checkpoint(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], commit_every=1, checkpoint='progress.json', target=2)
+
+    @patch('factory_generator.management.commands.generate_to_db.Command.generate')
+    def test_target_option(self, mock_generate):
+        mock_generate.return_value = ''
+        call_command(self.cmd, 'testapp.CityFactory', target=10)
+        self.assertEqual(mock_generate.call_args[1]['target'], 10)
+
+
+class TestGenerateToDbCmdDatabases(TestCase):
+    databases = {'default', 'other'}
+
+    def setUp(self):
+        self.cmd = GenerateToDbCommand()
+        self.cmd.stdout = Mock()
+        self.cmd.stderr = Mock()
+
+    def test_database(self):
+        self.cmd.generate([CompanyFactory], quantity=2, database='other')
+        self.cmd.generate([CompanyFactory], quantity=3, database='other', bulk=True)
+        self.assertEqual(Company.objects.using('other').count(), 5)
+        self.assertEqual(City.objects.using('other').count(), 5)
+        self.assertFalse(Company.objects.exists())
+        self.assertEqual(CompanyFactory._meta.database, 'default')
+
+    def test_update_database(self):
+        CityFactory._meta.model.objects.using('other').create(title='Moscow')
+        CityFactory.create()
+        self.cmd.generate([CityFactory], quantity=2, update=True, database='other')
+        self.assertEqual(City.objects.using('other').count(), 2)
+        self.assertEqual(City.objects.count(), 1)
+
+    def test_transaction_of_every_database(self):
+        class OtherCityFactory(CityFactory):
+            class Meta:
+                database = 'other'
+
+        generate_factory = self.cmd.generate_factory
+
+        def generate_or_fail(factory_class, *args, **kwargs):
+            if factory_class is CompanyFactory:
+                raise ValueError()
+            return generate_factory(factory_class, *args, **kwargs)
+
+        with patch.object(self.cmd, 'generate_factory', side_effect=generate_or_fail):
+            with self.assertRaises(ValueError):
+                self.cmd.generate([OtherCityFactory, CompanyFactory], quantity=2)
+        self.assertFalse(City.objects.using('other').exists())
+
+    def test_snapshot_of_database(self):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        self.cmd.generate([CityFactory], quantity=2, database='other', snapshot_dir=snapshot_dir)
+        self.cmd.generate([CityFactory], quantity=2, snapshot_dir=snapshot_dir)
+        self.assertEqual(len(os.listdir(snapshot_dir)), 2)
+        self.assertEqual(City.objects.using('other').count(), 2)
+        self.assertEqual(City.objects.count(), 2)
+
+    def test_snapshot_without_database_directory(self):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        self.cmd.generate([CityFactory], quantity=2, snapshot_dir=snapshot_dir)
+        snapshot_path = os.path.join(snapshot_dir, os.listdir(snapshot_dir)[0])
+        shutil.rmtree(os.path.join(snapshot_path, 'default'))
+        self.cmd.generate([CityFactory], quantity=2, update=True, snapshot_dir=snapshot_dir)
+        self.assertEqual(City.objects.count(), 2)
+        self.assertTrue(os.path.isdir(os.path.join(snapshot_path, 'default')))
+
+    @patch('factory_generator.management.commands.generate_to_db.Command.generate')
+    def test_database_options(self, mock_generate):
+        mock_generate.return_value = ''
+        call_command(self.cmd, 'testapp.CityFactory', database='other', connections=4)
+        self.assertEqual(mock_generate.call_args[1]['database'], 'other')
+        self.assertEqual(mock_generate.call_args[1]['connections'], 4)
+
+    def test_connections_without_concurrent_writes(self):
+        self.cmd.generate([CityFactory], quantity=3, connections=2)
+        self.assertEqual(City.objects.count(), 3)
+        self.assertIn('concurrent writes', self.cmd.stderr.write.call_args[0][0])
+
+    def test_connections_with_checkpoint(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], commit_every=1, checkpoint='progress.json', connections=2)
+
+    @patch('factory_generator.management.commands.generate_to_db.supports_concurrent_writes')
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_connections(self, mock_generate, mock_supports):
+        mock_supports.return_value = True
+        receiver = Mock()
+        post_generate.connect(receiver, sender=Company)
+        self.addCleanup(post_generate.disconnect, receiver, sender=Company)
+
+        self.cmd.generate([CityFactory, CompanyFactory], quantity=5, connections=2)
+        calls = [(c[0][0], c[1]['quantity']) for c in mock_generate.call_args_list]
+        self.assertEqual(sorted(calls[:2], key=lambda c: c[1]), [(CityFactory, 2), (CityFactory, 3)])
+        self.assertEqual(sorted(calls[2:], key=lambda c: c[1]), [(CompanyFactory, 2), (CompanyFactory, 3)])
+        self.assertEqual(receiver.call_args[1]['quantity'], 5)
+        messages = [c[0][0] for c in self.cmd.stdout.write.call_args_list]
+        connection_messages = [m for m in messages if m.startswith('Connection')]
+        self.assertEqual(len(connection_messages), 2)
+        rows = sum(int(m.split(': ')[1].split(' ')[0]) for m in connection_messages)
+        self.assertEqual(rows, 10)
+
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_level_rate_of_every_factory(self, mock_generate):
+        mock_generate.side_effect = lambda factory_class, **kwargs: (
+            time.sleep(0.2) if factory_class is FakerCityFactory else None
+        )
+        quantities = {CityFactory: 2, FakerCityFactory: 2}
+        self.cmd.generate_level([CityFactory, FakerCityFactory], quantities, 1)
+        messages = [c[0][0] for c in self.cmd.stdout.write.call_args_list]
+        elapsed = [float(m.split(' in ')[1].split('s ')[0]) for m in messages]
+        self.assertLess(elapsed[0], 0.2)
+        self.assertGreaterEqual(elapsed[1], 0.2)
+
+    @patch('factory_generator.management.commands.generate_to_db.supports_concurrent_writes')
+    @patch('factory_generator.management.commands.generate_to_db.generate_to_db')
+    def test_connections_commit_every(self, mock_generate, mock_supports):
+        mock_supports.return_value = True
+        self.cmd.generate([CityFactory], quantity=5, connections=2, commit_every=2)
+        self.assertEqual(sorted(c[1]['quantity'] for c in mock_generate.call_args_list), [1, 2, 2])
+
 
 class TestGenerateToJsonCmd(TestCase):
 
@@ -241,4 +677,98 @@ class TestGenerateToJsonCmd(TestCase):
         factories = [CityFactory]
         self.cmd.generate(factories, cls=expected_encoder)
         tested_call_kwargs = mock_dumps.call_args[1]
-        self.assertEqual(tested_call_kwargs['cls'], expected_encoder)
\ No newline at end of file
+        self.assertEqual(tested_call_kwargs['cls'], expected_encoder)
+
+    def test_write_to_file(self):
+        factories = [CityFactory]
+        expected_quantity = 3
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'fixture.json')
+            result = self.cmd.generate(factories, quantity=expected_quantity, output=output)
+            with open(output) as fp:
+                tested_data = json.load(fp)
+        self.assertIsNone(result)
+        self.assertEqual(len(tested_data), expected_quantity)
+        for tested in tested_data:
+            self.assertEqual(tested['model'], CityFactory._meta.model._meta.label_lower)
+            self.assertEqual(tested['fields'], generate_to_json(CityFactory)[0])
+
+    @patch('factory_generator.management.commands.generate_to_json.Command.write')
+    def test_output_option(self, mock_write):
+        mock_write.return_value = None
+        expected_output = fake.file_name(extension='json')
+        call_command(self.cmd, 'testapp.CityFactory', output=expected_output)
+        self.assertEqual(mock_write.call_args[0][1], expected_output)
+
+    def test_profile(self):
+        self.cmd.stderr = Mock()
+        self.cmd.profiler = Profiler()
+        with self.cmd.profiler.enable():
+            self.cmd.generate([CompanyFactory], quantity=2)
+        factories = self.cmd.profiler.get_factories_stats()
+        self.assertEqual([s['factory'] for s in factories], ['testapp.CompanyFactory'])
+        self.assertEqual(factories[0]['rows'], 2)
+        attributes = {s['attribute'] for s in self.cmd.profiler.get_declarations_stats()}
+        self.assertIn('city', attributes)
+
+    def test_generate_with_quantities(self):
+        tested_data = json.loads(self.cmd.generate([CityFactory, CompanyFactory], quantity=1,
+                                                   quantities={CityFactory: 3}))
+        models = [record['model'] for record in tested_data]
+        self.assertEqual(models.count(CityFactory._meta.model._meta.label_lower), 3)
+        self.assertEqual(models.count(CompanyFactory._meta.model._meta.label_lower), 1)
+
+    def test_generate_jsonl(self):
+        tested_lines = self.cmd.generate([CityFactory], quantity=3, output_format='jsonl').splitlines()
+        self.assertEqual(len(tested_lines), 3)
+        for line in tested_lines:
+            self.assertEqual(json.loads(line)['model'], CityFactory._meta.model._meta.label_lower)
+
+    def test_write_shards(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'fixture.json.gz')
+            self.cmd.generate([CityFactory], quantity=5, output=output, shard_size=2, compression='gzip')
+            self.assertEqual(
+                sorted(os.listdir(tmp_dir)),
+                ['fixture-00000.json.gz', 'fixture-00001.json.gz', 'fixture-00002.json.gz']
+            )
+            with gzip.open(os.path.join(tmp_dir, 'fixture-00002.json.gz'), 'rt') as fp:
+                self.assertEqual(len(json.load(fp)), 1)
+
+    def test_shards_without_output(self):
+        with self.assertRaises(CommandError):
+            self.cmd.generate([CityFactory], shard_size=2)
+
+    @patch('factory_generator.management.commands.generate_to_json.Command.write')
+    def test_format_options(self, mock_write):
+        mock_write.return_value = None
+        call_command(self.cmd, 'testapp.CityFactory', output='data.jsonl.gz', format='jsonl',
+                     shard_size=10, compression='gzip')
+        tested_call_kwargs = mock_write.call_args[1]
+        self.assertEqual(tested_call_kwargs['output_format'], 'jsonl')
+        self.assertEqual(tested_call_kwargs['shard_size'], 10)
+        self.assertEqual(tested_call_kwargs['compression'], 'gzip')
+
+    def test_generate_with_seed(self):
+        kwargs = {'quantity': 5, 'chunk_size': 2, 'seed': 1}
+        expected_data = json.loads(self.cmd.generate([FakerCityFactory], **kwargs))
+        self.assertEqual(len(expected_data), 5)
+        self.assertEqual(json.loads(self.cmd.generate([FakerCityFactory], **kwargs)), expected_data)
+        parallel_data = json.loads(self.cmd.generate([FakerCityFactory], workers=2, **kwargs))
+        self.assertEqual(parallel_data, expected_data)
+        other_data = json.loads(self.cmd.generate([FakerCityFactory], quantity=5, seed=2))
+        self.assertNotEqual(other_data, expected_data)
+
+    @patch('factory_generator.management.commands.generate_to_json.Command.generate')
+    def test_seed_option(self, mock_generate):
+        mock_generate.return_value = ''
+        call_command(self.cmd, 'testapp.CityFactory', seed=7)
+        self.assertEqual(mock_generate.call_args[1]['seed'], 7)
+
+    def test_generate_with_workers(self):
+        expected_quantity = 5
+        tested_data = json.loads(self.cmd.generate([CityFactory], quantity=expected_quantity, workers=2,
+                                                   chunk_size=2))
+        self.assertEqual(len(tested_data), expected_quantity)
+        for tested in tested_data:
+            self.assertEqual(tested['model'], CityFactory._meta.model._meta.label_lower)
@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+import factory
+
+from factory_generator.concurrency import run_in_connections, thread_safe_sequences
+
+import threading
+
+
+class SequenceFactory(factory.DictFactory):
+    number = factory.Sequence(lambda n: n)
+
+
+class TestRunInConnections(TestCase):
+
+    def test_run(self):
+        threads = set()
+
+        def task():
+            threads.add(threading.current_thread().name)
+            return 10
+
+        stats = run_in_connections([task] * 6, 3)
+        self.assertEqual([s['connection'] for s in stats], [1, 2, 3])
+        self.assertEqual(sum(s['tasks'] for s in stats), 6)
+        self.assertEqual(sum(s['rows'] for s in stats), 60)
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_raise_error(self):
+        def task():
+            raise ValueError('Failed')
+
+        with self.assertRaises(ValueError):
+            run_in_connections([task] * 3, 2)
+
+
+class TestThreadSafeSequences(TestCase):
+
+    def test_unique_sequences(self):
+        numbers = []
+
+        def build():
+            numbers.extend(SequenceFactory.build()['number'] for i in range(1000))
+
+        with thread_safe_sequences([SequenceFactory]):
+            threads = [threading.Thread(target=build) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(set(numbers)), 4000)
+        self.assertNotIn('next', vars(SequenceFactory._meta._counter))
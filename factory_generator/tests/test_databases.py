@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from factory_generator.databases import get_databases, get_factories_tree, use_database
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory, PersonFactory
+from factory_generator.tests.testapp.models import City, Company
+
+
+class TestFactoriesTree(TestCase):
+
+    def test_tree(self):
+        self.assertEqual(get_factories_tree([PersonFactory]), {PersonFactory, CompanyFactory, CityFactory})
+        self.assertEqual(get_factories_tree([CityFactory]), {CityFactory})
+
+    def test_databases(self):
+        self.assertEqual(get_databases([PersonFactory]), ['default'])
+        with use_database([CompanyFactory], 'other'):
+            self.assertEqual(get_databases([PersonFactory]), ['default', 'other'])
+
+
+class TestUseDatabase(TestCase):
+    databases = {'default', 'other'}
+
+    def test_use_database(self):
+        with use_database([CompanyFactory], 'other'):
+            self.assertEqual(CompanyFactory._meta.database, 'other')
+            self.assertEqual(CityFactory._meta.database, 'other')
+            CompanyFactory.create()
+        self.assertEqual(CompanyFactory._meta.database, 'default')
+        self.assertEqual(CityFactory._meta.database, 'default')
+        self.assertEqual(Company.objects.using('other').count(), 1)
+        self.assertEqual(City.objects.using('other').count(), 1)
+        self.assertFalse(Company.objects.exists())
+
+    def test_without_database(self):
+        with use_database([CompanyFactory]):
+            self.assertEqual(CompanyFactory._meta.database, 'default')
+
+    def test_restore_on_error(self):
+        with self.assertRaises(ValueError):
+            with use_database([CompanyFactory], 'other'):
+                raise ValueError()
+        self.assertEqual(CompanyFactory._meta.database, 'default')
@@ -0,0 +1,66 @@
+from django.core.files.base import File
+from django.test import TestCase, override_settings
+
+import factory
+
+from factory_generator.files import CachedFile, get_file_overrides
+from factory_generator.generators import generate_to_db, generate_to_json
+
+from factory_generator.tests.testapp.factories import CityFactory, PersonFactory
+from factory_generator.tests.testapp.models import Person
+
+import os
+import shutil
+import tempfile
+
+
+class TestGetFileOverrides(TestCase):
+
+    def test_overrides(self):
+        overrides = get_file_overrides(PersonFactory, 2)
+        self.assertEqual(set(overrides), {'photo', 'passport_scan'})
+        self.assertEqual(overrides['photo'].size, 2)
+        self.assertEqual(overrides['photo'].field, Person._meta.get_field('photo'))
+        self.assertIsNone(get_file_overrides(PersonFactory, 2, store=False)['photo'].field)
+
+    def test_without_size(self):
+        self.assertEqual(get_file_overrides(PersonFactory, None), {})
+
+    def test_without_files(self):
+        self.assertEqual(get_file_overrides(CityFactory, 2), {})
+
+
+class TestCachedFile(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_reuse_payloads(self):
+        declaration = factory.django.FileField(data=factory.Sequence(lambda n: f'data {n % 2}'.encode()))
+        cached_file = CachedFile(declaration, 3)
+        generated = [factory.DictFactory.build(file=cached_file)['file'] for i in range(6)]
+        # Only two of three generated payloads are different.
+        self.assertEqual(len(cached_file.stored), 2)
+        self.assertTrue(all(isinstance(f, File) for f in generated))
+        self.assertIs(generated[0], generated[3])
+
+    def test_generate_to_db(self):
+        overrides = get_file_overrides(PersonFactory, 2)
+        generate_to_db(PersonFactory, quantity=5, **overrides)
+        # PersonFactory generates identical payloads, so they are saved once.
+        self.assertEqual(len({p.photo.name for p in Person.objects.all()}), 1)
+        self.assertEqual(len(os.listdir(self.media_root)), 2)
+        for person in Person.objects.all():
+            self.assertTrue(person.photo.storage.exists(person.photo.name))
+
+    def test_generate_to_json(self):
+        overrides = get_file_overrides(PersonFactory, 1, store=False)
+        records = generate_to_json(PersonFactory, quantity=4, **overrides)
+        self.assertEqual(len({id(r['photo']) for r in records}), 1)
+        self.assertEqual(os.listdir(self.media_root), [])
@@ -1,10 +1,20 @@
-from django.test import TestCase
+import django
+from django.test import TestCase, override_settings
 
+import asyncio
+import factory
+from factory.declarations import SubFactory
+import os
+import shutil
+import tempfile
+import time
+from unittest import skipIf, skipUnless
 from unittest.mock import patch
 
 from factory_generator import generators
 
 from factory_generator.tests.testapp.factories import CompanyFactory, PersonFactory, CityFactory
+from factory_generator.tests.testapp.models import City, Company, Person
 
 
 class TestDictGenerator(TestCase):
@@ -15,6 +25,54 @@ class TestDictGenerator(TestCase):
         self.assertTrue(isinstance(result['company'], dict))
         self.assertTrue(isinstance(result['company']['city'], dict))
 
+    def test_dict_factory_cached(self):
+        dict_factory = generators.get_dict_factory(PersonFactory)
+        self.assertIs(dict_factory, generators.get_dict_factory(PersonFactory))
+        self.assertIs(
+            dict_factory._meta.declarations['company'].get_factory(),
+            generators.get_dict_factory(CompanyFactory),
+        )
+
+    def test_dict_factory_created_once(self):
+        generators.get_dict_factory.cache_clear()
+        with patch('factory.make_factory', wraps=factory.make_factory) as make_factory:
+            for i in range(3):
+                generators.generate_to_dict(PersonFactory)
+        # Dict factories of PersonFactory, CompanyFactory and CityFactory.
+        self.assertEqual(make_factory.call_count, 3)
+
+    def test_sequence(self):
+        phones = [generators.generate_to_dict(PersonFactory)['phone'] for i in range(3)]
+        self.assertEqual(len(set(phones)), 3)
+
+
+@skipUnless(os.environ.get('FACTORY_GENERATOR_BENCHMARK_QUANTITY'), 'Benchmarks are disabled.')
+class TestDictGeneratorBenchmark(TestCase):
+    """
+    Compare generating of dicts with building of dynamic factory on every call.
+    Wall time depends on load of machine, so it runs only if FACTORY_GENERATOR_BENCHMARK_QUANTITY
+    is set, e.g. 100000.
+    """
+    quantity = int(os.environ.get('FACTORY_GENERATOR_BENCHMARK_QUANTITY', 0))
+
+    def build_dict(self, factory_class):
+        subs = {}
+        for name, declaration in factory_class._meta.declarations.items():
+            if isinstance(declaration, SubFactory):
+                subs[name] = self.build_dict(declaration.get_factory())
+        return factory.build(dict, FACTORY_CLASS=factory_class, **subs)
+
+    def measure(self, generate):
+        start_time = time.perf_counter()
+        for i in range(self.quantity):
+            generate(PersonFactory)
+        return time.perf_counter() - start_time
+
+    def test_faster_than_dynamic_factory(self):
+        dynamic_time = self.measure(self.build_dict)
+        cached_time = self.measure(generators.generate_to_dict)
+        self.assertLess(cached_time, dynamic_time)
+
 
 class TestJsonGenerator(TestCase):
 
@@ -32,6 +90,13 @@ class TestJsonGenerator(TestCase):
         result = generators.generate_to_json(CityFactory, quantity=expected_quantity)
         self.assertEqual(result, expected_data)
 
+    def test_iter_generate(self):
+        expected_quantity = 3
+        result = generators.iter_generate_to_json(CityFactory, quantity=expected_quantity)
+        self.assertFalse(isinstance(result, list))
+        expected = generators.generate_to_json(CityFactory, quantity=expected_quantity)
+        self.assertEqual(list(result), expected)
+
 
 class TestDbGenerator(TestCase):
 
@@ -48,3 +113,106 @@ class TestDbGenerator(TestCase):
         generators.generate_to_db(CompanyFactory, quantity=expected_quantity)
         mock_create.assert_called_once()
         mock_create.assert_called_with(expected_quantity)
+
+
+class TestBulkDbGenerator(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def test_bulk_create(self):
+        expected_quantity = 5
+        created = generators.generate_to_db(CityFactory, quantity=expected_quantity, bulk=True)
+        self.assertEqual(created, expected_quantity)
+        self.assertEqual(City.objects.count(), expected_quantity)
+
+    def test_bulk_create_by_batches(self):
+        expected_quantity = 5
+        with self.assertNumQueries(3):
+            generators.generate_to_db(CityFactory, quantity=expected_quantity, bulk=True, batch_size=2)
+        self.assertEqual(City.objects.count(), expected_quantity)
+
+    def test_bulk_create_sub_factories(self):
+        expected_quantity = 3
+        created = generators.generate_to_db(PersonFactory, quantity=expected_quantity, bulk=True)
+        self.assertEqual(created, expected_quantity * 3)
+        self.assertEqual(Person.objects.count(), expected_quantity)
+        self.assertEqual(Company.objects.count(), expected_quantity)
+        self.assertEqual(City.objects.count(), expected_quantity)
+        for person in Person.objects.select_related('company__city'):
+            self.assertTrue(person.company.city.pk)
+
+    def test_copy_loader_falls_back_to_bulk(self):
+        expected_quantity = 3
+        created = generators.generate_to_db(
+            PersonFactory, quantity=expected_quantity, loader=generators.COPY
+        )
+        self.assertEqual(created, expected_quantity * 3)
+        self.assertEqual(Person.objects.count(), expected_quantity)
+
+
+@skipIf(django.VERSION < generators.ASYNC_DB_DJANGO_VERSION, 'Async ORM isnt supported.')
+class TestAsyncGenerators(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    async def test_agenerate_to_json(self):
+        expected_quantity = 5
+        result = await generators.agenerate_to_json(PersonFactory, quantity=expected_quantity,
+                                                    chunk_size=2)
+        self.assertEqual(len(result), expected_quantity)
+        for item in result:
+            self.assertTrue(isinstance(item['company'], dict))
+
+    async def test_agenerate_to_db(self):
+        expected_quantity = 5
+        created = await generators.agenerate_to_db(PersonFactory, quantity=expected_quantity, batch_size=2)
+        self.assertEqual(created, expected_quantity * 3)
+        self.assertEqual(await Person.objects.acount(), expected_quantity)
+        self.assertEqual(await City.objects.acount(), expected_quantity)
+
+    async def test_agenerate_to_db_batched(self):
+        created = await generators.agenerate_to_db(CityFactory, quantity=3, batched=True, title='Moscow')
+        self.assertEqual(created, 3)
+        self.assertEqual(await City.objects.filter(title='Moscow').acount(), 3)
+
+    async def test_build_error(self):
+        def build(size):
+            raise ValueError('build failed')
+
+        with self.assertRaises(ValueError):
+            async for chunk in generators.aiter_built_chunks(build, quantity=5, chunk_size=2):
+                pass
+
+    async def test_bounded_queue(self):
+        built = []
+
+        def build(size):
+            built.append(size)
+            return [size]
+
+        chunks = generators.aiter_built_chunks(build, quantity=10, chunk_size=1, queue_size=1)
+        self.assertEqual(await chunks.__anext__(), [1])
+        await asyncio.sleep(0.05)
+        self.assertLessEqual(len(built), 3)
+        await chunks.aclose()
+
+    @patch('django.VERSION', (2, 2, 0, 'final', 0))
+    async def test_unsupported_django(self):
+        with self.assertRaises(RuntimeError):
+            await generators.agenerate_to_db(CityFactory)
+        with self.assertRaises(RuntimeError):
+            await generators.agenerate_to_json(CityFactory)
@@ -0,0 +1,91 @@
+from django.apps import apps as installed_apps
+from django.test import TestCase, override_settings
+
+from factory_generator import index, utils
+
+from factory_generator.tests.testapp import factories as sample_factories
+
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+
+class TestFactoriesIndexFile(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp_dir.name, 'factories_index.json')
+        self.settings_override = override_settings(FACTORY_GENERATOR_INDEX_FILE=self.index_path)
+        self.settings_override.enable()
+        self.app_config = installed_apps.get_app_config('testapp')
+        self.expected_factories = {
+            'CityFactory': sample_factories.CityFactory,
+            'CompanyFactory': sample_factories.CompanyFactory,
+            'PersonFactory': sample_factories.PersonFactory,
+        }
+        self.clear_cache()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.tmp_dir.cleanup()
+        self.clear_cache()
+
+    def clear_cache(self):
+        utils.get_factories_index.cache_clear()
+        index.load_index.cache_clear()
+
+    def test_write_index(self):
+        tested_factories = utils.get_factories_index(self.app_config)
+        self.assertEqual(tested_factories, self.expected_factories)
+        with open(self.index_path) as fp:
+            tested_index = json.load(fp)
+        entry = tested_index['apps']['testapp']
+        self.assertEqual(entry['signature'], index.get_module_signature(self.app_config))
+        self.assertEqual(entry['factories']['PersonFactory'], {
+            'module': sample_factories.__name__,
+            'qualname': 'PersonFactory',
+            'model': 'testapp.Person',
+        })
+
+    @patch('factory_generator.utils.scan_factories_module')
+    def test_read_index(self, mock_scan):
+        index.set_app_entry(self.index_path, self.app_config, self.expected_factories)
+        self.clear_cache()
+        tested_factories = utils.get_factories_index(self.app_config)
+        self.assertEqual(tested_factories, self.expected_factories)
+        mock_scan.assert_not_called()
+
+    def test_rebuild_changed_module(self):
+        index.set_app_entry(self.index_path, self.app_config, {})
+        loaded_index = index.load_index(self.index_path)
+        loaded_index['apps']['testapp']['signature'][1] -= 1
+        index.save_index(self.index_path, loaded_index)
+        self.clear_cache()
+        tested_factories = utils.get_factories_index(self.app_config)
+        self.assertEqual(tested_factories, self.expected_factories)
+
+    @patch('factory_generator.utils.scan_factories_module')
+    def test_rebuild_changed_source(self, mock_scan):
+        mock_scan.return_value = self.expected_factories
+        index.set_app_entry(self.index_path, self.app_config, self.expected_factories)
+        loaded_index = index.load_index(self.index_path)
+        sources = loaded_index['apps']['testapp']['sources']
+        self.assertEqual(sources, [index.get_file_signature(sample_factories.__file__)])
+        # Module which factories are re-exported from is changed.
+        sources[0][1] -= 1
+        index.save_index(self.index_path, loaded_index)
+        self.clear_cache()
+        self.assertIsNone(index.get_app_entry(self.index_path, self.app_config))
+        self.assertEqual(utils.get_factories_index(self.app_config), self.expected_factories)
+        mock_scan.assert_called_once_with(self.app_config)
+
+    def test_app_without_factories(self):
+        app_config = installed_apps.get_app_config('auth')
+        self.assertEqual(utils.get_factories_index(app_config), {})
+        self.assertIsNotNone(index.get_app_entry(self.index_path, app_config))
+
+    def test_corrupted_index(self):
+        with open(self.index_path, 'w') as fp:
+            fp.write('{')
+        self.assertEqual(utils.get_factories_index(self.app_config), self.expected_factories)
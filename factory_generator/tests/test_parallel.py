@@ -0,0 +1,81 @@
+from django.test import TestCase
+
+from factory_generator import parallel
+from factory_generator.encoders import DjangoFileJsonEncoder
+
+from factory_generator.tests.testapp.factories import PersonFactory
+from factory_generator.tests.testapp.models import City
+
+import factory
+import json
+
+
+class SequenceCityFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = City
+
+    class Params:
+        code = factory.Faker('pyint')
+
+    title = factory.LazyAttributeSequence(lambda obj, n: 'City %d-%d' % (n, obj.code))
+
+
+class TestChunks(TestCase):
+
+    def test_chunks(self):
+        self.assertEqual(parallel.get_chunks(5, 2), [(0, 2), (2, 2), (4, 1)])
+        self.assertEqual(parallel.get_chunks(0, 2), [])
+
+
+class TestGenerateChunk(TestCase):
+
+    def test_encoded_records(self):
+        tested_records = parallel.generate_chunk(PersonFactory, 0, 2, 1, cls=DjangoFileJsonEncoder)
+        self.assertEqual(len(tested_records), 2)
+        for record in map(json.loads, tested_records):
+            self.assertEqual(record['model'], 'testapp.person')
+            self.assertTrue(isinstance(record['fields']['company'], dict))
+
+    def test_deterministic(self):
+        self.assertEqual(
+            parallel.generate_chunk(SequenceCityFactory, 3, 2, 1),
+            parallel.generate_chunk(SequenceCityFactory, 3, 2, 1),
+        )
+
+    def test_sequence_offset(self):
+        tested_records = [json.loads(r) for r in parallel.generate_chunk(SequenceCityFactory, 10, 2, 1)]
+        self.assertEqual(
+            [r['fields']['title'].split('-')[0] for r in tested_records],
+            ['City 10', 'City 11']
+        )
+
+
+class TestParallelGenerate(TestCase):
+
+    def test_generate(self):
+        expected_quantity = 7
+        tested_records = [
+            json.loads(r) for r in parallel.iter_parallel_generate_to_json(
+                SequenceCityFactory, quantity=expected_quantity, workers=2, chunk_size=2, seed=1,
+            )
+        ]
+        self.assertEqual(
+            [r['fields']['title'].split('-')[0] for r in tested_records],
+            ['City %d' % i for i in range(expected_quantity)]
+        )
+
+    def test_seeded_generate(self):
+        kwargs = {'quantity': 5, 'chunk_size': 2, 'seed': 1}
+        self.assertEqual(
+            [json.loads(r)['fields'] for r in parallel.iter_parallel_generate_to_json(
+                SequenceCityFactory, workers=2, **kwargs
+            )],
+            list(parallel.iter_seeded_generate_to_json(SequenceCityFactory, **kwargs)),
+        )
+
+    def test_same_seed(self):
+        kwargs = {'quantity': 5, 'workers': 2, 'chunk_size': 2, 'seed': 1}
+        self.assertEqual(
+            list(parallel.iter_parallel_generate_to_json(SequenceCityFactory, **kwargs)),
+            list(parallel.iter_parallel_generate_to_json(SequenceCityFactory, **kwargs)),
+        )
@@ -0,0 +1,101 @@
+from django.db import connection
+from django.test import TestCase
+
+from factory_generator import pgcopy
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory
+from factory_generator.tests.testapp.models import City, Company
+
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+
+class TestFormatCopyValue(TestCase):
+
+    def test_null(self):
+        self.assertEqual(pgcopy.format_copy_value(None), '\\N')
+
+    def test_escapes(self):
+        self.assertEqual(pgcopy.format_copy_value('a\tb\nc\\d'), 'a\\tb\\nc\\\\d')
+
+    def test_types(self):
+        self.assertEqual(pgcopy.format_copy_value(True), 't')
+        self.assertEqual(pgcopy.format_copy_value(12), '12')
+        self.assertEqual(
+            pgcopy.format_copy_value(datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+            '2020-01-02T03:04:05+00:00'
+        )
+        self.assertEqual(pgcopy.format_copy_value(b'\x01\xff'), '\\\\x01ff')
+
+    def test_array(self):
+        self.assertEqual(pgcopy.format_copy_value(['a"b', None, 1]), '{"a\\\\"b",NULL,"1"}')
+
+
+class TestFormatCopyRows(TestCase):
+
+    def test_rows(self):
+        city = CityFactory.build(pk=7, title='Saint\tPetersburg')
+        company = CompanyFactory.build(pk=3, name='Name', address='Street\n1', city=city)
+        fields = pgcopy.get_copy_fields(Company)
+        self.assertEqual([f.column for f in fields], ['id', 'name', 'address', 'city_id'])
+        self.assertEqual(
+            pgcopy.format_copy_rows([company], fields, connection),
+            '3\tName\tStreet\\n1\t7\n'
+        )
+
+
+class TestAssignPks(TestCase):
+
+    @patch('factory_generator.pgcopy.reserve_pks')
+    @patch('factory_generator.pgcopy.get_pk_sequence')
+    def test_assign(self, mock_sequence, mock_reserve):
+        mock_sequence.return_value = 'testapp_city_id_seq'
+        mock_reserve.return_value = [10, 11]
+        cities = [CityFactory.build(), CityFactory.build(pk=5), CityFactory.build()]
+        self.assertTrue(pgcopy.assign_pks(cities, 'default'))
+        self.assertEqual([c.pk for c in cities], [10, 5, 11])
+        mock_reserve.assert_called_with('testapp_city_id_seq', 2, 'default')
+
+    @patch('factory_generator.pgcopy.get_pk_sequence')
+    def test_without_sequence(self, mock_sequence):
+        mock_sequence.return_value = None
+        self.assertFalse(pgcopy.assign_pks([CityFactory.build()], 'default'))
+
+
+class TestCopySave(TestCase):
+
+    def test_fallback_to_bulk_create(self):
+        companies = CompanyFactory.build_batch(3)
+        with self.assertNumQueries(2):
+            created = pgcopy.copy_save(companies)
+        self.assertEqual(created, 6)
+        self.assertEqual(Company.objects.count(), 3)
+
+    @patch('factory_generator.pgcopy.copy_rows')
+    @patch('factory_generator.pgcopy.assign_pks')
+    @patch('factory_generator.pgcopy.can_copy')
+    def test_copy(self, mock_can_copy, mock_assign_pks, mock_copy_rows):
+        mock_can_copy.return_value = True
+
+        def assign_pks(instances, using):
+            for i, obj in enumerate(instances, start=1):
+                obj.pk = i
+            return True
+
+        mock_assign_pks.side_effect = assign_pks
+        companies = CompanyFactory.build_batch(3)
+        created = pgcopy.copy_save(companies, batch_size=2)
+        self.assertEqual(created, 6)
+        copied_models = [c[0][0] for c in mock_copy_rows.call_args_list]
+        self.assertEqual(copied_models, [City, City, Company, Company])
+        self.assertEqual([c.city_id for c in companies], [1, 2, 3])
+        self.assertFalse(any(c._state.adding for c in companies))
+
+    def test_copy_rows_with_copy_expert(self):
+        raw_cursor = MagicMock(spec=['copy_expert'])
+        with patch.object(connection, 'cursor') as mock_cursor:
+            mock_cursor.return_value.__enter__.return_value.cursor = raw_cursor
+            pgcopy.copy_rows(City, pgcopy.get_copy_fields(City), '1\tMoscow\n', 'default')
+        sql, stream = raw_cursor.copy_expert.call_args[0]
+        self.assertEqual(sql, 'COPY "testapp_city" ("id", "title") FROM STDIN')
+        self.assertEqual(stream.read(), '1\tMoscow\n')
@@ -0,0 +1,91 @@
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from factory_generator import planning
+from factory_generator.utils import FactoryQuantity
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory, PersonFactory
+from factory_generator.tests.testapp.models import City, Person
+
+import shutil
+import tempfile
+
+
+class TestGetQuantities(TestCase):
+
+    def test_default_quantity(self):
+        tested_result = planning.get_quantities([CityFactory, CompanyFactory], quantity=3)
+        self.assertEqual(tested_result, {CityFactory: 3, CompanyFactory: 3})
+
+    def test_fixed_quantity(self):
+        tested_result = planning.get_quantities(
+            [CityFactory, CompanyFactory], quantity=3,
+            factory_quantities={'testapp.CityFactory': FactoryQuantity(quantity=50)},
+        )
+        self.assertEqual(tested_result, {CityFactory: 50, CompanyFactory: 3})
+
+    def test_ratio(self):
+        factories = [CityFactory, CompanyFactory, PersonFactory]
+        tested_result = planning.get_quantities(factories, factory_quantities={
+            'testapp.PersonFactory': FactoryQuantity(quantity=1000),
+            'testapp.CompanyFactory': FactoryQuantity(per='testapp.PersonFactory', ratio=0.01),
+            'testapp.CityFactory': FactoryQuantity(per='testapp.CompanyFactory', ratio=0.5),
+        })
+        self.assertEqual(tested_result, {PersonFactory: 1000, CompanyFactory: 10, CityFactory: 5})
+
+    def test_ratio_of_not_generated_factory(self):
+        tested_result = planning.get_quantities([CompanyFactory], quantity=4, factory_quantities={
+            'testapp.CompanyFactory': FactoryQuantity(per='testapp.CityFactory', ratio=3),
+        })
+        self.assertEqual(tested_result, {CompanyFactory: 12})
+
+    def test_cyclic_ratio(self):
+        with self.assertRaises(CommandError):
+            planning.get_quantities([CityFactory, CompanyFactory], factory_quantities={
+                'testapp.CityFactory': FactoryQuantity(per='testapp.CompanyFactory', ratio=1),
+                'testapp.CompanyFactory': FactoryQuantity(per='testapp.CityFactory', ratio=1),
+            })
+
+
+class TestGetMissingQuantities(TestCase):
+
+    def test_missing_quantities(self):
+        CityFactory.create_batch(3)
+        tested_result = planning.get_missing_quantities({CityFactory: 5, CompanyFactory: 2})
+        self.assertEqual(tested_result, {CityFactory: 2, CompanyFactory: 2})
+
+    def test_target_reached(self):
+        CityFactory.create_batch(3)
+        tested_result = planning.get_missing_quantities({CityFactory: 2})
+        self.assertEqual(tested_result, {CityFactory: 0})
+
+    def test_missing_quantity(self):
+        CityFactory.create_batch(3)
+        self.assertEqual(planning.get_missing_quantity(CityFactory, 5), 2)
+        self.assertEqual(planning.get_missing_quantity(CityFactory, 2), 0)
+
+
+class TestGetTargetOverrides(TestCase):
+
+    def test_reached_parent(self):
+        cities = CityFactory.create_batch(2)
+        targets = planning.get_model_targets({CityFactory: 2, PersonFactory: 5})
+        overrides = planning.get_target_overrides(PersonFactory, targets, 5)
+        self.assertEqual(list(overrides), ['company__city'])
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        with override_settings(MEDIA_ROOT=media_root):
+            PersonFactory.create_batch(5, **overrides)
+        self.assertEqual(City.objects.count(), 2)
+        tested_cities = set(Person.objects.values_list('company__city', flat=True))
+        self.assertEqual(tested_cities, {city.pk for city in cities})
+
+    def test_not_reached_parent(self):
+        CityFactory.create_batch(2)
+        targets = planning.get_model_targets({CityFactory: 3, CompanyFactory: 5})
+        self.assertEqual(planning.get_target_overrides(CompanyFactory, targets, 5), {})
+
+    def test_exclude(self):
+        CityFactory.create_batch(2)
+        targets = planning.get_model_targets({CityFactory: 2, CompanyFactory: 2})
+        self.assertEqual(planning.get_target_overrides(CompanyFactory, targets, 2, exclude=['city']), {})
@@ -0,0 +1,62 @@
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from factory_generator import generators, pools
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory
+from factory_generator.tests.testapp.models import City, Company
+
+
+class TestParsePools(TestCase):
+
+    def test_parse(self):
+        specs = ['testapp.CompanyFactory.city=10', ' testapp.PersonFactory.company__city=5:random']
+        tested_pools = pools.parse_pools(specs)
+        self.assertEqual(tested_pools, {
+            'testapp.CompanyFactory': {'city': pools.Pool(10, pools.ROUND_ROBIN)},
+            'testapp.PersonFactory': {'company__city': pools.Pool(5, pools.RANDOM)},
+        })
+
+    def test_incorrect_spec(self):
+        specs = [
+            'testapp.CompanyFactory=10', 'testapp.CompanyFactory.city', 'testapp.CompanyFactory.city=x',
+        ]
+        for spec in specs:
+            with self.assertRaises(CommandError):
+                pools.parse_pools([spec])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(CommandError):
+            pools.parse_pools(['testapp.CompanyFactory.city=10:sometimes'])
+
+
+class TestPoolOverrides(TestCase):
+
+    def test_round_robin(self):
+        expected_size = 3
+        overrides = pools.get_pool_overrides(CompanyFactory, {'city': pools.Pool(expected_size)})
+        generators.generate_to_db(CompanyFactory, quantity=7, **overrides)
+        self.assertEqual(City.objects.count(), expected_size)
+        self.assertEqual(Company.objects.count(), 7)
+        city_ids = list(Company.objects.order_by('pk').values_list('city_id', flat=True))
+        self.assertEqual(city_ids[:expected_size], city_ids[expected_size:expected_size * 2])
+
+    def test_random_bulk(self):
+        expected_size = 2
+        overrides = pools.get_pool_overrides(
+            CompanyFactory, {'city': pools.Pool(expected_size, pools.RANDOM)}, bulk=True,
+        )
+        generators.generate_to_db(CompanyFactory, quantity=10, bulk=True, **overrides)
+        self.assertEqual(City.objects.count(), expected_size)
+        self.assertEqual(Company.objects.count(), 10)
+
+    def test_sample_existing(self):
+        existing_cities = CityFactory.create_batch(2)
+        overrides = pools.get_pool_overrides(CompanyFactory, {'city': pools.Pool(3)})
+        generators.generate_to_db(CompanyFactory, quantity=3, **overrides)
+        self.assertEqual(City.objects.count(), 3)
+        self.assertTrue(Company.objects.filter(city__in=existing_cities).exists())
+
+    def test_unknown_relation(self):
+        with self.assertRaises(CommandError):
+            pools.get_pool_overrides(CompanyFactory, {'title': pools.Pool(3)})
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from factory import builder
+
+from factory_generator.generators import generate_to_json
+from factory_generator.profiling import Profiler
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory
+
+import json
+import os
+import pstats
+import tempfile
+
+
+class TestProfiler(TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+
+    def test_enable_restores_resolver(self):
+        original_getattr = builder.Resolver.__getattr__
+        with self.profiler.enable():
+            self.assertIsNot(builder.Resolver.__getattr__, original_getattr)
+        self.assertIs(builder.Resolver.__getattr__, original_getattr)
+
+    def test_declarations(self):
+        with self.profiler.enable():
+            generate_to_json(CompanyFactory, quantity=3)
+        declarations = {(s['factory'], s['attribute']): s for s in self.profiler.get_declarations_stats()}
+        self.assertEqual(declarations[('testapp.CompanyFactory', 'city')]['calls'], 3)
+        self.assertEqual(declarations[('testapp.CompanyFactory', 'city')]['declaration'], 'SubFactory')
+        self.assertEqual(declarations[('testapp.CityFactory', 'title')]['calls'], 3)
+
+    def test_profile_factory(self):
+        with self.profiler.profile_factory(CityFactory, 2):
+            CityFactory.create_batch(2)
+        stats = self.profiler.get_factories_stats()
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['factory'], 'testapp.CityFactory')
+        self.assertEqual(stats[0]['rows'], 2)
+        self.assertEqual(stats[0]['queries'], 2)
+        self.assertGreater(stats[0]['rows_per_sec'], 0)
+
+    def test_format_summary(self):
+        with self.profiler.enable(), self.profiler.profile_factory(CityFactory, 1):
+            generate_to_json(CityFactory)
+        summary = self.profiler.format_summary()
+        self.assertIn('testapp.CityFactory', summary)
+        self.assertIn('title', summary)
+
+    def test_dump_json(self):
+        with self.profiler.enable(), self.profiler.profile_factory(CityFactory, 1):
+            generate_to_json(CityFactory)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'profile.json')
+            self.profiler.dump(path)
+            with open(path) as fp:
+                tested_data = json.load(fp)
+        self.assertEqual(tested_data['factories'][0]['factory'], 'testapp.CityFactory')
+        self.assertEqual(tested_data['declarations'][0]['factory'], 'testapp.CityFactory')
+
+    def test_dump_cprofile(self):
+        profiler = Profiler(use_cprofile=True)
+        with profiler.enable():
+            generate_to_json(CityFactory)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'profile.prof')
+            profiler.dump(path)
+            self.assertGreater(pstats.Stats(path).total_calls, 0)
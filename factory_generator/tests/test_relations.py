@@ -0,0 +1,161 @@
+import django
+from django.core.management import call_command
+from django.test import TestCase
+
+from factory_generator import generators
+from factory_generator.parallel import iter_seeded_generate_to_json
+from factory_generator.relations import RandomRelated, get_related_overrides, skip_postgeneration_save
+
+from factory_generator.tests.testapp.models import Article, Tag
+
+import factory
+from io import StringIO
+import json
+import os
+import tempfile
+from unittest import mock, skipIf
+import warnings
+
+
+class TagFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Tag
+
+    name = factory.Sequence(lambda n: 'tag-%d' % n)
+
+
+class ArticleFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Article
+
+    title = factory.Faker('sentence')
+    tags = RandomRelated(TagFactory, k=(1, 3), pool_size=5)
+
+
+class TestRandomRelated(TestCase):
+
+    def test_create(self):
+        article = ArticleFactory.create()
+        self.assertEqual(Tag.objects.count(), 5)
+        self.assertTrue(1 <= article.tags.count() <= 3)
+
+    def test_choose(self):
+        declaration = RandomRelated(TagFactory, k=2)
+        chosen = declaration.choose([1, 2, 3])
+        self.assertEqual(len(set(chosen)), 2)
+        self.assertLessEqual(set(chosen), {1, 2, 3})
+        self.assertEqual(declaration.choose([1]), [1])
+
+    def test_related_overrides(self):
+        TagFactory.create_batch(2)
+        overrides = get_related_overrides(ArticleFactory, create=False)
+        expected_pks = list(Tag.objects.order_by('pk').values_list('pk', flat=True))
+        self.assertEqual(overrides['tags'].pks, expected_pks)
+        self.assertEqual(overrides['tags'].name, 'tags')
+        self.assertEqual(Tag.objects.count(), 2)
+        self.assertEqual(get_related_overrides(ArticleFactory, overrides={'tags': []}), {})
+        filled = overrides['tags']
+        self.assertIs(get_related_overrides(ArticleFactory, overrides={'tags': filled}).get('tags'), None)
+
+    def test_override_name(self):
+        overrides = get_related_overrides(ArticleFactory, create=False,
+                                          overrides={'tags': RandomRelated(TagFactory, k=1)})
+        self.assertEqual(overrides['tags'].name, 'tags')
+        self.assertEqual(overrides['tags'].k, 1)
+
+    def test_override_without_name(self):
+        with self.assertRaisesRegex(ValueError, 'specify name'):
+            ArticleFactory.create(tags=RandomRelated(TagFactory, k=1))
+        article = ArticleFactory.create(tags=RandomRelated(TagFactory, k=1, name='tags'))
+        self.assertEqual(article.tags.count(), 1)
+
+
+class TestGenerateRelated(TestCase):
+
+    def assert_tags(self, quantity):
+        self.assertEqual(Article.objects.count(), quantity)
+        self.assertEqual(Tag.objects.count(), 5)
+        for article in Article.objects.prefetch_related('tags'):
+            self.assertTrue(1 <= len(article.tags.all()) <= 3)
+
+    def test_generate_to_db(self):
+        with self.assertNumQueries(1 + 5 + 10 + 1), warnings.catch_warnings():
+            # Pool is sampled and filled, 10 inserts of articles and one insert of through rows,
+            # articles aren't saved again after post generation.
+            warnings.simplefilter('error', DeprecationWarning)
+            generators.generate_to_db(ArticleFactory, quantity=10)
+        self.assert_tags(10)
+        self.assertFalse(ArticleFactory._meta.skip_postgeneration_save)
+
+    def test_skip_postgeneration_save(self):
+        with skip_postgeneration_save(ArticleFactory):
+            with skip_postgeneration_save(ArticleFactory):
+                self.assertTrue(ArticleFactory._meta.skip_postgeneration_save)
+            self.assertTrue(ArticleFactory._meta.skip_postgeneration_save)
+        self.assertFalse(ArticleFactory._meta.skip_postgeneration_save)
+
+    def test_skip_postgeneration_save_without_option(self):
+        class OldArticleFactory(ArticleFactory):
+            pass
+
+        # factory_boy older than 3.3 doesn't have the option.
+        del OldArticleFactory._meta.skip_postgeneration_save
+        with skip_postgeneration_save(OldArticleFactory):
+            self.assertFalse(hasattr(OldArticleFactory._meta, 'skip_postgeneration_save'))
+        self.assertFalse(hasattr(OldArticleFactory._meta, 'skip_postgeneration_save'))
+
+    def test_generate_to_db_override(self):
+        generators.generate_to_db(ArticleFactory, quantity=3, tags=RandomRelated(TagFactory, k=2))
+        for article in Article.objects.prefetch_related('tags'):
+            self.assertEqual(len(article.tags.all()), 2)
+
+    def test_bulk(self):
+        with self.assertNumQueries(4):
+            # Pool is sampled and filled, articles and through rows are inserted with one query each.
+            created = generators.generate_to_db(ArticleFactory, quantity=10, bulk=True, batch_size=50)
+        self.assertEqual(created, 10)
+        self.assert_tags(10)
+
+    def test_generate_to_json(self):
+        TagFactory.create_batch(5)
+        pks = set(Tag.objects.values_list('pk', flat=True))
+        records = generators.generate_to_json(ArticleFactory, quantity=4)
+        for record in records:
+            self.assertTrue(1 <= len(record['tags']) <= 3)
+            self.assertLessEqual(set(record['tags']), pks)
+
+    def test_seeded_generate_to_json(self):
+        TagFactory.create_batch(5)
+        with mock.patch('factory_generator.parallel.get_related_overrides',
+                        wraps=get_related_overrides) as get_overrides:
+            with self.assertNumQueries(1):
+                records = list(
+                    iter_seeded_generate_to_json(ArticleFactory, quantity=6, chunk_size=2, seed=1)
+                )
+        get_overrides.assert_called_once()
+        self.assertEqual(len(records), 6)
+
+    def test_json_fixture(self):
+        TagFactory.create_batch(5)
+        out = StringIO()
+        data = generators.generate_to_json(ArticleFactory, quantity=2)
+        json.dump([{'model': 'testapp.article', 'fields': fields} for fields in data], out)
+        with open(self.fixture_path(out.getvalue()), 'r') as fp:
+            call_command('loaddata', fp.name, verbosity=0)
+        self.assertEqual(Article.objects.count(), 2)
+        for article, fields in zip(Article.objects.order_by('pk'), data):
+            self.assertEqual(sorted(article.tags.values_list('pk', flat=True)), sorted(fields['tags']))
+
+    def fixture_path(self, content):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as fp:
+            fp.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    @skipIf(django.VERSION < generators.ASYNC_DB_DJANGO_VERSION, 'Async ORM isnt supported.')
+    async def test_agenerate_to_db(self):
+        created = await generators.agenerate_to_db(ArticleFactory, quantity=4, batch_size=2)
+        self.assertEqual(created, 4)
+        self.assertEqual(await Tag.objects.acount(), 5)
+        self.assertTrue(await Article.tags.through.objects.acount() >= 4)
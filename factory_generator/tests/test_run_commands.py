@@ -37,6 +37,13 @@ class TestRunGenerateToJson(TestCase):
         result_json = self.call_command('testapp.PersonFactory')
         self.assertEqual(result_json, expected_json + '\n')
 
+    def test_run_with_stdout_output(self):
+        expected_quantity = 3
+        result_json = self.call_command('testapp.CityFactory', quantity=expected_quantity, output='-')
+        tested_data = json.loads(result_json)
+        self.assertEqual(len(tested_data), expected_quantity)
+        self.assertTrue(result_json.endswith(']\n'))
+
 
 class TestRunGenerateToDb(TestCase):
 
@@ -0,0 +1,51 @@
+from django.test import TestCase
+
+from factory_generator import scheduler
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory, PersonFactory
+from factory_generator.tests.testapp.models import City, Company
+
+import factory
+
+
+class TestDependencies(TestCase):
+
+    def test_related_models(self):
+        self.assertEqual(scheduler.get_related_models(Company), {City})
+        self.assertEqual(scheduler.get_related_models(City), set())
+
+    def test_dependencies(self):
+        tested_dependencies = scheduler.get_dependencies([PersonFactory, CityFactory])
+        self.assertEqual(tested_dependencies, {PersonFactory: set(), CityFactory: set()})
+        tested_dependencies = scheduler.get_dependencies([PersonFactory, CompanyFactory, CityFactory])
+        self.assertEqual(tested_dependencies, {
+            PersonFactory: {CompanyFactory},
+            CompanyFactory: {CityFactory},
+            CityFactory: set(),
+        })
+
+
+class TestDependencyLevels(TestCase):
+
+    def test_levels(self):
+        tested_levels = scheduler.get_dependency_levels([PersonFactory, CityFactory, CompanyFactory])
+        self.assertEqual(tested_levels, [[CityFactory], [CompanyFactory], [PersonFactory]])
+
+    def test_independent_factories(self):
+        tested_levels = scheduler.get_dependency_levels([PersonFactory, CityFactory])
+        self.assertEqual(tested_levels, [[CityFactory, PersonFactory]])
+
+    def test_factories_of_same_model(self):
+
+        class AnotherCityFactory(factory.django.DjangoModelFactory):
+            class Meta:
+                model = City
+
+        tested_levels = scheduler.get_dependency_levels([CompanyFactory, AnotherCityFactory, CityFactory])
+        self.assertEqual(len(tested_levels), 2)
+        self.assertEqual(set(tested_levels[0]), {AnotherCityFactory, CityFactory})
+        self.assertEqual(tested_levels[1], [CompanyFactory])
+
+    def test_sort(self):
+        tested_factories = scheduler.sort_factories([PersonFactory, CompanyFactory, CityFactory])
+        self.assertEqual(tested_factories, [CityFactory, CompanyFactory, PersonFactory])
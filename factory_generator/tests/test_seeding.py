@@ -0,0 +1,113 @@
+from django.test import TestCase
+
+from factory_generator import seeding
+from factory_generator.generators import generate_to_json
+from factory_generator.management.commands.generate_to_db import Command as GenerateToDbCommand
+from factory_generator.management.commands.generate_to_json import Command as GenerateToJsonCommand
+
+from factory_generator.tests.testapp.models import City, Company, Country, Region
+
+import factory
+import json
+from unittest.mock import Mock
+
+
+class FakerCityFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = City
+
+    title = factory.Faker('city')
+
+
+class SequenceCompanyFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Company
+
+    name = factory.Sequence(lambda n: 'Company %d' % n)
+    address = factory.Faker('address')
+    city = factory.SubFactory(FakerCityFactory)
+
+
+class CountryFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Country
+
+    code = factory.Sequence(lambda n: 'country-%d' % n)
+
+
+class RegionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Region
+
+    name = factory.Sequence(lambda n: 'Region %d' % n)
+    country = factory.SubFactory(CountryFactory)
+
+
+class BorderFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Region
+
+    name = factory.Faker('city')
+    country = factory.SubFactory(CountryFactory)
+
+
+class TestSeedChunk(TestCase):
+
+    def test_same_seed(self):
+        seeding.seed_chunk(SequenceCompanyFactory, 1, 10, dict_factory=True)
+        expected_records = generate_to_json(SequenceCompanyFactory, quantity=2)
+        generate_to_json(SequenceCompanyFactory, quantity=3)
+        seeding.seed_chunk(SequenceCompanyFactory, 1, 10, dict_factory=True)
+        self.assertEqual(generate_to_json(SequenceCompanyFactory, quantity=2), expected_records)
+        self.assertEqual([r['name'] for r in expected_records], ['Company 10', 'Company 11'])
+
+    def test_other_chunk(self):
+        seeding.seed_chunk(FakerCityFactory, 1, 0)
+        first_title = FakerCityFactory.build().title
+        seeding.seed_chunk(FakerCityFactory, 1, 2)
+        self.assertNotEqual(FakerCityFactory.build().title, first_title)
+
+    def test_reset_sequences(self):
+        seeding.reset_sequences(SequenceCompanyFactory, 5)
+        self.assertEqual(SequenceCompanyFactory.build().name, 'Company 5')
+
+    def test_reset_nested_sequences(self):
+        seeding.reset_sequences(RegionFactory, 5, sequence_offsets={CountryFactory: 100})
+        region = RegionFactory.build()
+        self.assertEqual((region.name, region.country.code), ('Region 5', 'country-105'))
+
+
+class TestSequenceOffsets(TestCase):
+
+    def test_nested_factories(self):
+        self.assertEqual(seeding.get_nested_factories(RegionFactory), {CountryFactory: 1})
+        self.assertEqual(seeding.get_nested_factories(CountryFactory), {})
+
+    def test_offsets(self):
+        tested_offsets = seeding.get_sequence_offsets({
+            CountryFactory: 3, RegionFactory: 4, BorderFactory: 2,
+        })
+        self.assertEqual(tested_offsets, {
+            CountryFactory: {},
+            RegionFactory: {CountryFactory: 3},
+            BorderFactory: {CountryFactory: 7},
+        })
+
+    def test_unique_nested_sequences_in_db(self):
+        cmd = GenerateToDbCommand()
+        cmd.stdout = Mock()
+        factories = [CountryFactory, RegionFactory, BorderFactory]
+        cmd.generate(factories, quantity=3, seed=1, commit_every=2)
+        self.assertEqual(Country.objects.count(), 9)
+        self.assertEqual(Region.objects.count(), 6)
+        codes = list(Country.objects.order_by('pk').values_list('code', flat=True))
+        cmd.generate(factories, quantity=3, seed=1, update=True)
+        self.assertEqual(list(Country.objects.order_by('pk').values_list('code', flat=True)), codes)
+
+    def test_unique_nested_sequences_in_json(self):
+        factories = [CountryFactory, RegionFactory, BorderFactory]
+        records = json.loads(GenerateToJsonCommand().generate(factories, quantity=3, seed=1, chunk_size=2))
+        codes = [r['fields']['code'] for r in records if r['model'] == 'testapp.country']
+        codes += [r['fields']['country']['code'] for r in records if r['model'] == 'testapp.region']
+        self.assertEqual(len(codes), 9)
+        self.assertEqual(len(set(codes)), 9)
@@ -0,0 +1,118 @@
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from factory_generator.client import GenerateClient, GenerateServerError
+from factory_generator.management.commands.generate_server import Command as GenerateServerCommand
+from factory_generator.parallel import iter_seeded_generate_to_json
+from factory_generator.server import (
+    FactoriesRegistry, GenerateServer, UnixGenerateServer, parse_generate_query,
+)
+from factory_generator import writers
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory, PersonFactory
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+
+class TestFactoriesRegistry(SimpleTestCase):
+
+    def setUp(self):
+        self.registry = FactoriesRegistry([CityFactory, CompanyFactory])
+
+    def test_get_factories(self):
+        self.assertEqual(self.registry.get_factories(['testapp.CompanyFactory']), [CompanyFactory])
+        self.assertEqual(self.registry.get_factories(['testapp']), [CityFactory, CompanyFactory])
+
+    def test_unknown_factory(self):
+        with self.assertRaises(CommandError):
+            self.registry.get_factories(['testapp.PersonFactory'])
+
+
+class TestParseGenerateQuery(SimpleTestCase):
+
+    def test_parse(self):
+        tested_options = parse_generate_query(
+            'factory=testapp.CityFactory&factory=testapp&quantity=3&seed=1'
+        )
+        self.assertEqual(tested_options['labels'], ['testapp.CityFactory', 'testapp'])
+        self.assertEqual(tested_options['quantity'], 3)
+        self.assertEqual(tested_options['seed'], 1)
+        self.assertEqual(tested_options['output_format'], writers.JSONL)
+
+    def test_invalid(self):
+        for query in ['quantity=1', 'factory=testapp&quantity=a', 'factory=testapp&format=xml',
+                      'factory=testapp&quantity=-1']:
+            with self.assertRaises(CommandError):
+                parse_generate_query(query)
+
+
+class ServerMixin:
+
+    def start_server(self, server):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+
+class TestGenerateServer(ServerMixin, SimpleTestCase):
+
+    def setUp(self):
+        registry = FactoriesRegistry([CityFactory, CompanyFactory, PersonFactory])
+        server = GenerateServer(('127.0.0.1', 0), registry)
+        self.start_server(server)
+        self.client = GenerateClient(*server.server_address[:2])
+
+    def test_factories(self):
+        self.assertEqual(self.client.get_factories(),
+                         ['testapp.CityFactory', 'testapp.CompanyFactory', 'testapp.PersonFactory'])
+
+    def test_generate(self):
+        tested_records = self.client.generate(['testapp.CityFactory', 'testapp.PersonFactory'], quantity=3)
+        expected_models = ['testapp.city'] * 3 + ['testapp.person'] * 3
+        self.assertEqual([r['model'] for r in tested_records], expected_models)
+
+    def test_seed(self):
+        tested_records = self.client.generate('testapp.CompanyFactory', quantity=5, seed=1, chunk_size=2)
+        expected_fields = list(
+            iter_seeded_generate_to_json(CompanyFactory, quantity=5, chunk_size=2, seed=1)
+        )
+        self.assertEqual([r['fields'] for r in tested_records], expected_fields)
+
+    def test_json_format(self):
+        data = b''.join(self.client.stream('testapp.CityFactory', quantity=2, output_format=writers.JSON))
+        self.assertEqual(len(json.loads(data)), 2)
+
+    def test_error(self):
+        with self.assertRaises(GenerateServerError):
+            self.client.generate('testapp.UnknownFactory')
+
+
+class TestUnixGenerateServer(ServerMixin, SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        socket_path = os.path.join(directory, 'generate.sock')
+        self.start_server(UnixGenerateServer(socket_path, FactoriesRegistry([CityFactory])))
+        self.client = GenerateClient(socket_path=socket_path)
+
+    def test_generate(self):
+        self.assertEqual(len(self.client.generate('testapp.CityFactory', quantity=4)), 4)
+
+
+class TestGenerateServerCmd(SimpleTestCase):
+
+    def test_get_server(self):
+        server = GenerateServerCommand().get_server('127.0.0.1:0')
+        self.addCleanup(server.server_close)
+        self.assertIn('testapp.PersonFactory', server.registry.factories)
+
+    def test_invalid_bind(self):
+        with self.assertRaises(CommandError):
+            GenerateServerCommand().get_server('localhost')
@@ -0,0 +1,75 @@
+from django.test import TestCase
+
+from factory_generator.snapshots import (
+    get_non_empty_models, get_snapshot_key, get_snapshot_models, dump_serialized, restore_serialized,
+    Snapshot,
+)
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory
+from factory_generator.tests.testapp.models import City, Company
+
+import shutil
+import tempfile
+
+
+class TestSnapshotKey(TestCase):
+
+    def test_same_options(self):
+        self.assertEqual(
+            get_snapshot_key([CityFactory], {'quantities': {'testapp.CityFactory': 3}}),
+            get_snapshot_key([CityFactory], {'quantities': {'testapp.CityFactory': 3}}),
+        )
+
+    def test_other_options(self):
+        self.assertNotEqual(
+            get_snapshot_key([CityFactory], {'quantities': {'testapp.CityFactory': 3}}),
+            get_snapshot_key([CityFactory], {'quantities': {'testapp.CityFactory': 4}}),
+        )
+
+    def test_other_factories(self):
+        self.assertNotEqual(get_snapshot_key([CityFactory], {}), get_snapshot_key([CompanyFactory], {}))
+
+
+class TestSnapshotModels(TestCase):
+
+    def test_models_of_subfactories(self):
+        self.assertEqual(get_snapshot_models([CompanyFactory]), {'default': [City, Company]})
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_save_and_restore(self):
+        companies = CompanyFactory.create_batch(3)
+        snapshot = Snapshot(self.directory, 'key')
+        self.assertFalse(snapshot.exists())
+        models = get_snapshot_models([CompanyFactory])
+        snapshot.save(models)
+        self.assertTrue(snapshot.exists())
+
+        Company.objects.all().delete()
+        City.objects.all().delete()
+        snapshot.restore(models)
+        self.assertEqual(
+            list(Company.objects.order_by('pk').values_list('pk', 'name', 'city_id')),
+            [(company.pk, company.name, company.city_id) for company in companies]
+        )
+        self.assertEqual(City.objects.count(), 3)
+        self.assertEqual(CityFactory.create().pk, max(c.city_id for c in companies) + 1)
+
+    def test_serialized(self):
+        cities = CityFactory.create_batch(2)
+        dump_serialized(self.directory, [City], 'default')
+        City.objects.all().delete()
+        restore_serialized(self.directory, [City], 'default')
+        self.assertEqual(list(City.objects.order_by('pk').values_list('pk', 'title')),
+                         [(city.pk, city.title) for city in cities])
+
+    def test_non_empty_models(self):
+        models = get_snapshot_models([CompanyFactory])
+        self.assertEqual(get_non_empty_models(models), [])
+        CityFactory.create()
+        self.assertEqual(get_non_empty_models(models), ['testapp.City'])
@@ -0,0 +1,32 @@
+from django.test import TestCase
+
+from factory_generator import truncate
+
+from factory_generator.tests.testapp.factories import CityFactory, CompanyFactory
+from factory_generator.tests.testapp.models import City, Company, Person
+
+
+class TestCascadeModels(TestCase):
+
+    def test_child_models(self):
+        self.assertEqual(truncate.get_child_models(City), {Company})
+        self.assertEqual(truncate.get_child_models(Person), set())
+
+    def test_cascade_models(self):
+        self.assertEqual(truncate.get_cascade_models([City]), [Person, Company, City])
+        self.assertEqual(truncate.get_cascade_models([Company]), [Person, Company])
+
+
+class TestTruncateByFactories(TestCase):
+
+    def test_truncate(self):
+        CityFactory.create_batch(2)
+        CompanyFactory.create()
+        with self.assertNumQueries(6):
+            tested_result = truncate.truncate_by_factories([CityFactory])
+        self.assertEqual(tested_result, {'testapp.City': 3, 'testapp.Company': 1})
+        self.assertFalse(City.objects.exists())
+        self.assertFalse(Company.objects.exists())
+
+    def test_truncate_empty(self):
+        self.assertEqual(truncate.truncate_by_factories([CityFactory]), {})
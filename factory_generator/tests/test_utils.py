@@ -32,7 +32,10 @@ class TestLoadFileConfig(TestCase):
             'labels': ','.join(self.expected_labels),
             'exclude': self.expected_excludes[0],
             'quantity': self.expected_quantity,
-            'update': self.expected_update
+            'update': self.expected_update,
+            'bulk': True,
+            'batch_size': 500,
+            'pools': 'testapp.CompanyFactory.city=10, testapp.PersonFactory.company=5:random',
         }
         with open(self.config_path, 'w') as configfile:
             config.write(configfile)
@@ -46,20 +49,104 @@ class TestLoadFileConfig(TestCase):
         self.assertEqual(config.exclude, self.expected_excludes)
         self.assertEqual(config.quantity, self.expected_quantity)
         self.assertEqual(config.update, self.expected_update)
+        self.assertTrue(config.bulk)
+        self.assertEqual(config.batch_size, 500)
+        self.assertEqual(
+            [spec.strip() for spec in config.pools],
+            ['testapp.CompanyFactory.city=10', 'testapp.PersonFactory.company=5:random']
+        )
 
     def test_raise_file_not_found(self):
         with self.assertRaises(FileNotFoundError):
             utils.load_file_config(fake.file_path())
 
+    def write_config(self, options, sections={}):
+        config = configparser.ConfigParser()
+        config['factory_generator'] = options
+        config.read_dict(sections)
+        with open(self.config_path, 'w') as configfile:
+            config.write(configfile)
+
+    def test_target(self):
+        self.write_config({'target': '100'})
+        self.assertEqual(utils.load_file_config(self.config_path).target, 100)
+        self.write_config({})
+        self.assertIsNone(utils.load_file_config(self.config_path).target)
+
+    def test_snapshot_dir(self):
+        self.write_config({'snapshot_dir': '.snapshots'})
+        self.assertEqual(utils.load_file_config(self.config_path).snapshot_dir, '.snapshots')
+
+    def test_seed(self):
+        self.write_config({'seed': '42'})
+        self.assertEqual(utils.load_file_config(self.config_path).seed, 42)
+
+    def test_mute_all_signals(self):
+        self.write_config({'mute_signals': 'on'})
+        config = utils.load_file_config(self.config_path)
+        self.assertEqual(config.mute_signals, [utils.ALL_FACTORIES])
+
+    def test_mute_signals_of_factories(self):
+        self.write_config({
+            'labels': 'testapp.CompanyFactory',
+            'mute_signals': 'testapp.CityFactory, testapp.PersonFactory',
+        })
+        config = utils.load_file_config(self.config_path)
+        self.assertEqual(config.labels, ['testapp.CompanyFactory'])
+        self.assertEqual(config.mute_signals, ['testapp.CityFactory', 'testapp.PersonFactory'])
+        self.write_config({})
+        self.assertEqual(utils.load_file_config(self.config_path).mute_signals, [])
+
+    def test_factory_quantities(self):
+        self.write_config({'quantity': 10}, {
+            'testapp.CityFactory': {'quantity': 5},
+            'testapp.PersonFactory': {'per': 'testapp.CompanyFactory', 'ratio': 2.5},
+        })
+        config = utils.load_file_config(self.config_path)
+        self.assertEqual(config.factory_quantities, {
+            'testapp.CityFactory': utils.FactoryQuantity(quantity=5),
+            'testapp.PersonFactory': utils.FactoryQuantity(per='testapp.CompanyFactory', ratio=2.5),
+        })
+        self.write_config({})
+        self.assertEqual(utils.load_file_config(self.config_path).factory_quantities, {})
+
+    def test_invalid_factory_quantities(self):
+        for section in [{'per': 'testapp.CityFactory'}, {'quantity': 5, 'ratio': 2}, {'quantity': -1}]:
+            self.write_config({}, {'testapp.CompanyFactory': section})
+            with self.assertRaises(CommandError):
+                utils.load_file_config(self.config_path)
+
 
-class TestGetModule(TestCase):
+class TestFactoriesIndex(TestCase):
 
-    def test_import(self):
-        expected_module = sample_factories
-        file_path = expected_module.__file__
-        module_name = expected_module.__name__
-        tested_module = utils.get_module(module_name, file_path)
-        self.assertEqual(tested_module.__file__, expected_module.__file__)
+    def setUp(self):
+        self.app_config = installed_apps.get_app_config('testapp')
+        utils.get_factories_index.cache_clear()
+
+    def test_index(self):
+        tested_index = utils.get_factories_index(self.app_config)
+        self.assertEqual(tested_index, {
+            'CityFactory': sample_factories.CityFactory,
+            'CompanyFactory': sample_factories.CompanyFactory,
+            'PersonFactory': sample_factories.PersonFactory,
+        })
+        self.assertIs(tested_index, utils.get_factories_index(self.app_config))
+
+    def test_without_factories_module(self):
+        app_config = installed_apps.get_app_config('auth')
+        self.assertIsNone(utils.get_factories_module(app_config))
+        self.assertEqual(utils.get_factories_index(app_config), {})
+
+    @patch('factory_generator.utils.importlib.import_module', wraps=utils.importlib.import_module)
+    def test_import_module_once(self, mock_import):
+        labels = ['testapp.CityFactory', 'testapp.CompanyFactory', 'testapp.PersonFactory']
+        utils.parse_factories_from_labels(labels)
+        mock_import.assert_called_once_with(f'{self.app_config.name}.{FACTORIES_MODULE_NAME}')
+
+    def test_same_factory_classes(self):
+        tested_factories = utils.parse_factories_from_labels(['testapp', 'testapp.CityFactory'])
+        self.assertEqual(len(tested_factories), 3)
+        self.assertIn(sample_factories.CityFactory, tested_factories)
 
 
 class TestIsSuper(TestCase):
@@ -223,6 +310,12 @@ class TestParseLabels(TestCase):
         self.assertTrue(expected_msg in execinfo.exception.args)
 
 
+class TestGetFactoryLabel(TestCase):
+
+    def test_label(self):
+        self.assertEqual(utils.get_factory_label(sample_factories.CityFactory), 'testapp.CityFactory')
+
+
 class TestDeleteByFactory(TestCase):
 
     def setUp(self):
@@ -0,0 +1,126 @@
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from factory_generator.encoders import DjangoFileJsonEncoder
+from factory_generator.generators import generate_to_json
+from factory_generator import writers
+from factory_generator.writers import JsonArrayWriter, JsonLinesWriter, ShardedWriter
+from factory_generator.tests.testapp.factories import CityFactory, PersonFactory
+
+import gzip
+from io import StringIO
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+
+class TestJsonArrayWriter(TestCase):
+
+    def test_write(self):
+        records = generate_to_json(CityFactory, quantity=3)
+        stream = StringIO()
+        with JsonArrayWriter(stream) as writer:
+            for record in records:
+                writer.write(record)
+        self.assertEqual(stream.getvalue(), json.dumps(records))
+        self.assertEqual(writer.count, len(records))
+
+    def test_write_empty(self):
+        stream = StringIO()
+        with JsonArrayWriter(stream):
+            pass
+        self.assertEqual(json.loads(stream.getvalue()), [])
+
+    def test_encoder_options(self):
+        records = generate_to_json(PersonFactory, quantity=2)
+        stream = StringIO()
+        with JsonArrayWriter(stream, cls=DjangoFileJsonEncoder, separators=(',', ':')) as writer:
+            for record in records:
+                writer.write(record)
+        expected_json = json.dumps(records, cls=DjangoFileJsonEncoder, separators=(',', ':'))
+        self.assertEqual(stream.getvalue(), expected_json)
+
+
+class TestJsonLinesWriter(TestCase):
+
+    def test_write(self):
+        records = generate_to_json(PersonFactory, quantity=3)
+        stream = StringIO()
+        with JsonLinesWriter(stream, cls=DjangoFileJsonEncoder, indent=2) as writer:
+            for record in records:
+                writer.write(record)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), len(records))
+        self.assertEqual(lines[0], json.dumps(records[0], cls=DjangoFileJsonEncoder))
+        self.assertEqual(writer.encoder_kwargs['indent'], None)
+
+    def test_write_empty(self):
+        stream = StringIO()
+        with JsonLinesWriter(stream):
+            pass
+        self.assertEqual(stream.getvalue(), '')
+
+
+class TestShardPath(TestCase):
+
+    def test_shard_path(self):
+        self.assertEqual(writers.get_shard_path('data.json', 1), 'data-00001.json')
+        self.assertEqual(writers.get_shard_path('out/data.jsonl.gz', 12), 'out/data-00012.jsonl.gz')
+        self.assertEqual(writers.get_shard_path('data', 0), 'data-00000')
+
+
+class TestShardedWriter(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_write(self):
+        records = generate_to_json(CityFactory, quantity=5)
+        path = os.path.join(self.tmp_dir.name, 'data.json')
+        with ShardedWriter(path, JsonArrayWriter, shard_size=2) as writer:
+            for record in records:
+                writer.write(record)
+        self.assertEqual(len(writer.paths), 3)
+        self.assertEqual(writer.count, len(records))
+        tested_records = []
+        for shard_path in writer.paths:
+            with open(shard_path) as fp:
+                tested_records.extend(json.load(fp))
+        self.assertEqual(tested_records, records)
+
+    def test_write_gzip(self):
+        records = generate_to_json(CityFactory, quantity=3)
+        path = os.path.join(self.tmp_dir.name, 'data.jsonl.gz')
+        with ShardedWriter(path, JsonLinesWriter, shard_size=2, compression=writers.GZIP) as writer:
+            for record in records:
+                writer.write_encoded(json.dumps(record))
+        self.assertEqual(
+            [os.path.basename(p) for p in writer.paths], ['data-00000.jsonl.gz', 'data-00001.jsonl.gz']
+        )
+        with gzip.open(writer.paths[1], 'rt') as fp:
+            self.assertEqual(json.loads(fp.read()), records[2])
+
+    def test_write_empty(self):
+        path = os.path.join(self.tmp_dir.name, 'data.json')
+        with ShardedWriter(path, shard_size=2) as writer:
+            pass
+        with open(writer.paths[0]) as fp:
+            self.assertEqual(json.load(fp), [])
+
+    def test_invalid_shard_size(self):
+        with self.assertRaises(CommandError):
+            ShardedWriter('data.json', shard_size=0)
+
+
+class TestOpenOutput(TestCase):
+
+    @patch('factory_generator.writers.zstandard', None)
+    def test_zstd_without_zstandard(self):
+        with self.assertRaises(CommandError):
+            writers.open_output('data.json.zst', writers.ZSTD)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(CommandError):
+            writers.open_output('data.json.bz2', 'bz2')
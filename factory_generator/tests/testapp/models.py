@@ -19,3 +19,21 @@ class Person(models.Model):
     company = models.ForeignKey('Company', on_delete=models.CASCADE, related_name='persons')
     timestamp = models.DateTimeField()
     email = models.CharField(max_length=64)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=32)
+
+
+class Article(models.Model):
+    title = models.CharField(max_length=128)
+    tags = models.ManyToManyField('Tag', related_name='articles')
+
+
+class Country(models.Model):
+    code = models.CharField(max_length=16, unique=True)
+
+
+class Region(models.Model):
+    name = models.CharField(max_length=64)
+    country = models.ForeignKey('Country', on_delete=models.CASCADE, related_name='regions')
@@ -0,0 +1,80 @@
+from django.db import connections
+
+from factory.django import DjangoModelFactory
+from typing import Dict, List, Set
+
+from factory_generator.scheduler import get_related_models
+
+
+def get_child_models(model_class) -> Set:
+    """
+    Return models which records refer to records of model_class,
+    including auto created through models of many to many relations.
+    :param model_class: Django model class.
+    """
+    child_models = set()
+    for field in model_class._meta.get_fields(include_hidden=True):
+        if field.auto_created and not field.concrete and (field.one_to_many or field.one_to_one):
+            child_models.add(field.related_model)
+        elif field.many_to_many and field.concrete:
+            child_models.add(field.remote_field.through)
+    child_models.discard(model_class)
+    return child_models
+
+
+def get_cascade_models(models: List) -> List:
+    """
+    Return models and all models referring to them, children go before parents.
+    :param models: List of django model classes.
+    """
+    cascade_models = set()
+    pending = list(models)
+    while pending:
+        model_class = pending.pop()
+        if model_class not in cascade_models:
+            cascade_models.add(model_class)
+            pending.extend(get_child_models(model_class))
+
+    ordered_models = []
+    remaining = sorted(cascade_models, key=lambda m: m._meta.label)
+    while remaining:
+        # Model is ready when no remaining model refers to it.
+        level = [
+            m for m in remaining
+            if not any(m in get_related_models(other) for other in remaining if other is not m)
+        ] or remaining
+        ordered_models.extend(level)
+        remaining = [m for m in remaining if m not in level]
+    return ordered_models
+
+
+def truncate_by_factories(generate_factories: List[DjangoModelFactory]) -> Dict[str, int]:
+    """
+    Remove all records of models of factories and of models referring to them
+    without loading records into memory and sending signals.
+    Uses TRUNCATE ... CASCADE on PostgreSQL and DELETE FROM in dependency order on other backends.
+    Return dict of {model label: quantity of removed records}.
+    :param generate_factories: List of factory classes.
+    """
+    models_by_database = {}
+    for factory_class in generate_factories:
+        models_by_database.setdefault(factory_class._meta.database, set()).add(factory_class._meta.model)
+
+    result = {}
+    for using, models in models_by_database.items():
+        connection = connections[using]
+        cascade_models = get_cascade_models(list(models))
+        for model_class in cascade_models:
+            count = model_class._default_manager.using(using).count()
+            if count > 0:
+                result[model_class._meta.label] = count
+
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                tables = ', '.join(quote_name(m._meta.db_table) for m in models)
+                cursor.execute(f'TRUNCATE {tables} CASCADE')
+            else:
+                for model_class in cascade_models:
+                    cursor.execute(f'DELETE FROM {quote_name(model_class._meta.db_table)}')
+    return result
@@ -2,22 +2,46 @@ from django.apps import apps as installed_apps
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.management.base import CommandError
+from django.utils.module_loading import module_has_submodule
 
 import configparser
 from factory.django import DjangoModelFactory
+from functools import lru_cache
 import importlib
 import logging
 import os
-import sys
 from typing import NamedTuple, List, Dict, Tuple
 
 from factory_generator import FACTORIES_MODULE_NAME
+from factory_generator import index as factories_index
+from factory_generator.bulk import DEFAULT_BATCH_SIZE
+from factory_generator.generators import DEFAULT_CHUNK_SIZE
+from factory_generator.writers import JSON
 
 
 logger = logging.getLogger(__name__)
 
 BASE_DIR = settings.BASE_DIR
 
+DELETE = 'delete'
+TRUNCATE = 'truncate'
+UPDATE_STRATEGIES = (DELETE, TRUNCATE)
+
+ALL_FACTORIES = '__all__'
+
+
+class FactoryQuantity(NamedTuple):
+    """
+    Quantity of records of one factory.
+    :attr quantity: Fixed quantity of records.
+    :attr per: Label of parent factory in form "app_label.FactoryName", quantity of records
+        is ratio multiplied by quantity of records of parent factory.
+    :attr ratio: Quantity of records per one record of parent factory.
+    """
+    quantity: int = None
+    per: str = None
+    ratio: float = None
+
 
 class Config(NamedTuple):
     """
@@ -26,11 +50,61 @@ class Config(NamedTuple):
     :attr quantity: Quantity of inctances of each factory which will be generate.
     :attr exclude: An app_label or app_label.FactoryName to exclude.
     :attr update: If specified, database will be rewrite. If not, new records will be added.
+    :attr bulk: If specified, records will be inserted with bulk_create.
+    :attr batch_size: Quantity of records inserted by one query in bulk mode.
+    :attr pools: Pools of parent records in form "app_label.FactoryName.field=size[:mode]".
+    :attr output: Path to file to write generated json incrementally, "-" means stdout.
+    :attr workers: Quantity of processes generating json in parallel.
+    :attr chunk_size: Quantity of records generated by worker process at once.
+    :attr commit_every: Quantity of records created in one transaction.
+    :attr checkpoint: Path to file where progress of generation is saved.
+    :attr update_strategy: How records are removed on update, delete or truncate.
+    :attr mute_signals: Labels of factories which records are created with muted model signals,
+        "__all__" means all factories.
+    :attr profile: If specified, stats of generating are collected and printed.
+    :attr profile_output: Path to file to write profiling stats.
+    :attr output_format: Format of generated json, "json" array or "jsonl" lines.
+    :attr shard_size: Maximum quantity of records in one output file.
+    :attr compression: Compression of output file, "gzip" or "zstd".
+    :attr loader: How records are inserted into database, "orm", "bulk" or "copy".
+    :attr file_pool: Quantity of generated payloads of every file declaration which are reused.
+    :attr batched: If specified, values of Faker and Sequence declarations are generated by chunks.
+    :attr seed: Seed of random state of factories, records are the same for the same seed.
+    :attr target: Target quantity of records of every model, only missing records are created.
+    :attr database: Alias of database where records are created instead of database of factories.
+    :attr connections: Quantity of database connections creating records concurrently.
+    :attr snapshot_dir: Path to directory where records of generated models are cached.
+    :attr factory_quantities: Dict of {"app_label.FactoryName": FactoryQuantity} which overrides
+        quantity for specified factories.
     """
     labels: List[str]
     quantity: int
     exclude: List[str]
     update: bool
+    bulk: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE
+    pools: List[str] = []
+    output: str = None
+    workers: int = 1
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    commit_every: int = None
+    checkpoint: str = None
+    update_strategy: str = DELETE
+    mute_signals: List[str] = []
+    profile: bool = False
+    profile_output: str = None
+    factory_quantities: Dict[str, FactoryQuantity] = {}
+    output_format: str = JSON
+    shard_size: int = None
+    compression: str = None
+    loader: str = None
+    file_pool: int = None
+    batched: bool = False
+    seed: int = None
+    target: int = None
+    database: str = None
+    connections: int = 1
+    snapshot_dir: str = None
 
 
 class FactoryNotFoundError(Exception):
@@ -41,6 +115,15 @@ def get_full_file_path(file_path: str) -> str:
     return os.path.join(BASE_DIR, file_path)
 
 
+def get_index_path() -> str:
+    """
+    Return full path to on-disk factories index specified by FACTORY_GENERATOR_INDEX_FILE setting
+    or None if index isnt used.
+    """
+    index_file = getattr(settings, 'FACTORY_GENERATOR_INDEX_FILE', None)
+    return get_full_file_path(index_file) if index_file else None
+
+
 def load_file_config(config_path: str) -> Config:
     """
     Return Config object.
@@ -62,22 +145,77 @@ def load_file_config(config_path: str) -> Config:
     except KeyError:
         exclude = []
 
+    try:
+        pools = config['factory_generator']['pools'].split(sep=',')
+    except KeyError:
+        pools = []
+
     quantity = int(config['factory_generator'].get('quantity', 1))
     update = bool(config['factory_generator'].getboolean('update'))
-    return Config(labels=labels, quantity=quantity, exclude=exclude, update=update)
-
+    bulk = bool(config['factory_generator'].getboolean('bulk'))
+    batch_size = int(config['factory_generator'].get('batch_size', DEFAULT_BATCH_SIZE))
+    output = config['factory_generator'].get('output')
+    workers = int(config['factory_generator'].get('workers', 1))
+    chunk_size = int(config['factory_generator'].get('chunk_size', DEFAULT_CHUNK_SIZE))
+    commit_every = config['factory_generator'].getint('commit_every')
+    checkpoint = config['factory_generator'].get('checkpoint')
+    update_strategy = config['factory_generator'].get('update_strategy', DELETE)
 
-def get_module(module_name: str, file_path: str):
+    try:
+        mute_signals = [ALL_FACTORIES] if config['factory_generator'].getboolean('mute_signals') else []
+    except ValueError:
+        mute_signals = [
+            label.strip() for label in config['factory_generator']['mute_signals'].split(sep=',')
+        ]
+
+    profile = bool(config['factory_generator'].getboolean('profile'))
+    profile_output = config['factory_generator'].get('profile_output')
+    output_format = config['factory_generator'].get('format', JSON)
+    shard_size = config['factory_generator'].getint('shard_size')
+    compression = config['factory_generator'].get('compression')
+    loader = config['factory_generator'].get('loader')
+    file_pool = config['factory_generator'].getint('file_pool')
+    batched = bool(config['factory_generator'].getboolean('batched'))
+    seed = config['factory_generator'].getint('seed')
+    target = config['factory_generator'].getint('target')
+    database = config['factory_generator'].get('database')
+    connections = int(config['factory_generator'].get('connections', 1))
+    snapshot_dir = config['factory_generator'].get('snapshot_dir')
+    factory_quantities = {
+        label: load_factory_quantity(config[label])
+        for label in config.sections() if label != 'factory_generator'
+    }
+
+    return Config(labels=labels, quantity=quantity, exclude=exclude, update=update,
+                  bulk=bulk, batch_size=batch_size, pools=pools, output=output,
+                  workers=workers, chunk_size=chunk_size, commit_every=commit_every,
+                  checkpoint=checkpoint, update_strategy=update_strategy, mute_signals=mute_signals,
+                  profile=profile, profile_output=profile_output, factory_quantities=factory_quantities,
+                  output_format=output_format, shard_size=shard_size, compression=compression,
+                  loader=loader, file_pool=file_pool, batched=batched, seed=seed, target=target,
+                  database=database, connections=connections, snapshot_dir=snapshot_dir)
+
+
+def load_factory_quantity(section: configparser.SectionProxy) -> FactoryQuantity:
     """
-    Import and return module.
-    :param module_name: Name of module.
-    :param file_path: Path to module file.
+    Return FactoryQuantity object from section of configuration file named by factory label,
+    which contains either quantity or both per and ratio options.
+    :param section: Section of configuration file.
+
+    Raise CommandError if options of section are inconsistent.
     """
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+    quantity = section.getint('quantity')
+    per = section.get('per')
+    ratio = section.getfloat('ratio')
+    if quantity is None and (per is None or ratio is None):
+        raise CommandError(f'Section [{section.name}] must contain either quantity or both per and ratio.')
+    if quantity is not None and (per is not None or ratio is not None):
+        raise CommandError(
+            f'Section [{section.name}] cannot contain quantity together with per and ratio.'
+        )
+    if quantity is not None and quantity < 0 or ratio is not None and ratio < 0:
+        raise CommandError(f'Quantity of section [{section.name}] must not be negative.')
+    return FactoryQuantity(quantity=quantity, per=per and per.strip(), ratio=ratio)
 
 
 def is_super(supercls, obj) -> bool:
@@ -93,6 +231,64 @@ def is_super(supercls, obj) -> bool:
         return False
 
 
+def get_factories_module(app_config: AppConfig):
+    """
+    Import factories module of app using import system, so module is executed only once.
+    Return None if app doesnt have factories module.
+    :param app_config: Django application config object.
+    """
+    if not module_has_submodule(app_config.module, FACTORIES_MODULE_NAME):
+        return None
+    return importlib.import_module(f'{app_config.name}.{FACTORIES_MODULE_NAME}')
+
+
+def scan_factories_module(app_config: AppConfig) -> Dict[str, DjangoModelFactory]:
+    """
+    Import factories module of app and return dict of {factory name: factory class}
+    of DjangoModelFactory subclasses in it.
+    :param app_config: Django application config object.
+    """
+    factory_module = get_factories_module(app_config)
+    if factory_module is None:
+        logger.debug(f'Factory module {app_config.name}.{FACTORIES_MODULE_NAME} not found.')
+        return {}
+    factories = {}
+    for obj_name in dir(factory_module):
+        obj = getattr(factory_module, obj_name)
+        if is_super(DjangoModelFactory, obj):
+            factories[obj_name] = obj
+    return factories
+
+
+@lru_cache(maxsize=None)
+def get_factories_index(app_config: AppConfig) -> Dict[str, DjangoModelFactory]:
+    """
+    Return dict of {factory name: factory class} of DjangoModelFactory subclasses in app factories module.
+    Index is built once for every app, use get_factories_index.cache_clear() to rebuild it.
+    If FACTORY_GENERATOR_INDEX_FILE setting is specified, index is also stored on disk,
+    so next runs import only modules where factories are defined without scanning them,
+    until factories module of app or source files of its factories are changed.
+    :param app_config: Django application config object.
+    """
+    index_path = get_index_path()
+    if not index_path:
+        return scan_factories_module(app_config)
+
+    entry = factories_index.get_app_entry(index_path, app_config)
+    if entry is not None:
+        try:
+            return {
+                name: factories_index.load_factory(factory_info)
+                for name, factory_info in entry['factories'].items()
+            }
+        except (ImportError, AttributeError):
+            logger.debug(f'Factories index of app {app_config.label} is outdated.')
+
+    factories = scan_factories_module(app_config)
+    factories_index.set_app_entry(index_path, app_config, factories)
+    return factories
+
+
 def get_app_factories(app_config: AppConfig, factories_names: List[str]=[]) -> List[DjangoModelFactory]:
     """
     Return list of instances of DjangoModelFactory in app.
@@ -101,23 +297,18 @@ def get_app_factories(app_config: AppConfig, factories_names: List[str]=[]) -> L
 
     Raise FactoryNotFoundError if factory module doesnt have specified factory.
     """
-    factories = set()
-    module_name = f'{app_config.name}.{FACTORIES_MODULE_NAME}'
-    file_path = os.path.join(app_config.path, f'{FACTORIES_MODULE_NAME}.py')
-    try:
-        factory_module = get_module(module_name, file_path)
-    except FileNotFoundError:
-        logger.debug(f'Factory module {module_name} not found.')
-        return list(factories)
-    module_objects = factories_names if factories_names else dir(factory_module)
-    for obj_name in module_objects:
-        try:
-            obj = getattr(factory_module, obj_name)
-        except AttributeError:
+    index = get_factories_index(app_config)
+    if not factories_names:
+        return list(index.values())
+
+    factories = []
+    for obj_name in factories_names:
+        if obj_name in index:
+            factories.append(index[obj_name])
+        elif not hasattr(get_factories_module(app_config), obj_name):
+            module_name = f'{app_config.name}.{FACTORIES_MODULE_NAME}'
             raise FactoryNotFoundError(f'Factory {obj_name} not found in module {module_name}.')
-        if is_super(DjangoModelFactory, obj):
-            factories.add(obj)
-    return list(factories)
+    return factories
 
 
 def get_all_factories() -> List[DjangoModelFactory]:
@@ -126,7 +317,7 @@ def get_all_factories() -> List[DjangoModelFactory]:
     """
     factories = set()
     for app_config in installed_apps.get_app_configs():
-        factories.update(get_app_factories(app_config))
+        factories.update(get_factories_index(app_config).values())
     return list(factories)
 
 
@@ -168,6 +359,16 @@ def parse_factories_from_labels(labels: List[str], exclude: List[str]=[]) -> Lis
     return list(factories)
 
 
+def get_factory_label(factory_class: DjangoModelFactory) -> str:
+    """
+    Return label of factory in form "app_label.FactoryName".
+    :param factory_class: Factory class.
+    """
+    app_config = installed_apps.get_containing_app_config(factory_class.__module__)
+    app_label = app_config.label if app_config else factory_class.__module__
+    return f'{app_label}.{factory_class.__name__}'
+
+
 def delete_by_factory(factory_class: DjangoModelFactory) -> Dict:
     """
     Delete all instances of model of DjangoModelFactory.
@@ -177,4 +378,4 @@ def delete_by_factory(factory_class: DjangoModelFactory) -> Dict:
         raise TypeError('Factory class must be subclass of factory.django.DjangoModelFactory')
     
     model_class = factory_class._meta.get_model_class()
-    return model_class.objects.all().delete()
\ No newline at end of file
+    return model_class._default_manager.using(factory_class._meta.database).all().delete()
\ No newline at end of file
@@ -0,0 +1,191 @@
+from django.core.management.base import CommandError
+
+import gzip
+import io
+import json
+import os
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+JSON = 'json'
+JSONL = 'jsonl'
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+COMPRESSIONS = (GZIP, ZSTD)
+COMPRESSION_EXTENSIONS = {GZIP: '.gz', ZSTD: '.zst'}
+
+
+class JsonArrayWriter:
+    """
+    Writes records into stream as json array one by one,
+    so the whole array is never kept in memory.
+    Output is the same as json.dumps of list of records.
+    :param stream: File-like object with write method.
+    :param cls: Json encoder class.
+    :param kwargs: Keyword arguments of json encoder.
+    """
+    def __init__(self, stream, cls=json.JSONEncoder, **kwargs):
+        self.stream = stream
+        self.encoder_kwargs = dict(kwargs, cls=cls)
+        self.encoder = cls(**kwargs)
+        self.count = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        self.stream.write('[')
+
+    def write(self, record):
+        self.write_encoded(self.encoder.encode(record))
+
+    def write_encoded(self, encoded_record: str):
+        """
+        Write record which is already encoded to json.
+        """
+        if self.count:
+            self.stream.write(self.encoder.item_separator)
+        self.stream.write(encoded_record)
+        self.count += 1
+
+    def close(self):
+        self.stream.write(']')
+
+
+class JsonLinesWriter(JsonArrayWriter):
+    """
+    Writes records into stream as json lines, one record per line.
+    Records are always encoded without indent, so every record takes exactly one line.
+    """
+    def __init__(self, stream, cls=json.JSONEncoder, **kwargs):
+        kwargs['indent'] = None
+        super().__init__(stream, cls=cls, **kwargs)
+
+    def open(self):
+        pass
+
+    def write_encoded(self, encoded_record: str):
+        self.stream.write(encoded_record)
+        self.stream.write('\n')
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+WRITERS = {
+    JSON: JsonArrayWriter,
+    JSONL: JsonLinesWriter,
+}
+
+
+def open_output(path: str, compression: str=None):
+    """
+    Open text file for writing, compressed with gzip or zstd if compression is specified.
+    Zstd compression requires zstandard package.
+    :param path: Path to file.
+    :param compression: "gzip", "zstd" or None.
+    """
+    if compression is None:
+        return open(path, 'w')
+    if compression == GZIP:
+        return gzip.open(path, 'wt')
+    if compression == ZSTD:
+        if zstandard is None:
+            raise CommandError('Install zstandard package to use zstd compression.')
+        return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(open(path, 'wb')))
+    raise CommandError(f'Unknown compression: {compression}')
+
+
+def get_shard_path(path: str, index: int) -> str:
+    """
+    Return path of shard with index, e.g. "data-00001.jsonl.gz" for "data.jsonl.gz".
+    :param path: Path to output file.
+    :param index: Index of shard.
+    """
+    root, ext = os.path.splitext(path)
+    if ext in COMPRESSION_EXTENSIONS.values():
+        root, data_ext = os.path.splitext(root)
+        ext = data_ext + ext
+    return f'{root}-{index:05d}{ext}'
+
+
+class ShardedWriter:
+    """
+    Writes records into files of at most shard_size records each,
+    so every file can be loaded or processed independently.
+    Every shard is written by writer of its own, e.g. json array or json lines.
+    :param path: Path to output file, index of shard is added to name of file.
+    :param writer_class: Class of writer of every shard.
+    :param shard_size: Maximum quantity of records in shard.
+    :param compression: "gzip", "zstd" or None.
+    :param cls: Json encoder class.
+    :param kwargs: Keyword arguments of json encoder.
+    :attr paths: Paths of written shards.
+    """
+    def __init__(self, path: str, writer_class=JsonArrayWriter, shard_size: int=1, compression: str=None,
+                 cls=json.JSONEncoder, **kwargs):
+        if shard_size < 1:
+            raise CommandError('Shard size must be positive.')
+        self.path = path
+        self.writer_class = writer_class
+        self.shard_size = shard_size
+        self.compression = compression
+        self.encoder_kwargs = dict(kwargs, cls=cls)
+        self.writer = None
+        self.paths = []
+        self.count = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Shards are opened when records are written to them.
+        """
+
+    def get_writer(self):
+        """
+        Return writer of current shard, open next shard if current one is full.
+        """
+        if self.writer is not None and self.writer.count >= self.shard_size:
+            self.close_shard()
+        if self.writer is None:
+            path = get_shard_path(self.path, len(self.paths))
+            self.writer = self.writer_class(open_output(path, self.compression), **self.encoder_kwargs)
+            self.writer.open()
+            self.paths.append(path)
+        return self.writer
+
+    def close_shard(self):
+        self.writer.close()
+        self.writer.stream.close()
+        self.writer = None
+
+    def write(self, record):
+        self.get_writer().write(record)
+        self.count += 1
+
+    def write_encoded(self, encoded_record: str):
+        self.get_writer().write_encoded(encoded_record)
+        self.count += 1
+
+    def close(self):
+        if not self.paths:
+            # Write empty shard, so output always exists.
+            self.get_writer()
+        if self.writer is not None:
+            self.close_shard()
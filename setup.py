@@ -22,6 +22,7 @@ REQUIRED = [
 # What packages are optional?
 EXTRAS = {
     'dev': ['django', 'pytest-django', 'pytest-pythonpath', 'tox'],
+    'zstd': ['zstandard'],
 }
 
 # The rest you shouldn't have to touch too much :)